@@ -9,9 +9,13 @@ from typing import Any, Set
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept per host; covers the GUI's parallel listing refreshes
+_POOL_MAXSIZE = 10
+
 
 class SDWebUIClient:
     """Client for interacting with Stable Diffusion WebUI API"""
@@ -43,6 +47,20 @@ class SDWebUIClient:
         self.max_backoff = max(0.0, max_backoff)
         self.jitter = max(0.0, jitter)
         self._option_keys: Set[str] | None = None
+        # One keep-alive session for every call, so connections are reused between requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=_POOL_MAXSIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session used by this client (shareable with other WebUI calls)."""
+        return self._session
+
+    def close(self) -> None:
+        """Release network resources held by the client (safe to call repeatedly)."""
+        self._session.close()
 
     def _sleep(self, duration: float) -> None:
         """Sleep helper that can be overridden in tests."""
@@ -85,7 +103,7 @@ class SDWebUIClient:
 
         for attempt in range(retries):
             try:
-                response = requests.request(
+                response = self._session.request(
                     method.upper(), url, timeout=timeout_value, **kwargs
                 )
                 response.raise_for_status()
@@ -2,6 +2,7 @@
 Advanced Prompt Pack Editor with validation, embedding/LoRA discovery, and smart features
 """
 
+import logging
 import os
 import re
 from pathlib import Path
@@ -10,16 +11,29 @@ from tkinter import filedialog, messagebox, scrolledtext, ttk
 
 from .tooltip import Tooltip
 from ..utils.config import DEFAULT_GLOBAL_NEGATIVE_PROMPT
+from ..utils.file_io import PACKS_DIR
+
+logger = logging.getLogger(__name__)
 
 
 class AdvancedPromptEditor:
     """Advanced prompt pack editor with comprehensive validation and smart features"""
 
-    def __init__(self, parent_window, config_manager, on_packs_changed=None, on_validation=None):
+    def __init__(
+        self,
+        parent_window,
+        config_manager,
+        on_packs_changed=None,
+        on_validation=None,
+        validation_executor=None,
+    ):
         self.parent = parent_window
         self.config_manager = config_manager
         self.on_packs_changed = on_packs_changed
         self.on_validation = on_validation  # Callback for validation results
+        # Optional executor for _validate_content; results are applied back on the Tk thread.
+        # Without one, validation runs synchronously.
+        self.validation_executor = validation_executor
         self.window = None
         self.current_pack_path = None
         self.is_modified = False
@@ -923,7 +937,7 @@ neg: malformed, bad anatomy, low quality"""
         # Determine proposed filename
         base_name = self.pack_name_var.get().strip() or "new_pack"
         ext = (self.format_var.get() or "txt").lower()
-        initial = str(Path("packs") / f"{base_name}.{ext}")
+        initial = str(PACKS_DIR / f"{base_name}.{ext}")
 
         file_path = filedialog.asksaveasfilename(
             title="Save Prompt Pack As",
@@ -1027,7 +1041,7 @@ neg: malformed, bad anatomy, low quality"""
         # Find available name within packs directory
         ext = (self.format_var.get() or (self.current_pack_path.suffix[1:] if self.current_pack_path else "txt")).lower()
         counter = 1
-        while (Path("packs") / f"{clone_name}.{ext}").exists():
+        while (PACKS_DIR / f"{clone_name}.{ext}").exists():
             clone_name = f"{original_name}_copy_{counter}"
             counter += 1
 
@@ -1066,10 +1080,10 @@ neg: malformed, bad anatomy, low quality"""
                 messagebox.showerror("Error", f"Failed to delete pack: {e}")
 
     def _validate_pack(self):
-        """Validate the current pack and show results"""
-        content = self.prompts_text.get("1.0", tk.END).strip()
-        results = self._validate_content(content)
+        """Validate the current pack and show results (None when validated in the background)"""
+        return self._run_validation(self._show_validation_results)
 
+    def _show_validation_results(self, results: dict):
         # Switch to validation tab
         self.notebook.select(2)  # Validation tab
 
@@ -1080,20 +1094,46 @@ neg: malformed, bad anatomy, low quality"""
         if self.on_validation:
             self.on_validation(results)
 
-        return results
-
     def _validate_pack_silent(self):
         """Validate pack without switching tabs"""
+        return self._run_validation(self._update_status_from_validation)
+
+    def _run_validation(self, apply_results):
+        """Validate the editor content and pass the results to ``apply_results``.
+
+        The text and format are read here, on the Tk thread. With a validation_executor,
+        the parsing runs on a worker and ``apply_results`` is scheduled back onto the
+        editor window; otherwise everything happens inline and the results are returned.
+        """
         content = self.prompts_text.get("1.0", tk.END).strip()
-        results = self._validate_content(content)
+        is_tsv = self.format_var.get() == "tsv"
+        if self.validation_executor is None:
+            results = self._validate_content(content, is_tsv)
+            apply_results(results)
+            return results
 
-        # Update status and stats
-        self._update_status_from_validation(results)
+        def deliver(future):
+            try:
+                results = future.result()
+            except Exception as exc:
+                logger.error(f"Pack validation failed: {exc}")
+                return
+            try:
+                self.window.after(0, apply_results, results)
+            except Exception:
+                # Editor window closed before validation finished
+                pass
 
-        return results
+        self.validation_executor.submit(self._validate_content, content, is_tsv).add_done_callback(
+            deliver
+        )
+        return None
+
+    def _validate_content(self, content: str, is_tsv: bool | None = None) -> dict:
+        """Validate pack content and return comprehensive results
 
-    def _validate_content(self, content: str) -> dict:
-        """Validate pack content and return comprehensive results"""
+        Reads no Tk state when ``is_tsv`` is given, so it may run on a worker thread.
+        """
         results = {
             "errors": [],
             "warnings": [],
@@ -1112,7 +1152,8 @@ neg: malformed, bad anatomy, low quality"""
             return results
 
         # Determine format and validate accordingly
-        is_tsv = self.format_var.get() == "tsv"
+        if is_tsv is None:
+            is_tsv = self.format_var.get() == "tsv"
 
         if is_tsv:
             self._validate_tsv_content(content, results)
@@ -11,6 +11,7 @@ from tkinter import ttk
 from typing import Any, Iterable
 
 from .adetailer_config_panel import ADetailerConfigPanel
+from .scrolling import schedule_scrollregion
 
 logger = logging.getLogger(__name__)
 
@@ -157,7 +158,7 @@ class ConfigPanel(ttk.Frame):
         scrollable_frame = ttk.Frame(canvas, style="Dark.TFrame")
 
         scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            "<Configure>", lambda e, c=canvas: schedule_scrollregion(c)
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -553,7 +554,7 @@ class ConfigPanel(ttk.Frame):
         canvas.configure(yscrollcommand=scrollbar.set)
 
         scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            "<Configure>", lambda e, c=canvas: schedule_scrollregion(c)
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
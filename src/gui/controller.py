@@ -70,6 +70,7 @@ class PipelineController:
         self._progress_callback: Callable[[float], None] | None = None
         self._eta_callback: Callable[[str], None] | None = None
         self._status_callback: Callable[[str], None] | None = None
+        self._log_callback: Callable[[], None] | None = None
         self._last_progress: dict[str, Any] = {
             "stage": "Idle",
             "percent": 0.0,
@@ -228,6 +229,11 @@ class PipelineController:
         with self._progress_lock:
             self._status_callback = callback
 
+    def set_log_callback(self, callback: Callable[[], None] | None) -> None:
+        """Register callback invoked (from the logging thread) after a message is queued."""
+        with self._progress_lock:
+            self._log_callback = callback
+
     def report_progress(self, stage: str, percent: float, eta: str | None) -> None:
         """Report progress to registered callbacks in a thread-safe manner."""
 
@@ -296,8 +302,14 @@ class PipelineController:
             self._current_subprocess = None
 
     def _log(self, message: str, level: str = "INFO") -> None:
-        """Add message to log queue."""
+        """Add message to log queue and notify the registered consumer."""
         self.log_queue.put(LogMessage(message, level))
+        callback = self._log_callback
+        if callback is not None:
+            try:
+                callback()
+            except Exception:
+                logger.debug("Log callback failed", exc_info=True)
 
     def get_log_messages(self) -> list[LogMessage]:
         """Get all pending log messages."""
@@ -6,7 +6,9 @@ This panel provides a scrolling log view with thread-safe logging handler integr
 
 import logging
 import queue
+import threading
 import tkinter as tk
+from collections import deque
 from tkinter import scrolledtext, ttk
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,26 @@ LEVEL_STYLES: dict[str, str] = {
 LEVEL_ORDER: tuple[str, ...] = tuple(LEVEL_STYLES.keys())
 DEFAULT_LEVEL = "INFO"
 
+# Interval of the Tk-side poll that drains messages logged from worker threads (~30 Hz),
+# used only while messages keep arriving
+_DRAIN_INTERVAL_MS = 33
+# Poll interval once the queue is empty, so an idle panel wakes Tk a few times a second
+_IDLE_POLL_MS = 250
+# Most messages written per drain; the rest wait for the next tick so the UI stays responsive
+_MAX_DRAIN_BATCH = 500
+
+
+def _insert_segments(entries) -> list[str]:
+    """Flatten ``(message, level)`` pairs into Text.insert's ``chars tags chars tags ...`` form.
+
+    Passing them all to one insert call writes a whole batch in a single Tcl command.
+    """
+    segments: list[str] = []
+    for message, level in entries:
+        segments.append(f"{message}\n")
+        segments.append(level)
+    return segments
+
 
 class LogPanel(ttk.Frame):
     """
@@ -55,10 +77,13 @@ class LogPanel(ttk.Frame):
         # Message queue for thread-safe logging
         self.log_queue: queue.Queue[tuple[str, str]] = queue.Queue()
 
-        # Buffer to support filtering and clipboard operations
-        self.log_records: list[tuple[str, str]] = []
+        # Buffer to support filtering and clipboard operations; the oldest records fall off
         self.max_log_lines = 1000
+        self.log_records: deque[tuple[str, str]] = deque(maxlen=self.max_log_lines)
         self._line_count = 0
+        # Lines collected while draining the queue, written to the widget in one pass
+        self._pending_inserts: list[tuple[str, str]] | None = None
+        self._drain_scheduled = False
 
         # Scroll and filter state
         self.scroll_lock_var = tk.BooleanVar(master=self, value=False)
@@ -130,12 +155,19 @@ class LogPanel(ttk.Frame):
             message: Log message text
             level: Log level (INFO, WARNING, ERROR, SUCCESS, DEBUG)
         """
-        # Add to queue for processing on main thread
+        # Add to queue for processing on main thread; one drain serves a whole burst
         self.log_queue.put((message, level))
+        if threading.current_thread() is not threading.main_thread():
+            # No Tcl calls from workers: the periodic _process_queue tick drains the queue
+            return
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
         try:
-            self.after(0, self._process_queue)
+            self.after(0, self._drain_queue)
         except Exception:
-            pass
+            # The periodic _process_queue poll picks the message up instead
+            self._drain_scheduled = False
 
     def append(self, message: str, level: str = "INFO") -> None:
         """
@@ -151,20 +183,32 @@ class LogPanel(ttk.Frame):
 
     def _process_queue(self):
         """Process pending log messages from queue."""
-        # Process all pending messages
-        while not self.log_queue.empty():
-            try:
-                message, level = self.log_queue.get_nowait()
-                try:
-                    self._add_log_message(message, level)
-                except Exception:
-                    # Ignore UI errors (widget may be destroyed during teardown)
-                    pass
-            except queue.Empty:
-                break
+        busy = not self.log_queue.empty()
+        self._drain_queue()
+
+        # Poll fast only while messages are arriving; fall back to the idle interval
+        self.after(_DRAIN_INTERVAL_MS if busy else _IDLE_POLL_MS, self._process_queue)
 
-        # Schedule next processing
-        self.after(100, self._process_queue)
+    def _drain_queue(self) -> None:
+        """Process up to _MAX_DRAIN_BATCH queued messages, writing their lines in one batch."""
+        # Cleared first so a message queued meanwhile schedules another drain
+        self._drain_scheduled = False
+        pending = self._pending_inserts = []
+        try:
+            for _ in range(_MAX_DRAIN_BATCH):
+                try:
+                    message, level = self.log_queue.get_nowait()
+                    try:
+                        self._add_log_message(message, level)
+                    except Exception:
+                        # Ignore UI errors (widget may be destroyed during teardown)
+                        pass
+                except queue.Empty:
+                    break
+        finally:
+            self._pending_inserts = None
+        if pending:
+            self._insert_messages(pending)
 
     # Test/utility: process queued log messages synchronously (no scheduling)
     def _flush_queue_sync(self) -> None:
@@ -193,28 +237,29 @@ class LogPanel(ttk.Frame):
 
         self.log_records.append((message, normalized_level))
 
-        if len(self.log_records) > self.max_log_lines:
-            # Only trim and refresh when the log first exceeds the limit
-            self.log_records = self.log_records[-self.max_log_lines :]
-            self._refresh_display()
-            return
-        elif len(self.log_records) == self.max_log_lines:
-            # Already at limit, pop oldest and insert efficiently
-            self.log_records.pop(0)
-            self.log_records.append((message, normalized_level))
-            if self._should_display(normalized_level):
-                self._insert_message(message, normalized_level)
-            return
-
         if self._should_display(normalized_level):
             self._insert_message(message, normalized_level)
 
     def _insert_message(self, message: str, level: str) -> None:
+        if self._pending_inserts is not None:
+            # Draining a burst: written together by _drain_queue
+            self._pending_inserts.append((message, level))
+            return
+        self._insert_messages(((message, level),))
+
+    def _insert_messages(self, entries) -> None:
+        """Insert ``(message, level)`` lines with one state toggle and scroll."""
         preserve_pos = bool(self.scroll_lock_var.get())
         try:
             top_before = self.log_text.yview()[0] if preserve_pos else None
             self.log_text.configure(state=tk.NORMAL)
-            self.log_text.insert(tk.END, f"{message}\n", level)
+            self.log_text.insert(tk.END, *_insert_segments(entries))
+            # Ring-buffer trim: drop the oldest lines past the cap instead of rebuilding
+            # the widget; it ends with an empty line after the last newline
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            if line_count > self.max_log_lines:
+                self.log_text.delete("1.0", f"{line_count - self.max_log_lines + 1}.0")
+                line_count = self.max_log_lines
             if not self.scroll_lock_var.get():
                 self.log_text.see(tk.END)
             elif top_before is not None:
@@ -226,24 +271,29 @@ class LogPanel(ttk.Frame):
         except Exception:
             # Widget likely destroyed; safely ignore
             return
-        if self._should_display(level) and self._line_count < self.max_log_lines:
-            self._line_count += 1
+        self._line_count = line_count
 
     def _should_display(self, level: str) -> bool:
         var = self.level_filter_vars.get(level)
         return True if var is None else bool(var.get())
 
     def _refresh_display(self) -> None:
+        if self._pending_inserts:
+            # The rebuild below already renders these records
+            self._pending_inserts.clear()
         preserve_pos = bool(self.scroll_lock_var.get())
         try:
             top_before = self.log_text.yview()[0] if preserve_pos else None
             self.log_text.configure(state=tk.NORMAL)
             self.log_text.delete("1.0", tk.END)
-            visible_count = 0
-            for message, level in self.log_records:
-                if self._should_display(level):
-                    self.log_text.insert(tk.END, f"{message}\n", level)
-                    visible_count += 1
+            visible = [
+                (message, level)
+                for message, level in self.log_records
+                if self._should_display(level)
+            ]
+            visible_count = len(visible)
+            if visible:
+                self.log_text.insert(tk.END, *_insert_segments(visible))
             if not self.scroll_lock_var.get():
                 self.log_text.see(tk.END)
             elif preserve_pos and top_before is not None:
@@ -1,17 +1,24 @@
 """Modern Tkinter GUI for Stable Diffusion pipeline with dark theme"""
 
+import _tkinter
 import json
 import logging
 import os
+import queue
+import secrets
 import subprocess
 import sys
 import threading
 import time
 import tkinter as tk
-import tkinter.simpledialog
+import weakref
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
-from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk
 from typing import Any
 
 from ..api import SDWebUIClient
@@ -19,7 +26,7 @@ from ..pipeline import Pipeline, VideoCreator
 from ..pipeline.variant_planner import apply_variant_to_config, build_variant_plan
 from ..utils import ConfigManager, PreferencesManager, StructuredLogger, setup_logging
 from ..utils.aesthetic import detect_aesthetic_extension
-from ..utils.file_io import get_prompt_packs, read_prompt_pack
+from ..utils.file_io import PACKS_DIR, get_prompt_packs, read_prompt_pack
 from ..utils.randomizer import PromptRandomizer, PromptVariant
 from ..utils.webui_discovery import find_webui_api_port, launch_webui_safely, validate_webui_health
 from .advanced_prompt_editor import AdvancedPromptEditor
@@ -31,13 +38,266 @@ from .log_panel import LogPanel, TkinterLogHandler
 from .pipeline_controls_panel import PipelineControlsPanel
 from .prompt_pack_list_manager import PromptPackListManager
 from .prompt_pack_panel import PromptPackPanel
+from .scrolling import schedule_scrollregion
 from .state import CancellationError, GUIState, StateManager
 from .tooltip import Tooltip
 
 logger = logging.getLogger(__name__)
 
+# Foreground colors for the save indicators keyed by lower-cased status text
+_STATUS_COLORS = {"saved": "#00c853", "warning": "#ffa500"}
+
+# Readiness polling before a full API connection check: first probe after 50 ms,
+# doubling up to this cap, giving up (and running the full check anyway) after the timeout
+_API_CHECK_MAX_DELAY_MS = 2000
+_API_CHECK_TIMEOUT_MS = 30000
+# Model, VAE, hypernetwork, upscaler and scheduler listings are fetched in parallel
+_API_REFRESH_WORKERS = 5
+# WebUI health results are reused for this long; failed checks only briefly
+_HEALTH_CACHE_TTL_S = 30.0
+_HEALTH_NEGATIVE_TTL_S = 2.0
+# A failed Connect for a URL is answered from memory for this long instead of re-probing
+_CONNECT_FAIL_CACHE_S = 5.0
+# Idle poll interval of _tkinter's busy-wait loop (non-threaded Tcl builds only; default 20).
+# Only non-Tk wake-ups (e.g. Ctrl+C) can be delayed by up to this long; Tk events are not.
+_BUSYWAIT_INTERVAL_MS = 100
+
+# Dark theme palette and the ttk style tables applied by _install_dark_theme_once
+_DARK_BG = "#2b2b2b"
+_DARK_FG = "#ffffff"
+_DARK_BUTTON_BG = "#404040"
+_DARK_BUTTON_ACTIVE = "#505050"
+_DARK_ENTRY_BG = "#3d3d3d"
+_ACCENT = "#0078d4"
+_DANGER = "#dc3545"
+_UI_FONT = ("Segoe UI", 9)
+_UI_FONT_BOLD = ("Segoe UI", 9, "bold")
+
+_DARK_STYLE_CONFIGS: dict[str, dict[str, Any]] = {
+    "Dark.TFrame": {"background": _DARK_BG, "borderwidth": 1, "relief": "flat"},
+    "Dark.TLabel": {"background": _DARK_BG, "foreground": _DARK_FG, "font": _UI_FONT},
+    "Dark.TButton": {
+        "background": _DARK_BUTTON_BG,
+        "foreground": _DARK_FG,
+        "borderwidth": 1,
+        "focuscolor": "none",
+        "font": _UI_FONT,
+    },
+    "Dark.TEntry": {
+        "background": _DARK_ENTRY_BG,
+        "foreground": _DARK_FG,
+        "borderwidth": 1,
+        "insertcolor": _DARK_FG,
+        "font": _UI_FONT,
+    },
+    "Dark.TSpinbox": {
+        "background": _DARK_ENTRY_BG,
+        "foreground": _DARK_FG,
+        "fieldbackground": _DARK_ENTRY_BG,
+        "borderwidth": 1,
+        "insertcolor": _DARK_FG,
+        "font": _UI_FONT,
+    },
+    # Fix Combobox dropdown styling
+    "Dark.TCombobox": {
+        "background": _DARK_ENTRY_BG,
+        "foreground": _DARK_FG,
+        "fieldbackground": _DARK_ENTRY_BG,
+        "selectbackground": _ACCENT,
+        "selectforeground": _DARK_FG,
+        "borderwidth": 1,
+        "insertcolor": _DARK_FG,
+        "font": _UI_FONT,
+    },
+    "Dark.TCheckbutton": {
+        "background": _DARK_BG,
+        "foreground": _DARK_FG,
+        "focuscolor": "none",
+        "font": _UI_FONT,
+    },
+    "Dark.TRadiobutton": {
+        "background": _DARK_BG,
+        "foreground": _DARK_FG,
+        "focuscolor": "none",
+        "font": _UI_FONT,
+    },
+    "Dark.TNotebook": {"background": _DARK_BG, "borderwidth": 0},
+    "Dark.TNotebook.Tab": {
+        "background": _DARK_BUTTON_BG,
+        "foreground": _DARK_FG,
+        "padding": [20, 8],
+        "borderwidth": 0,
+    },
+    # Accent button styles for CTAs
+    "Accent.TButton": {
+        "background": _ACCENT,
+        "foreground": _DARK_FG,
+        "borderwidth": 1,
+        "focuscolor": "none",
+        "font": _UI_FONT_BOLD,
+    },
+    "Danger.TButton": {
+        "background": _DANGER,
+        "foreground": _DARK_FG,
+        "borderwidth": 1,
+        "focuscolor": "none",
+        "font": _UI_FONT_BOLD,
+    },
+}
+
+_DARK_STYLE_MAPS: dict[str, dict[str, Any]] = {
+    "Dark.TButton": {
+        "background": [("active", _DARK_BUTTON_ACTIVE), ("pressed", _ACCENT)],
+        "foreground": [("active", _DARK_FG)],
+    },
+    "Dark.TCombobox": {
+        "fieldbackground": [("readonly", _DARK_ENTRY_BG)],
+        "selectbackground": [("readonly", _ACCENT)],
+    },
+    "Accent.TButton": {
+        "background": [("active", "#106ebe"), ("pressed", "#005a9e")],
+        "foreground": [("active", _DARK_FG)],
+    },
+    "Danger.TButton": {
+        "background": [("active", "#c82333"), ("pressed", "#bd2130")],
+        "foreground": [("active", _DARK_FG)],
+    },
+    "Dark.TNotebook.Tab": {"background": [("selected", _ACCENT), ("active", _DARK_BUTTON_ACTIVE)]},
+}
+
+
+def _var_value(vars_dict: dict, key: str, default: Any) -> Any:
+    """Return ``vars_dict[key].get()``, or ``default`` when the form has no such variable.
+
+    Avoids ``vars_dict.get(key, tk.BooleanVar()).get()``, which creates (and registers
+    with Tcl) a throwaway variable on every call.
+    """
+    var = vars_dict.get(key)
+    return default if var is None else var.get()
+
+
+def _form_values(vars_dict: dict) -> tuple[dict[str, Any], list[str]]:
+    """Coerce every form variable once; return the values and the keys that failed.
+
+    Spinboxes do not validate per keystroke, so an ``IntVar``/``DoubleVar`` may hold
+    e.g. ``"12a"``; such keys are left out (keeping the panel value) and reported.
+    """
+    values = {}
+    skipped = []
+    for key, var in vars_dict.items():
+        try:
+            values[key] = var.get()
+        except (tk.TclError, ValueError):
+            skipped.append(key)
+    return values, skipped
+
+
+def _listbox_items(listbox, indices) -> list[str]:
+    """Return the entries at ``indices`` (ascending, as from curselection) with one ranged get."""
+    if not indices:
+        return []
+    first = indices[0]
+    span = listbox.get(first, indices[-1])
+    return [span[index - first] for index in indices]
+
+
+def _install_dark_theme_once(root: tk.Misc) -> None:
+    """Register the dark ttk styles in ``root``'s Tcl interpreter unless already present."""
+    style = ttk.Style(root)
+    # ttk styles belong to a Tcl interpreter, not the process, so the "once" guard asks
+    # the interpreter itself: later windows on the same root skip every configure/map
+    # call, while a fresh Tk() still gets themed. Danger.TButton is only configured here,
+    # unlike the Dark.* styles other dialogs also touch.
+    if style.lookup("Danger.TButton", "background") == _DANGER:
+        return
+
+    style.theme_use("clam")
+    for name, cfg in _DARK_STYLE_CONFIGS.items():
+        style.configure(name, **cfg)
+    # Map states
+    for name, cfg in _DARK_STYLE_MAPS.items():
+        style.map(name, **cfg)
+
+
+class _DaemonPool:
+    """Bounded worker pool on daemon threads, with ``ThreadPoolExecutor``'s submit/shutdown.
+
+    ``ThreadPoolExecutor`` joins its workers at interpreter exit, so closing the window
+    mid-generation would wait for the run to finish; these workers die with the process.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self._max_workers = max_workers
+        self._name = thread_name_prefix
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((future, fn))
+            if len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._work, name=f"{self._name}_{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn()
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
 
 class StableNewGUI:
+    # Levels log_message emits; assign a narrower set on an instance to filter at runtime.
+    # Callers that build costly messages check _log_enabled first.
+    _log_enabled_levels: frozenset[str] | set[str] = frozenset(
+        {"DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR"}
+    )
+    # Prompt pack directory and (mtime_ns, file names) from its last scan
+    _packs_dir = PACKS_DIR
+    _pack_names_cache: tuple[int, frozenset[str]] | None = None
+    # State indicator (color, text) per GUI state
+    _STATE_COLORS: dict[GUIState, tuple[str, str]] = {
+        GUIState.IDLE: ("#4CAF50", "● Idle"),
+        GUIState.RUNNING: ("#2196F3", "● Running"),
+        GUIState.STOPPING: ("#FF9800", "● Stopping"),
+        GUIState.ERROR: ("#f44336", "● Error"),
+    }
+
     def force_reset(self):
         """Force a full GUI and state reset after a crash or error."""
         logger.info("[DIAG] StableNewGUI.force_reset: starting reset", extra={"flush": True})
@@ -52,7 +312,7 @@ class StableNewGUI:
         except Exception as exc:
             logger.error(f"[DIAG] StableNewGUI.force_reset: error recreating PromptPackPanel: {exc}", exc_info=True, extra={"flush": True})
         # Reset other internal state as needed (add more panels if required)
-        self._error_dialog_shown = False
+        self._error_dialog_shown.clear()
         # Optionally, reset controller, config, etc. if needed
         logger.info("[DIAG] StableNewGUI.force_reset: reset complete", extra={"flush": True})
     """Main GUI application with modern dark theme"""
@@ -76,14 +336,9 @@ class StableNewGUI:
         # Widen default window to take advantage of horizontal space for wider dropdowns
         self.root.geometry("1550x1020+60+40")
         self.root.configure(bg="#2b2b2b")
-
-        # Ensure window is visible and on top
-        self.root.lift()
-        self.root.attributes("-topmost", True)
-        self.root.after_idle(lambda: self.root.attributes("-topmost", False))
-
-        # Prevent window from being minimized or hidden
-        self.root.state("normal")
+        # Keep the window unmapped while the widget tree is built; it is shown once, with
+        # its final layout, after _build_ui (see below)
+        self.root.withdraw()
 
         # Initialize components
         self.config_manager = ConfigManager()
@@ -94,8 +349,10 @@ class StableNewGUI:
         self.structured_logger = StructuredLogger()
         self.client = None
         self.pipeline = None
-        self.video_creator = VideoCreator()
-        self.available_hypernetworks: list[str] = ["None"]
+        self._init_async_state()
+        # Built on first use: VideoCreator() probes ffmpeg in a subprocess
+        self.video_creator: VideoCreator | None = None
+        self.available_hypernetworks: tuple[str, ...] = ("None",)
 
         # Initialize state management and controller
         self.state_manager = StateManager()
@@ -170,10 +427,16 @@ class StableNewGUI:
         self.current_config = None
         self.api_connected = False
         self._last_selected_pack = None
+        self._pack_index: dict[str, int] = {}
         self.current_preset = self.preferences.get("preset", "default")
+        # Preset names from the last directory scan; None until first use or after a save/delete
+        self._presets_cache: tuple[str, ...] | None = None
         self._refreshing_config = False  # Flag to prevent recursive refreshes
-        # Error dialog control for tests
-        self._error_dialog_shown = False
+        # Hashes of the last config pushed into the forms (see _load_config_into_forms)
+        self._last_loaded_config_hash: int | None = None
+        # Set once a pipeline error dialog has been shown; claimed via _try_claim_error_dialog
+        self._error_dialog_shown = threading.Event()
+        self._error_dialog_lock = threading.Lock()
         self._force_error_status = False
 
         # Initialize GUI variables early
@@ -181,6 +444,17 @@ class StableNewGUI:
             value=api_preferences.get("base_url", "http://127.0.0.1:7860")
         )
         self.preset_var = tk.StringVar(value=self.current_preset)
+        # Coalesced "Preset selected" logging (see _on_preset_changed)
+        self._preset_log_after_id = None
+        # Pending trailing-edge preset load (see _debounce_preset_change)
+        self._preset_debounce_id = None
+        # Pending trailing-edge config refresh after pack selection (see _debounce_pack_selection)
+        self._pack_sel_after_id = None
+        # curselection() seen by the last _on_pack_selection_changed call
+        self._last_cursel: tuple[int, ...] = ()
+        # Form vars changed since the live summaries were last rebuilt (see _mark_config_dirty)
+        self._config_dirty = False
+        self._last_logged_preset: str | None = None
 
         # Initialize other GUI variables that are used before UI building
         self.txt2img_enabled = tk.BooleanVar(value=True)
@@ -188,10 +462,8 @@ class StableNewGUI:
         self.adetailer_enabled = tk.BooleanVar(value=False)
         self.upscale_enabled = tk.BooleanVar(value=True)
         self.video_enabled = tk.BooleanVar(value=False)
-        self.loop_type_var = tk.StringVar(value="single")
-        self.loop_count_var = tk.StringVar(value="1")
-        self.pack_mode_var = tk.StringVar(value="selected")
-        self.images_per_prompt_var = tk.StringVar(value="1")
+        # loop_type_var, loop_count_var, pack_mode_var and images_per_prompt_var are
+        # PipelineControlsPanel's own variables, bound in _build_pipeline_controls_panel
         # Override: apply current GUI config to all selected packs when enabled
         self.override_pack_var = tk.BooleanVar(value=False)
         # Randomization & Aesthetic controls (populated when tab builds)
@@ -214,9 +486,9 @@ class StableNewGUI:
         self._progress_idle_message = "Ready for next run"
 
         # Initialize metadata attributes early to avoid NameErrors
-        self.schedulers = []
-        self.upscaler_names = []
-        self.vae_names = []
+        self.schedulers: tuple[str, ...] = ()
+        self.upscaler_names: tuple[str, ...] = ()
+        self.vae_names: tuple[str, ...] = ()
 
         # Initialize log panel early (before any log calls) to avoid AttributeError
 
@@ -224,9 +496,43 @@ class StableNewGUI:
         self.log_panel = None
         self.add_log = None
         self.log_text = None
+        # Widgets and form-variable dicts built later by the tab/panel builders;
+        # None until then so callers can test "is not None" instead of hasattr
+        self.txt2img_vars: dict | None = None
+        self.img2img_vars: dict | None = None
+        self.upscale_vars: dict | None = None
+        self.api_vars: dict | None = None
+        self.pos_text = None
+        self.neg_text = None
+        self.config_status_label = None
+        self.current_pack_label = None
+        # (read_fd, write_fd) of the controller-log wake pipe (see _open_log_wake_pipe)
+        self._log_wake_fds: tuple[int, int] | None = None
+        # Held across a wake write and the close, so a worker never writes to a closed
+        # (and possibly reused) descriptor number
+        self._log_wake_lock = threading.Lock()
+
+        # Optional panels are created by _build_ui; null-initialize so the cached
+        # availability flags below are the only check hot paths need.
+        self.adetailer_panel = None
+        self.pipeline_controls_panel = None
+        self.top_save_indicator = None
+        self.top_save_indicator_var = None
+        # Legacy per-tab combos refreshed from the API; None until their tab is built
+        self.model_combo = None
+        self.vae_combo = None
+        self.upscaler_combo = None
+        self.scheduler_combo = None
+        self.img2img_model_combo = None
+        self.img2img_vae_combo = None
+        self.img2img_scheduler_combo = None
+        # Created on first use (see _open_prompt_editor / _build_bottom_panel)
+        self.advanced_editor: AdvancedPromptEditor | None = None
+        self.gui_log_handler: TkinterLogHandler | None = None
 
         # Apply dark theme
-        self._setup_dark_theme()
+        self.root.configure(bg=_DARK_BG)
+        _install_dark_theme_once(self.root)
 
         # Load or create default preset
         self._ensure_default_preset()
@@ -234,6 +540,17 @@ class StableNewGUI:
         # Build UI
         self._build_ui()
         _diag("UI built")
+        # One geometry pass for the whole tree, then map the window with its final layout
+        self.root.update_idletasks()
+
+        # Ensure window is visible and in front (no -topmost on/off toggle)
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+
+        # Prevent window from being minimized or hidden
+        self.root.state("normal")
+        self._cache_widget_flags()
 
         # Apply saved preferences after UI construction
         def _apply_prefs_task():
@@ -256,143 +573,16 @@ class StableNewGUI:
                 pass
         self.root.after(6000, _startup_watchdog)
 
-        # Auto-launch WebUI after the window is built to avoid blocking init
+        # Auto-launch WebUI once the window has had a chance to paint; probing runs on a
+        # worker thread (see _launch_webui)
         try:
-            self.root.after(0, self._launch_webui)
+            self.root.after(50, self._launch_webui)
         except Exception:
             pass
 
         # Setup logging redirect
         setup_logging("INFO")
 
-    def _setup_dark_theme(self):
-        """Setup dark theme for the application"""
-        style = ttk.Style()
-
-        # Configure dark theme colors
-        bg_color = "#2b2b2b"
-        fg_color = "#ffffff"
-        button_bg = "#404040"
-        button_active = "#505050"
-        entry_bg = "#3d3d3d"
-
-        self.root.configure(bg=bg_color)
-
-        # Configure ttk styles
-        style.theme_use("clam")
-
-        style.configure("Dark.TFrame", background=bg_color, borderwidth=1, relief="flat")
-        style.configure(
-            "Dark.TLabel", background=bg_color, foreground=fg_color, font=("Segoe UI", 9)
-        )
-        style.configure(
-            "Dark.TButton",
-            background=button_bg,
-            foreground=fg_color,
-            borderwidth=1,
-            focuscolor="none",
-            font=("Segoe UI", 9),
-        )
-        style.configure(
-            "Dark.TEntry",
-            background=entry_bg,
-            foreground=fg_color,
-            borderwidth=1,
-            insertcolor=fg_color,
-            font=("Segoe UI", 9),
-        )
-        style.configure(
-            "Dark.TSpinbox",
-            background=entry_bg,
-            foreground=fg_color,
-            fieldbackground=entry_bg,
-            borderwidth=1,
-            insertcolor=fg_color,
-            font=("Segoe UI", 9),
-        )
-        # Fix Combobox dropdown styling
-        style.configure(
-            "Dark.TCombobox",
-            background=entry_bg,
-            foreground=fg_color,
-            fieldbackground=entry_bg,
-            selectbackground="#0078d4",
-            selectforeground=fg_color,
-            borderwidth=1,
-            insertcolor=fg_color,
-            font=("Segoe UI", 9),
-        )
-
-        style.configure(
-            "Dark.TCheckbutton",
-            background=bg_color,
-            foreground=fg_color,
-            focuscolor="none",
-            font=("Segoe UI", 9),
-        )
-        style.configure(
-            "Dark.TRadiobutton",
-            background=bg_color,
-            foreground=fg_color,
-            focuscolor="none",
-            font=("Segoe UI", 9),
-        )
-        style.configure("Dark.TNotebook", background=bg_color, borderwidth=0)
-        style.configure(
-            "Dark.TNotebook.Tab",
-            background=button_bg,
-            foreground=fg_color,
-            padding=[20, 8],
-            borderwidth=0,
-        )
-
-        # Accent button styles for CTAs
-        style.configure(
-            "Accent.TButton",
-            background="#0078d4",
-            foreground=fg_color,
-            borderwidth=1,
-            focuscolor="none",
-            font=("Segoe UI", 9, "bold"),
-        )
-        style.configure(
-            "Danger.TButton",
-            background="#dc3545",
-            foreground=fg_color,
-            borderwidth=1,
-            focuscolor="none",
-            font=("Segoe UI", 9, "bold"),
-        )
-
-        # Map states
-        style.map(
-            "Dark.TButton",
-            background=[("active", button_active), ("pressed", "#0078d4")],
-            foreground=[("active", fg_color)],
-        )
-
-        style.map(
-            "Dark.TCombobox",
-            fieldbackground=[("readonly", entry_bg)],
-            selectbackground=[("readonly", "#0078d4")],
-        )
-
-        style.map(
-            "Accent.TButton",
-            background=[("active", "#106ebe"), ("pressed", "#005a9e")],
-            foreground=[("active", fg_color)],
-        )
-
-        style.map(
-            "Danger.TButton",
-            background=[("active", "#c82333"), ("pressed", "#bd2130")],
-            foreground=[("active", fg_color)],
-        )
-
-        style.map(
-            "Dark.TNotebook.Tab", background=[("selected", "#0078d4"), ("active", button_active)]
-        )
-
     def _launch_webui(self):
         """Auto-launch Stable Diffusion WebUI with improved detection (non-blocking)."""
         # Allow disabling auto-launch in headless/CI environments
@@ -402,55 +592,58 @@ class StableNewGUI:
 
         webui_path = Path("C:/Users/rober/stable-diffusion-webui/webui-user.bat")
 
-        # Run discovery/launch in background to avoid freezing Tk mainloop
+        # Run discovery/launch in background to avoid freezing Tk mainloop. Results are
+        # marshalled back with _post_ui, one callback per outcome.
+        def use_api_url(url: str) -> None:
+            self.api_url_var.set(url)
+            self._schedule_api_check()
+
+        def report_not_found() -> None:
+            self.log_message("⚠️ WebUI not found - please start manually", "WARNING")
+            messagebox.showinfo(
+                "WebUI Not Found",
+                (
+                    f"WebUI not found at: {webui_path}\n"
+                    "Please start Stable Diffusion WebUI manually "
+                    "with --api flag and click 'Check API'"
+                ),
+            )
+
         def discovery_and_launch():
             # 1) Check if WebUI is already running (may take a few seconds)
             existing_url = find_webui_api_port()
             if existing_url:
                 logger.info(f"WebUI already running at {existing_url}")
-                self.root.after(0, lambda: self.api_url_var.set(existing_url))
-                self.root.after(1000, self._check_api_connection)
+                self._post_ui(lambda: use_api_url(existing_url))
                 return
 
             # 2) Attempt to launch WebUI if path exists
-            if webui_path.exists():
-                self.root.after(0, lambda: self.log_message("🚀 Launching Stable Diffusion WebUI...", "INFO"))
-                success = launch_webui_safely(webui_path, wait_time=15)
-                if success:
-                    # Find the actual URL and update UI
-                    api_url = find_webui_api_port()
-                    if api_url:
-                        self.root.after(0, lambda: self.api_url_var.set(api_url))
-                        self.root.after(1000, self._check_api_connection)
-                    else:
-                        self.root.after(
-                            0,
-                            lambda: self.log_message("⚠️ WebUI launched but API not found", "WARNING"),
-                        )
-                else:
-                    self.root.after(0, lambda: self.log_message("❌ WebUI launch failed", "ERROR"))
-            else:
+            if not webui_path.exists():
                 logger.warning("WebUI not found at expected location")
-                self.root.after(0, lambda: self.log_message("⚠️ WebUI not found - please start manually", "WARNING"))
-                self.root.after(
-                    0,
-                    lambda: messagebox.showinfo(
-                        "WebUI Not Found",
-                        (
-                            f"WebUI not found at: {webui_path}\n"
-                            "Please start Stable Diffusion WebUI manually "
-                            "with --api flag and click 'Check API'"
-                        ),
-                    ),
+                self._post_ui(report_not_found)
+                return
+
+            self._post_ui(lambda: self.log_message("🚀 Launching Stable Diffusion WebUI...", "INFO"))
+            if not launch_webui_safely(webui_path, wait_time=15):
+                self._post_ui(lambda: self.log_message("❌ WebUI launch failed", "ERROR"))
+                return
+            # Find the actual URL and update UI
+            api_url = find_webui_api_port()
+            if api_url:
+                self._post_ui(lambda: use_api_url(api_url))
+            else:
+                self._post_ui(
+                    lambda: self.log_message("⚠️ WebUI launched but API not found", "WARNING")
                 )
 
-        threading.Thread(target=discovery_and_launch, daemon=True).start()
+        self._io_executor.submit(discovery_and_launch)
 
     def _ensure_default_preset(self):
         """Ensure default preset exists and load it if set as startup default"""
-        if "default" not in self.config_manager.list_presets():
+        if not self.config_manager.has_preset("default"):
             default_config = self.config_manager.get_default_config()
             self.config_manager.save_preset("default", default_config)
+            self._presets_cache = None
 
         # Check if a default preset is configured for startup
         default_preset_name = self.config_manager.get_default_preset()
@@ -587,10 +780,10 @@ class StableNewGUI:
             textvariable=self.preset_var,
             state="readonly",
             width=28,
-            values=self.config_manager.list_presets(),
+            values=self._get_presets(),
         )
         self.preset_dropdown.grid(row=0, column=1, sticky=tk.W)
-        self.preset_dropdown.bind("<<ComboboxSelected>>", lambda _e: self._on_preset_dropdown_changed())
+        self.preset_dropdown.bind("<<ComboboxSelected>>", self._debounce_preset_change)
         self._attach_tooltip(
             self.preset_dropdown,
             "Select a preset to load its settings into the active configuration (spans all tabs).",
@@ -706,9 +899,9 @@ class StableNewGUI:
             )
             summary_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
 
-            self.txt2img_summary_var = getattr(self, "txt2img_summary_var", tk.StringVar(value=""))
-            self.img2img_summary_var = getattr(self, "img2img_summary_var", tk.StringVar(value=""))
-            self.upscale_summary_var = getattr(self, "upscale_summary_var", tk.StringVar(value=""))
+            self.txt2img_summary_var = getattr(self, "txt2img_summary_var", None) or tk.StringVar(value="")
+            self.img2img_summary_var = getattr(self, "img2img_summary_var", None) or tk.StringVar(value="")
+            self.upscale_summary_var = getattr(self, "upscale_summary_var", None) or tk.StringVar(value="")
 
             for var in (
                 self.txt2img_summary_var,
@@ -1111,7 +1304,7 @@ class StableNewGUI:
 
         slots_scrollable_frame.bind(
             "<Configure>",
-            lambda e: slots_canvas.configure(scrollregion=slots_canvas.bbox("all")),
+            lambda e, c=slots_canvas: schedule_scrollregion(c),
         )
 
         slots_canvas.create_window((0, 0), window=slots_scrollable_frame, anchor="nw")
@@ -1366,11 +1559,11 @@ class StableNewGUI:
         if not vars_dict or not widgets:
             return
 
-        master = bool(vars_dict.get("enabled", tk.BooleanVar(value=False)).get())
+        master = bool(_var_value(vars_dict, "enabled", False))
         section_enabled = {
-            "prompt_sr_text": master and bool(vars_dict.get("prompt_sr_enabled", tk.BooleanVar()).get()),
-            "wildcard_text": master and bool(vars_dict.get("wildcards_enabled", tk.BooleanVar()).get()),
-            "matrix_text": master and bool(vars_dict.get("matrix_enabled", tk.BooleanVar()).get()),
+            "prompt_sr_text": master and bool(_var_value(vars_dict, "prompt_sr_enabled", False)),
+            "wildcard_text": master and bool(_var_value(vars_dict, "wildcards_enabled", False)),
+            "matrix_text": master and bool(_var_value(vars_dict, "matrix_enabled", False)),
         }
 
         for key, widget in widgets.items():
@@ -1473,8 +1666,8 @@ class StableNewGUI:
         if not vars_dict or not widgets:
             return
 
-        enabled = bool(vars_dict.get("enabled", tk.BooleanVar(value=False)).get())
-        mode = vars_dict.get("mode", tk.StringVar(value="prompt")).get()
+        enabled = bool(_var_value(vars_dict, "enabled", False))
+        mode = _var_value(vars_dict, "mode", "prompt")
         if mode == "script" and not self.aesthetic_script_available:
             mode = "prompt"
             vars_dict["mode"].set("prompt")
@@ -1853,7 +2046,7 @@ class StableNewGUI:
         # Update scroll region
         canvas = self.randomization_widgets.get("matrix_slots_canvas")
         if canvas:
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            schedule_scrollregion(canvas)
 
     def _remove_matrix_slot_row(self, row_frame: tk.Widget) -> None:
         """Remove a matrix slot row from the UI."""
@@ -1867,7 +2060,7 @@ class StableNewGUI:
         # Update scroll region
         canvas = self.randomization_widgets.get("matrix_slots_canvas")
         if canvas:
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            schedule_scrollregion(canvas)
 
     def _clear_matrix_slot_rows(self) -> None:
         """Clear all matrix slot rows from the UI."""
@@ -1879,12 +2072,12 @@ class StableNewGUI:
         # Update scroll region
         canvas = self.randomization_widgets.get("matrix_slots_canvas")
         if canvas:
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            schedule_scrollregion(canvas)
 
     def _toggle_matrix_legacy_view(self) -> None:
         """Toggle between modern UI and legacy text editor for matrix config."""
 
-        show_legacy = self.randomization_vars.get("matrix_show_legacy", tk.BooleanVar()).get()
+        show_legacy = _var_value(self.randomization_vars, "matrix_show_legacy", False)
         legacy_container = self.randomization_widgets.get("matrix_legacy_container")
 
         if legacy_container:
@@ -2001,318 +2194,6 @@ class StableNewGUI:
         self.pack_mode_var = self.pipeline_controls_panel.pack_mode_var
         self.images_per_prompt_var = self.pipeline_controls_panel.images_per_prompt_var
 
-    def _build_config_display_tab(self, notebook):
-        """Build interactive configuration tabs"""
-
-        config_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(config_frame, text="⚙️ Configuration")
-
-        # Configuration status section with dark theme
-        status_frame = ttk.LabelFrame(
-            config_frame, text="Configuration Status", style="Dark.TFrame", padding=5
-        )
-        status_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
-
-        self.config_status_label = ttk.Label(
-            status_frame,
-            text="Ready",
-            style="Dark.TLabel",
-            foreground="#cccccc",
-            font=("Segoe UI", 9),
-            wraplength=600,
-        )
-        self.config_status_label.pack(fill=tk.X)
-
-        # Create nested notebook for stage-specific configurations with proper spacing
-        config_notebook = ttk.Notebook(config_frame, style="Dark.TNotebook")
-        config_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-
-        # Create individual tabs for each stage
-        self._build_txt2img_config_tab(config_notebook)
-        self._build_img2img_config_tab(config_notebook)
-        self._build_upscale_config_tab(config_notebook)
-        self._build_api_config_tab(config_notebook)
-
-        # Add buttons for save/load/reset with proper spacing at bottom
-        config_buttons = ttk.Frame(config_frame, style="Dark.TFrame")
-        config_buttons.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(5, 10))
-
-        save_all_btn = ttk.Button(
-            config_buttons,
-            text="Save All Changes",
-            command=self._save_all_config,
-            style="Dark.TButton",
-        )
-        save_all_btn.pack(side=tk.LEFT, padx=(0, 5))
-        self._attach_tooltip(
-            save_all_btn,
-            "Write every visible setting to the current preset/override so multi-pack runs stay consistent.",
-        )
-
-        reset_all_btn = ttk.Button(
-            config_buttons, text="Reset All", command=self._reset_all_config, style="Dark.TButton"
-        )
-        reset_all_btn.pack(side=tk.LEFT, padx=(0, 5))
-        self._attach_tooltip(
-            reset_all_btn,
-            "Revert the form back to the base preset. Does not touch pack-specific files.",
-        )
-
-        save_pack_btn = ttk.Button(
-            config_buttons,
-            text="Save Pack Config",
-            command=self._save_current_pack_config,
-            style="Dark.TButton",
-        )
-        save_pack_btn.pack(side=tk.LEFT, padx=(0, 5))
-        self._attach_tooltip(
-            save_pack_btn,
-            "Stores the current values into the highlighted pack's JSON. Available only when a single pack is selected and override is off.",
-        )
-
-        # Auto-apply toggle and top save indicator
-        try:
-            self.auto_apply_var = tk.BooleanVar(value=False)
-            auto_apply_check = ttk.Checkbutton(
-                config_buttons,
-                text="Auto-apply on change",
-                variable=self.auto_apply_var,
-                style="Dark.TCheckbutton",
-            )
-            auto_apply_check.pack(side=tk.LEFT, padx=(10, 5))
-            self._attach_tooltip(
-                auto_apply_check,
-                "Immediately save edits to the active pack/preset whenever a field changes. Helpful for rapid tweaking.",
-            )
-
-            self.top_save_indicator_var = tk.StringVar(value="")
-            self.top_save_indicator = ttk.Label(
-                config_buttons, textvariable=self.top_save_indicator_var, style="Dark.TLabel"
-            )
-            self.top_save_indicator.pack(side=tk.LEFT, padx=(8, 0))
-        except Exception:
-            pass
-
-        # Preset selection dropdown
-        preset_frame = ttk.LabelFrame(config_buttons, text="Base Preset", padding=5)
-        preset_frame.pack(side=tk.LEFT, padx=(10, 10))
-
-        preset_controls = ttk.Frame(preset_frame, style="Dark.TFrame")
-        preset_controls.pack(fill=tk.X)
-
-        self.preset_dropdown = ttk.Combobox(
-            preset_controls,
-            textvariable=self.preset_var,
-            state="readonly",
-            width=15,
-            style="Dark.TCombobox",
-            values=self.config_manager.list_presets(),
-        )
-        self.preset_dropdown.pack(side=tk.LEFT, padx=(0, 4))
-        self.preset_dropdown.bind("<<ComboboxSelected>>", self._on_preset_changed)
-
-        # Preset action buttons
-        preset_buttons = ttk.Frame(preset_controls, style="Dark.TFrame")
-        preset_buttons.pack(side=tk.LEFT)
-
-        load_btn = ttk.Button(
-            preset_buttons,
-            text="↻ Load",
-            command=self._load_selected_preset,
-            width=6,
-            style="Dark.TButton",
-        )
-        load_btn.pack(side=tk.LEFT, padx=1)
-        self._attach_tooltip(load_btn, "Load the selected preset into the current configuration")
-
-        save_as_btn = ttk.Button(
-            preset_buttons,
-            text="💾 Save As",
-            command=self._save_preset_as,
-            width=8,
-            style="Dark.TButton",
-        )
-        save_as_btn.pack(side=tk.LEFT, padx=1)
-        self._attach_tooltip(save_as_btn, "Save current config as a new preset")
-
-        update_btn = ttk.Button(
-            preset_buttons,
-            text="✓ Update",
-            command=self._save_override_preset,
-            width=7,
-            style="Dark.TButton",
-        )
-        update_btn.pack(side=tk.LEFT, padx=1)
-        self._attach_tooltip(update_btn, "Update the selected preset with current settings")
-
-        delete_btn = ttk.Button(
-            preset_buttons,
-            text="🗑 Delete",
-            command=self._delete_selected_preset,
-            width=7,
-            style="Danger.TButton",
-        )
-        delete_btn.pack(side=tk.LEFT, padx=1)
-        self._attach_tooltip(delete_btn, "Delete the selected preset (default cannot be deleted)")
-
-        set_default_btn = ttk.Button(
-            preset_buttons,
-            text="⭐ Set Default",
-            command=self._set_default_preset,
-            width=11,
-            style="Dark.TButton",
-        )
-        set_default_btn.pack(side=tk.LEFT, padx=1)
-        self._attach_tooltip(set_default_btn, "Set this preset to load automatically on startup")
-
-    def _build_pipeline_controls_tab(self, notebook):
-        """Build pipeline execution controls tab"""
-        pipeline_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(pipeline_frame, text="🚀 Pipeline Controls")
-
-        # Pipeline execution options
-        exec_options_frame = ttk.LabelFrame(
-            pipeline_frame, text="Execution Options", style="Dark.TFrame", padding=10
-        )
-        exec_options_frame.pack(fill=tk.X, pady=(10, 10))
-
-        # Stage selection
-        stages_frame = ttk.Frame(exec_options_frame, style="Dark.TFrame")
-        stages_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(stages_frame, text="Pipeline Stages:", style="Dark.TLabel").pack(anchor=tk.W)
-
-        stage_checks_frame = ttk.Frame(stages_frame, style="Dark.TFrame")
-        stage_checks_frame.pack(fill=tk.X, pady=(5, 0))
-
-        self.txt2img_enabled = tk.BooleanVar(value=True)
-        self.img2img_enabled = tk.BooleanVar(value=True)
-        self.upscale_enabled = tk.BooleanVar(value=True)
-        self.video_enabled = tk.BooleanVar(value=False)
-
-        ttk.Checkbutton(
-            stage_checks_frame,
-            text="🎨 txt2img",
-            variable=self.txt2img_enabled,
-            style="Dark.TCheckbutton",
-        ).pack(side=tk.LEFT, padx=(0, 20))
-        ttk.Checkbutton(
-            stage_checks_frame,
-            text="🧹 img2img cleanup",
-            variable=self.img2img_enabled,
-            style="Dark.TCheckbutton",
-        ).pack(side=tk.LEFT, padx=(0, 20))
-        ttk.Checkbutton(
-            stage_checks_frame,
-            text="📈 Upscale",
-            variable=self.upscale_enabled,
-            style="Dark.TCheckbutton",
-        ).pack(side=tk.LEFT, padx=(0, 20))
-        ttk.Checkbutton(
-            stage_checks_frame,
-            text="🎬 Create Video",
-            variable=self.video_enabled,
-            style="Dark.TCheckbutton",
-        ).pack(side=tk.LEFT)
-
-        # Loop configuration
-        loop_frame = ttk.Frame(exec_options_frame, style="Dark.TFrame")
-        loop_frame.pack(fill=tk.X, pady=(10, 0))
-
-        ttk.Label(loop_frame, text="Loop Configuration:", style="Dark.TLabel").pack(anchor=tk.W)
-
-        loop_controls = ttk.Frame(loop_frame, style="Dark.TFrame")
-        loop_controls.pack(fill=tk.X, pady=(5, 0))
-
-        # Loop type
-        self.loop_type_var = tk.StringVar(value="single")
-        ttk.Radiobutton(
-            loop_controls,
-            text="Single run",
-            variable=self.loop_type_var,
-            value="single",
-            style="Dark.TRadiobutton",
-        ).grid(row=0, column=0, sticky=tk.W)
-        ttk.Radiobutton(
-            loop_controls,
-            text="Loop stages",
-            variable=self.loop_type_var,
-            value="stages",
-            style="Dark.TRadiobutton",
-        ).grid(row=0, column=1, sticky=tk.W, padx=(20, 0))
-        ttk.Radiobutton(
-            loop_controls,
-            text="Loop pipeline",
-            variable=self.loop_type_var,
-            value="pipeline",
-            style="Dark.TRadiobutton",
-        ).grid(row=0, column=2, sticky=tk.W, padx=(20, 0))
-
-        # Loop count
-        loop_count_frame = ttk.Frame(loop_controls, style="Dark.TFrame")
-        loop_count_frame.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
-
-        ttk.Label(loop_count_frame, text="Loop count:", style="Dark.TLabel").pack(side=tk.LEFT)
-        self.loop_count_var = tk.StringVar(value="1")
-        loop_count_spin = ttk.Spinbox(
-            loop_count_frame,
-            from_=1,
-            to=100,
-            width=5,
-            textvariable=self.loop_count_var,
-            style="Dark.TEntry",
-        )
-        loop_count_spin.pack(side=tk.LEFT, padx=(5, 0))
-
-        # Batch configuration
-        batch_frame = ttk.LabelFrame(
-            pipeline_frame, text="Batch Configuration", style="Dark.TFrame", padding=10
-        )
-        batch_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # Pack selection mode
-        pack_mode_frame = ttk.Frame(batch_frame, style="Dark.TFrame")
-        pack_mode_frame.pack(fill=tk.X)
-
-        self.pack_mode_var = tk.StringVar(value="selected")
-        ttk.Radiobutton(
-            pack_mode_frame,
-            text="Selected packs only",
-            variable=self.pack_mode_var,
-            value="selected",
-            style="Dark.TRadiobutton",
-        ).pack(side=tk.LEFT, padx=(0, 20))
-        ttk.Radiobutton(
-            pack_mode_frame,
-            text="All packs",
-            variable=self.pack_mode_var,
-            value="all",
-            style="Dark.TRadiobutton",
-        ).pack(side=tk.LEFT, padx=(0, 20))
-        ttk.Radiobutton(
-            pack_mode_frame,
-            text="Custom list",
-            variable=self.pack_mode_var,
-            value="custom",
-            style="Dark.TRadiobutton",
-        ).pack(side=tk.LEFT)
-
-        # Images per prompt
-        images_frame = ttk.Frame(batch_frame, style="Dark.TFrame")
-        images_frame.pack(fill=tk.X, pady=(10, 0))
-
-        ttk.Label(images_frame, text="Images per prompt:", style="Dark.TLabel").pack(side=tk.LEFT)
-        self.images_per_prompt_var = tk.StringVar(value="1")
-        images_spin = ttk.Spinbox(
-            images_frame,
-            from_=1,
-            to=10,
-            width=5,
-            textvariable=self.images_per_prompt_var,
-            style="Dark.TEntry",
-        )
-        images_spin.pack(side=tk.LEFT, padx=(5, 0))
-
     def _build_bottom_panel(self, parent):
         """Build bottom panel with logs and action buttons"""
         bottom_frame = ttk.Frame(parent, style="Dark.TFrame")
@@ -2408,7 +2289,7 @@ class StableNewGUI:
             self._enable_mousewheel(self.log_text)
 
         # Attach logging handler to redirect standard logging to GUI
-        if not hasattr(self, "gui_log_handler"):
+        if self.gui_log_handler is None:
             self.gui_log_handler = TkinterLogHandler(self.log_panel)
             logging.getLogger().addHandler(self.gui_log_handler)
 
@@ -2500,38 +2381,31 @@ class StableNewGUI:
 
     def _setup_state_callbacks(self):
         """Setup callbacks for state transitions"""
-
-        def on_state_change(old_state, new_state):
-            """Called when state changes"""
-            state_colors = {
-                GUIState.IDLE: ("#4CAF50", "● Idle"),
-                GUIState.RUNNING: ("#2196F3", "● Running"),
-                GUIState.STOPPING: ("#FF9800", "● Stopping"),
-                GUIState.ERROR: ("#f44336", "● Error"),
-            }
-
-            color, text = state_colors.get(new_state, ("#888888", "● Unknown"))
-            self.state_label.config(text=text, foreground=color)
-
-            if new_state == GUIState.RUNNING:
-                self.progress_message_var.set("Running pipeline...")
-            elif new_state == GUIState.STOPPING:
-                self.progress_message_var.set("Cancelling pipeline...")
-            elif new_state == GUIState.ERROR:
-                self.progress_message_var.set("Error")
-            elif new_state == GUIState.IDLE and old_state == GUIState.STOPPING:
-                self.progress_message_var.set("Ready")
-
-            # Update button states
-            if new_state == GUIState.RUNNING:
-                self.run_pipeline_btn.config(state=tk.DISABLED)
-            elif new_state == GUIState.IDLE:
-                self._reset_progress_ui()
-                self.run_pipeline_btn.config(state=tk.NORMAL if self.api_connected else tk.DISABLED)
-            elif new_state == GUIState.ERROR:
-                self.run_pipeline_btn.config(state=tk.NORMAL if self.api_connected else tk.DISABLED)
-
-        self.state_manager.on_transition(on_state_change)
+        # Held weakly so the long-lived StateManager does not keep a closed window alive
+        self.state_manager.on_transition(weakref.WeakMethod(self._on_state_change))
+
+    def _on_state_change(self, old_state, new_state):
+        """Called when state changes"""
+        color, text = StableNewGUI._STATE_COLORS.get(new_state, ("#888888", "● Unknown"))
+        self.state_label.config(text=text, foreground=color)
+
+        if new_state == GUIState.RUNNING:
+            self.progress_message_var.set("Running pipeline...")
+        elif new_state == GUIState.STOPPING:
+            self.progress_message_var.set("Cancelling pipeline...")
+        elif new_state == GUIState.ERROR:
+            self.progress_message_var.set("Error")
+        elif new_state == GUIState.IDLE and old_state == GUIState.STOPPING:
+            self.progress_message_var.set("Ready")
+
+        # Update button states
+        if new_state == GUIState.RUNNING:
+            self.run_pipeline_btn.config(state=tk.DISABLED)
+        elif new_state == GUIState.IDLE:
+            self._reset_progress_ui()
+            self.run_pipeline_btn.config(state=tk.NORMAL if self.api_connected else tk.DISABLED)
+        elif new_state == GUIState.ERROR:
+            self.run_pipeline_btn.config(state=tk.NORMAL if self.api_connected else tk.DISABLED)
 
     def _queue_progress_update(self, percent: float) -> None:
         """Update progress widgets on the Tk thread."""
@@ -2571,8 +2445,6 @@ class StableNewGUI:
 
         if text is None:
             try:
-                from .state import GUIState
-
                 if hasattr(self, "state_manager") and self.state_manager.is_state(GUIState.ERROR):
                     message = "Error"
                 else:
@@ -2583,8 +2455,6 @@ class StableNewGUI:
             message = text
         # Normalize cancellation text to Ready once we've returned to IDLE
         try:
-            from .state import GUIState
-
             if (
                 str(message).strip().lower() == "cancelled"
                 and hasattr(self, "state_manager")
@@ -2597,39 +2467,298 @@ class StableNewGUI:
         self.progress_var.set(message)
 
     def _poll_controller_logs(self):
-        """Poll controller for log messages and display them"""
-        messages = self.controller.get_log_messages()
-        for msg in messages:
+        """Display controller log messages as they arrive.
+
+        Controllers that support ``set_log_callback`` wake the Tk thread only when a
+        message is queued: through a self-pipe watched by Tcl where file handlers are
+        available (not on Windows), otherwise through ``_post_ui``. Others are polled
+        every 100 ms.
+        """
+        set_log_callback = getattr(self.controller, "set_log_callback", None)
+        if callable(set_log_callback):
+            self._log_drain_pending = False
+            if self._open_log_wake_pipe():
+                set_log_callback(self._wake_log_pipe)
+            else:
+                set_log_callback(self._schedule_log_drain)
+            self._drain_controller_logs()
+            return
+        self._drain_controller_logs()
+        self.root.after(100, self._poll_controller_logs)
+
+    def _open_log_wake_pipe(self) -> bool:
+        """Register a self-pipe whose read end wakes Tk; False where unsupported."""
+        createfilehandler = getattr(self.root.tk, "createfilehandler", None)
+        if createfilehandler is None or os.name == "nt":
+            return False
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        try:
+            createfilehandler(read_fd, tk.READABLE, self._on_log_fd_ready)
+        except Exception:
+            os.close(read_fd)
+            os.close(write_fd)
+            return False
+        self._log_wake_fds = (read_fd, write_fd)
+        return True
+
+    def _wake_log_pipe(self) -> None:
+        """Signal the Tk thread that log messages are queued (callable from any thread)."""
+        with self._log_wake_lock:
+            fds = self._log_wake_fds
+            if fds is None:
+                return
+            try:
+                os.write(fds[1], b"\0")
+            except BlockingIOError:
+                pass  # Pipe full: the reader is already due to wake up
+            except OSError:
+                pass
+
+    def _on_log_fd_ready(self, fd, _mask) -> None:
+        """Tcl file handler: clear the wake bytes, then drain the controller log queue."""
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        except OSError:
+            return
+        self._drain_controller_logs()
+
+    def _close_log_wake_pipe(self) -> None:
+        """Unregister and close the log wake pipe, if one was opened."""
+        fds = getattr(self, "_log_wake_fds", None)
+        if fds is None:
+            return
+        try:
+            self.root.tk.deletefilehandler(fds[0])
+        except Exception:
+            pass
+        with self._log_wake_lock:
+            self._log_wake_fds = None
+            for fd in fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _schedule_log_drain(self) -> None:
+        """Request one controller-log drain on the Tk thread (callable from any thread)."""
+        if self._log_drain_pending:
+            return
+        self._log_drain_pending = True
+        self._post_ui(self._drain_controller_logs)
+
+    def _drain_controller_logs(self) -> None:
+        """Show every queued controller log message."""
+        # Cleared before draining so a message queued meanwhile schedules another drain
+        self._log_drain_pending = False
+        for msg in self.controller.get_log_messages():
             self.log_message(msg.message, msg.level)
             self._apply_status_text(msg.message)
 
-        # Schedule next poll
-        self.root.after(100, self._poll_controller_logs)
+    def _init_async_state(self) -> None:
+        """Initialize state shared by the background refresh/API helpers."""
+        # (api_url, name) -> (expiry, result) for health checks and slow-changing API listings
+        self._api_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._api_cache_lock = threading.Lock()
+        # Callables posted from any thread, drained together on the Tk thread
+        self._ui_queue: deque = deque()
+        self._ui_lock = threading.Lock()
+        self._ui_pending = False
+        # combo attribute name -> hash of the values tuple last pushed to it
+        self._last_values_hash: dict[str, int] = {}
+        # Persistent workers for API refreshes: one per listing fetched after connecting, so
+        # the post-connect refresh takes as long as the slowest request, not their sum
+        self._api_executor = _DaemonPool(max_workers=_API_REFRESH_WORKERS, thread_name_prefix="api")
+        # Background I/O jobs (WebUI discovery and launch, connection checks, pack scans);
+        # daemon so closing the window during a slow connect does not hold the process open
+        self._io_executor = _DaemonPool(max_workers=2, thread_name_prefix="sdgui-io")
+        # Long-running user actions (txt2img/upscale-only runs, video creation); bounded so
+        # repeated clicks queue up instead of spawning a thread each, and daemon so closing
+        # the app mid-run does not wait for the generation to finish
+        self._pool = _DaemonPool(max_workers=4, thread_name_prefix="gui-bg")
+        # Prompt editor validation; one worker so results arrive in request order
+        self._val_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pack-validate")
+        # Latest future per background task name (see _run_in_background)
+        self._pending: dict[str, Future] = {}
+        # Client reused by connection checks while the URL is unchanged (see _get_probe_client)
+        self._probe_client: SDWebUIClient | None = None
+        self._client_lock = threading.Lock()
+        # (api_url, monotonic time) of the last failed connection check, cleared on success
+        self._last_connect_fail: tuple[str, float] | None = None
+
+    def _run_in_background(self, fn: Callable[[], Any]) -> Future:
+        """Submit a user action to the shared background pool and track it by name."""
+        future = self._pool.submit(fn)
+        self._pending[fn.__name__] = future
+        future.add_done_callback(lambda f, name=fn.__name__: self._forget_pending(name, f))
+        return future
+
+    def _forget_pending(self, name: str, future: Future) -> None:
+        # Only drop the entry if a newer submission has not replaced it
+        if self._pending.get(name) is future:
+            self._pending.pop(name, None)
+
+    def _cancel_pending_background(self) -> int:
+        """Cancel queued (not yet started) background actions; returns how many were cancelled."""
+        return sum(1 for future in list(self._pending.values()) if future.cancel())
+
+    def _post_ui(self, fn) -> None:
+        """Run ``fn`` on the Tk thread; posts made before the next drain share one tick."""
+        with self._ui_lock:
+            self._ui_queue.append(fn)
+            if self._ui_pending:
+                return
+            self._ui_pending = True
+        # Idle queue: drained without a timer-heap entry, after pending events are handled
+        self.root.after_idle(self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        """Execute every queued UI callable in posting order."""
+        with self._ui_lock:
+            pending = list(self._ui_queue)
+            self._ui_queue.clear()
+            self._ui_pending = False
+        for fn in pending:
+            try:
+                fn()
+            except Exception:
+                logger.exception("Queued UI update failed")
+
+    def _cached_call(
+        self,
+        key: tuple[str, str],
+        fn,
+        ttl: float = 30.0,
+        force: bool = False,
+        is_ok=None,
+        negative_ttl: float = 0.0,
+    ):
+        """Return ``fn()`` memoized under ``key`` (``(api_url, name)``) for ``ttl`` seconds.
+
+        ``force`` bypasses (and refreshes) the cached entry, e.g. for explicit refresh buttons.
+        Results rejected by ``is_ok`` are only kept for ``negative_ttl`` seconds, so a transient
+        outage rate-limits retries without poisoning the cache.
+        """
+        now = time.monotonic()
+        if not force:
+            with self._api_cache_lock:
+                entry = self._api_cache.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+        result = fn()
+        if is_ok is not None and not is_ok(result):
+            ttl = negative_ttl
+        if ttl > 0:
+            with self._api_cache_lock:
+                self._api_cache[key] = (now + ttl, result)
+        return result
+
+    def _cached_health(self, api_url: str, session=None) -> dict:
+        """``validate_webui_health`` for ``api_url``, cached while the WebUI stays accessible."""
+        return self._cached_call(
+            (api_url, "health"),
+            lambda: validate_webui_health(api_url, session=session),
+            ttl=_HEALTH_CACHE_TTL_S,
+            is_ok=lambda health: health.get("accessible"),
+            negative_ttl=_HEALTH_NEGATIVE_TTL_S,
+        )
+
+    def _invalidate_api_cache(self, key: tuple[str, str] | None = None) -> None:
+        """Drop one cached API listing, or all of them when ``key`` is None."""
+        with self._api_cache_lock:
+            if key is None:
+                self._api_cache.clear()
+            else:
+                self._api_cache.pop(key, None)
+
+    def _invalidate_api_listings(self, api_url: str) -> None:
+        """Drop every cached listing for ``api_url``; its health result is kept."""
+        with self._api_cache_lock:
+            for key in [k for k in self._api_cache if k[0] == api_url and k[1] != "health"]:
+                del self._api_cache[key]
 
     # Class-level API check method
+    def _schedule_api_check(self, delay_ms: int = 50, waited_ms: int = 0):
+        """Run _check_api_connection as soon as a cheap readiness probe succeeds.
+
+        Probes back off exponentially (50 ms, 100 ms, ... capped at 2 s) and share the
+        connection-check client from _get_probe_client.
+        """
+        probe_client = self._get_probe_client(self.api_url_var.get())
+
+        def worker():
+            try:
+                ready = probe_client.check_api_ready(max_retries=1)
+            except Exception:
+                ready = False
+            waited = waited_ms + delay_ms
+            if ready:
+                # A failure cached by an earlier Connect (e.g. while WebUI was booting) is
+                # stale now; otherwise the full check would stop at the cached failure
+                self._last_connect_fail = None
+            if ready or waited >= _API_CHECK_TIMEOUT_MS:
+                # The full check also reports the failure once polling gives up
+                self._post_ui(self._check_api_connection)
+            else:
+                next_delay = min(delay_ms * 2, _API_CHECK_MAX_DELAY_MS)
+                self._post_ui(lambda: self._schedule_api_check(next_delay, waited))
+
+        self.root.after(delay_ms, lambda: self._api_executor.submit(worker))
+
+    def _get_probe_client(self, api_url: str) -> SDWebUIClient:
+        """Return the connection-check client for ``api_url``, reusing it while the URL is unchanged."""
+        with self._client_lock:
+            probe = self._probe_client
+            if probe is not None and probe.base_url == api_url.rstrip("/"):
+                return probe
+            if probe is not None and probe is not self.client:
+                probe.close()
+            probe = self._probe_client = SDWebUIClient(api_url)
+            return probe
+
     def _check_api_connection(self):
         """Check API connection status with improved diagnostics."""
 
         def check_in_thread():
             api_url = self.api_url_var.get()
 
+            # WebUI down: repeated clicks reuse the recent failure instead of paying the
+            # direct timeout plus a full port scan again
+            last_fail = self._last_connect_fail
+            if (
+                last_fail is not None
+                and last_fail[0] == api_url
+                and time.monotonic() - last_fail[1] < _CONNECT_FAIL_CACHE_S
+            ):
+                self.log_message(
+                    "Recent connection failure cached — retry in a few seconds", "INFO"
+                )
+                return
+
             # Try the specified URL first
             self.log_message("🔍 Checking API connection...", "INFO")
 
             # First try direct connection
-            client = SDWebUIClient(api_url)
+            client = self._get_probe_client(api_url)
             # Apply configured timeout from API tab (keeps UI responsive on failures)
             try:
-                if hasattr(self, "api_vars") and "timeout" in self.api_vars:
+                if self.api_vars is not None and "timeout" in self.api_vars:
                     client.timeout = int(self.api_vars["timeout"].get() or 30)
             except Exception:
                 pass
             if client.check_api_ready():
                 # Perform health check
-                health = validate_webui_health(api_url)
+                health = self._cached_health(api_url, session=client.session)
 
+                self._last_connect_fail = None
                 self.api_connected = True
                 self.client = client
+                # WebUI may have restarted with other models since the lists were cached
+                self._invalidate_api_listings(client.base_url)
                 self.pipeline = Pipeline(client, self.structured_logger)
                 self.controller.set_pipeline(self.pipeline)
 
@@ -2649,17 +2778,19 @@ class StableNewGUI:
 
             if discovered_url:
                 # Test the discovered URL
-                client = SDWebUIClient(discovered_url)
+                client = self._get_probe_client(discovered_url)
                 try:
-                    if hasattr(self, "api_vars") and "timeout" in self.api_vars:
+                    if self.api_vars is not None and "timeout" in self.api_vars:
                         client.timeout = int(self.api_vars["timeout"].get() or 30)
                 except Exception:
                     pass
                 if client.check_api_ready():
-                    health = validate_webui_health(discovered_url)
+                    health = self._cached_health(discovered_url, session=client.session)
 
+                    self._last_connect_fail = None
                     self.api_connected = True
                     self.client = client
+                    self._invalidate_api_listings(client.base_url)
                     self.pipeline = Pipeline(client, self.structured_logger)
                     self.controller.set_pipeline(self.pipeline)
 
@@ -2677,6 +2808,7 @@ class StableNewGUI:
                     return
 
             # Connection failed
+            self._last_connect_fail = (api_url, time.monotonic())
             self.api_connected = False
             self.root.after(0, lambda: self._update_api_status(False))
             self.log_message(
@@ -2684,7 +2816,7 @@ class StableNewGUI:
             )
             self.log_message("💡 Tip: Check ports 7860-7864, restart WebUI if needed", "INFO")
 
-        threading.Thread(target=check_in_thread, daemon=True).start()
+        self._io_executor.submit(check_in_thread)
         # Note: previously this method started two identical threads; that was redundant and has been removed
 
     def _update_api_status(self, connected: bool, url: str = None):
@@ -2699,27 +2831,17 @@ class StableNewGUI:
                 self.api_url_var.set(url)
                 self.log_message(f"Updated API URL to working port: {url}", "INFO")
 
-            # Refresh models, VAE, upscalers, and schedulers when connected
-            def refresh_all():
-                try:
-                    # Perform API calls in worker thread
-                    self._refresh_models_async()
-                    self._refresh_vae_models_async()
-                    self._refresh_hypernetworks_async()
-                    self._refresh_upscalers_async()
-                    self._refresh_schedulers_async()
-                except Exception as exc:
-                    # Marshal error message back to main thread
-                    # Capture exception in default argument to avoid closure issues
-                    self.root.after(
-                        0,
-                        lambda err=exc: self.log_message(
-                            f"⚠️ Failed to refresh model lists: {err}", "WARNING"
-                        ),
-                    )
-
-            # Run refresh in a separate thread to avoid blocking UI
-            threading.Thread(target=refresh_all, daemon=True).start()
+            # Refresh models, VAE, upscalers, and schedulers when connected.
+            # Each refresh submits its API call to the shared executor, where they run
+            # concurrently; widgets are updated on the Tk thread as each one completes.
+            try:
+                self._refresh_models_async()
+                self._refresh_vae_models_async()
+                self._refresh_hypernetworks_async()
+                self._refresh_upscalers_async()
+                self._refresh_schedulers_async()
+            except Exception as exc:
+                self.log_message(f"⚠️ Failed to refresh model lists: {exc}", "WARNING")
         else:
             if hasattr(self, "api_status_panel"):
                 self.api_status_panel.set_status("Disconnected", "red")
@@ -2738,26 +2860,44 @@ class StableNewGUI:
             )
         # Update internal state
         self.selected_packs = selected_packs
+        self._last_selected_pack = selected_packs[0] if selected_packs else None
+
+        # Arrow keys and shift-drags report every intermediate row; only the final
+        # selection is logged and drives the (disk-reading) config refresh
+        self._debounce_pack_selection()
+        if getattr(self, "_diag_enabled", False):
+            logger.info("[DIAG] mediator _on_pack_selection_changed_mediator end")
+
+    def _debounce_pack_selection(self) -> None:
+        """Run _do_pack_selection_changed 150 ms after the last selection event"""
+        if self._pack_sel_after_id is not None:
+            try:
+                self.root.after_cancel(self._pack_sel_after_id)
+            except Exception:
+                pass
+        self._pack_sel_after_id = self.root.after(150, self._do_pack_selection_changed)
 
-        if selected_packs:
-            pack_name = selected_packs[0]
+    def _do_pack_selection_changed(self) -> None:
+        """Log the settled pack selection and refresh the configuration for it"""
+        self._pack_sel_after_id = None
+        pack_name = self._last_selected_pack
+        if pack_name:
             self.log_message(f"📦 Selected pack: {pack_name}")
-            self._last_selected_pack = pack_name
         else:
             self.log_message("No pack selected")
-            self._last_selected_pack = None
 
         # Refresh configuration for selected pack
         self._refresh_config()
-        if getattr(self, "_diag_enabled", False):
-            logger.info("[DIAG] mediator _on_pack_selection_changed_mediator end")
 
     def _on_pack_selection_changed(self, event=None):
         """Handle prompt pack selection changes - update config display dynamically"""
         selected_indices = self.packs_listbox.curselection()
+        if selected_indices and selected_indices == self._last_cursel:
+            # Same selection as last time (focus change, restored selection): nothing to do
+            return
+        self._last_cursel = selected_indices
         if selected_indices:
             pack_name = self.packs_listbox.get(selected_indices[0])
-            self.log_message(f"📦 Selected pack: {pack_name}")
 
             # Store current selection to prevent unwanted deselection
             self._last_selected_pack = pack_name
@@ -2771,24 +2911,19 @@ class StableNewGUI:
                 self._preserve_pack_selection()
                 return  # Don't proceed if we're restoring selection
             else:
-                self.log_message("No pack selected")
                 self._last_selected_pack = None
 
-        # Refresh configuration for selected pack
-        self._refresh_config()
+        # Log and refresh configuration once the selection settles
+        self._debounce_pack_selection()
 
         # Highlight selection with custom styling
         self._update_selection_highlights()
 
     def _update_selection_highlights(self):
         """Update visual highlighting for selected items"""
-        # Reset all items to default background
-        for i in range(self.packs_listbox.size()):
-            self.packs_listbox.itemconfig(i, {"bg": "#3d3d3d"})
-
-        # Highlight selected items
-        for index in self.packs_listbox.curselection():
-            self.packs_listbox.itemconfig(index, {"bg": "#0078d4"})
+        # packs_listbox belongs to the panel, which tracks the painted rows and only
+        # repaints the ones whose selection state changed
+        self.prompt_pack_panel._update_selection_highlights()
 
     def _initialize_ui_state(self):
         logger.info("[DIAG] _initialize_ui_state: entered method", extra={"flush": True})
@@ -2857,7 +2992,7 @@ class StableNewGUI:
 
         def scan_and_populate():
             try:
-                packs_dir = Path("packs")
+                packs_dir = self._packs_dir
                 pack_files = get_prompt_packs(packs_dir)
                 self.root.after(0, lambda: self.prompt_pack_panel.populate(pack_files))
                 self.root.after(
@@ -2868,7 +3003,16 @@ class StableNewGUI:
                     0, lambda err=exc: self.log_message(f"? Failed to load packs: {err}", "WARNING")
                 )
 
-        threading.Thread(target=scan_and_populate, daemon=True).start()
+        self._io_executor.submit(scan_and_populate)
+
+    def _selected_pack_names(self) -> list[str]:
+        """Names of the selected packs: one curselection call, indexed in Python."""
+        indices = self.packs_listbox.curselection()
+        names = getattr(getattr(self, "prompt_pack_panel", None), "pack_names", None)
+        if not isinstance(names, list) or (indices and indices[-1] >= len(names)):
+            # Listbox filled outside the panel: fall back to a single ranged get
+            return _listbox_items(self.packs_listbox, indices)
+        return [names[i] for i in indices]
 
     def _refresh_config(self):
         """Refresh configuration based on pack selection and override state"""
@@ -2882,8 +3026,7 @@ class StableNewGUI:
 
         self._refreshing_config = True
         try:
-            selected_indices = self.packs_listbox.curselection()
-            selected_packs = [self.packs_listbox.get(i) for i in selected_indices]
+            selected_packs = self._selected_pack_names()
 
             # Update UI state based on selection and override mode
             if self.override_pack_var.get():
@@ -2910,7 +3053,7 @@ class StableNewGUI:
         self._set_config_editable(True)
 
         # Update status messages
-        if hasattr(self, "current_pack_label"):
+        if self.current_pack_label is not None:
             self.current_pack_label.configure(
                 text=f"Override mode: {len(selected_packs)} packs selected", foreground="#ffa500"
             )
@@ -2944,7 +3087,7 @@ class StableNewGUI:
         self._set_config_editable(True)
 
         # Update status
-        if hasattr(self, "current_pack_label"):
+        if self.current_pack_label is not None:
             if self.override_pack_var.get():
                 self.current_pack_label.configure(text=f"Pack: {pack_name} (Override)", foreground="#ffa500")
             else:
@@ -2977,7 +3120,7 @@ class StableNewGUI:
         self._set_config_editable(True)
 
         # Update status
-        if hasattr(self, "current_pack_label"):
+        if self.current_pack_label is not None:
             if self.override_pack_var.get():
                 self.current_pack_label.configure(
                     text=f"{len(selected_packs)} packs (Override)", foreground="#ffa500"
@@ -3008,7 +3151,7 @@ class StableNewGUI:
             self.current_config = preset_config
 
         # Update status
-        if hasattr(self, "current_pack_label"):
+        if self.current_pack_label is not None:
             self.current_pack_label.configure(text="No pack selected", foreground="#ff6666")
 
         self._show_config_status(f"Showing preset config: {self.preset_var.get()}")
@@ -3023,31 +3166,44 @@ class StableNewGUI:
         if hasattr(self, "config_panel"):
             self.config_panel.set_status_message(message)
 
-    def _get_config_from_forms(self) -> dict[str, Any]:
-        """Extract current configuration from GUI forms"""
-        config = {"txt2img": {}, "img2img": {}, "upscale": {}, "api": {}}
-        # 1) Start with ConfigPanel values if present
-        if hasattr(self, "config_panel") and self.config_panel is not None:
-            try:
-                config = self.config_panel.get_config()
-            except Exception as exc:
-                self.log_message(f"Error reading config from panel: {exc}", "ERROR")
-        # 2) Overlay with values from this form if available (authoritative when present)
-        try:
-            if hasattr(self, "txt2img_vars"):
-                for k, v in self.txt2img_vars.items():
-                    config.setdefault("txt2img", {})[k] = v.get()
-            if hasattr(self, "img2img_vars"):
-                for k, v in self.img2img_vars.items():
-                    config.setdefault("img2img", {})[k] = v.get()
-            if hasattr(self, "upscale_vars"):
-                for k, v in self.upscale_vars.items():
-                    config.setdefault("upscale", {})[k] = v.get()
-        except Exception as exc:
-            self.log_message(f"Error overlaying config from main form: {exc}", "ERROR")
+    def _get_config_from_forms(self, panel_config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Extract current configuration from GUI forms.
 
-        # 3) Pipeline controls
-        if hasattr(self, "pipeline_controls_panel") and self.pipeline_controls_panel is not None:
+        Args:
+            panel_config: Stage/API config already read from the ConfigPanel (e.g. the
+                dict passed to ``on_config_save``). When given, the panel vars are not
+                read again and only the remaining sections are collected.
+        """
+        if panel_config is not None:
+            config = panel_config
+        else:
+            config = {"txt2img": {}, "img2img": {}, "upscale": {}, "api": {}}
+            # 1) Start with ConfigPanel values if present
+            if hasattr(self, "config_panel") and self.config_panel is not None:
+                try:
+                    config = self.config_panel.get_config()
+                except Exception as exc:
+                    self.log_message(f"Error reading config from panel: {exc}", "ERROR")
+            # 2) Overlay with values from this form if available (authoritative when present)
+            try:
+                if self.txt2img_vars is not None:
+                    self._overlay_form_values(config, "txt2img", self.txt2img_vars)
+                # The additional prompt Text widgets are the source of truth (no StringVar)
+                if self.pos_text is not None:
+                    config.setdefault("txt2img", {})["prompt"] = self.pos_text.get("1.0", "end-1c")
+                if self.neg_text is not None:
+                    config.setdefault("txt2img", {})["negative_prompt"] = self.neg_text.get(
+                        "1.0", "end-1c"
+                    )
+                if self.img2img_vars is not None:
+                    self._overlay_form_values(config, "img2img", self.img2img_vars)
+                if self.upscale_vars is not None:
+                    self._overlay_form_values(config, "upscale", self.upscale_vars)
+            except Exception as exc:
+                self.log_message(f"Error overlaying config from main form: {exc}", "ERROR")
+
+        # 3) Pipeline controls
+        if hasattr(self, "pipeline_controls_panel") and self.pipeline_controls_panel is not None:
             try:
                 config["pipeline"] = self.pipeline_controls_panel.get_settings()
             except Exception:
@@ -3070,24 +3226,45 @@ class StableNewGUI:
             config["aesthetic"] = {}
 
         return config
+
+    def _overlay_form_values(self, config: dict, section: str, vars_dict: dict) -> None:
+        """Copy ``vars_dict`` into ``config[section]``, warning about unparsable fields."""
+        values, skipped = _form_values(vars_dict)
+        config.setdefault(section, {}).update(values)
+        if skipped:
+            self.log_message(
+                f"⚠️ Ignoring invalid {section} value(s) for: {', '.join(skipped)}", "WARNING"
+            )
+
     def _attach_summary_traces(self) -> None:
         """Attach change traces to update live summaries."""
         if getattr(self, "_summary_traces_attached", False):
             return
         try:
-            def attach_dict(dct: dict):
+            def forget_loaded_config(*_):
+                # Forms diverged from the last loaded config; allow the next load through
+                self._last_loaded_config_hash = None
+
+            def on_var_write(*_):
+                forget_loaded_config()
+                self._mark_config_dirty()
+
+            def attach_dict(dct: dict, callback=on_var_write):
                 for var in dct.values():
                     try:
-                        var.trace_add("write", lambda *_: self._update_live_config_summary())
+                        var.trace_add("write", callback)
                     except Exception:
                         pass
 
-            if hasattr(self, "txt2img_vars"):
+            if self.txt2img_vars is not None:
                 attach_dict(self.txt2img_vars)
-            if hasattr(self, "img2img_vars"):
+            if self.img2img_vars is not None:
                 attach_dict(self.img2img_vars)
-            if hasattr(self, "upscale_vars"):
+            if self.upscale_vars is not None:
                 attach_dict(self.upscale_vars)
+            if self.api_vars is not None:
+                # Not shown in any summary, but set_config writes them too
+                attach_dict(self.api_vars, forget_loaded_config)
             if hasattr(self, "pipeline_controls_panel"):
                 p = self.pipeline_controls_panel
                 for v in (
@@ -3096,28 +3273,42 @@ class StableNewGUI:
                     getattr(p, "upscale_enabled", None),
                 ):
                     try:
-                        v and v.trace_add("write", lambda *_: self._update_live_config_summary())
+                        v and v.trace_add("write", lambda *_: self._mark_config_dirty())
                     except Exception:
                         pass
             self._summary_traces_attached = True
         except Exception:
             pass
 
+    def _mark_config_dirty(self) -> None:
+        """Coalesce form edits: the summaries are rebuilt once, when Tk is next idle."""
+        if self._config_dirty:
+            return
+        self._config_dirty = True
+        self.root.after_idle(self._rebuild_config)
+
+    def _rebuild_config(self) -> None:
+        """Re-read the form vars for the live summaries after a burst of edits."""
+        self._config_dirty = False
+        self._update_live_config_summary()
+
     def _update_live_config_summary(self) -> None:
         """Compute and render the per-tab "next run" summaries from current vars."""
         try:
             # txt2img summary
-            if hasattr(self, "txt2img_vars") and hasattr(self, "txt2img_summary_var"):
+            if self.txt2img_vars is not None and hasattr(self, "txt2img_summary_var"):
                 t = self.txt2img_vars
                 steps = t.get("steps").get() if "steps" in t else "-"
                 sampler = t.get("sampler_name").get() if "sampler_name" in t else "-"
                 cfg = t.get("cfg_scale").get() if "cfg_scale" in t else "-"
                 width = t.get("width").get() if "width" in t else "-"
                 height = t.get("height").get() if "height" in t else "-"
-                self.txt2img_summary_var.set(f"Next run: steps {steps}, sampler {sampler}, cfg {cfg}, size {width}x{height}")
+                self.txt2img_summary_var.set(
+                    f"Next run: steps {steps}, sampler {sampler}, cfg {cfg}, size {width}x{height}"
+                )
 
             # img2img summary
-            if hasattr(self, "img2img_vars") and hasattr(self, "img2img_summary_var"):
+            if self.img2img_vars is not None and hasattr(self, "img2img_summary_var"):
                 i2i = self.img2img_vars
                 steps = i2i.get("steps").get() if "steps" in i2i else "-"
                 denoise = i2i.get("denoising_strength").get() if "denoising_strength" in i2i else "-"
@@ -3125,7 +3316,7 @@ class StableNewGUI:
                 self.img2img_summary_var.set(f"Next run: steps {steps}, denoise {denoise}, sampler {sampler}")
 
             # upscale summary
-            if hasattr(self, "upscale_vars") and hasattr(self, "upscale_summary_var"):
+            if self.upscale_vars is not None and hasattr(self, "upscale_summary_var"):
                 up = self.upscale_vars
                 mode = (up.get("upscale_mode").get() if "upscale_mode" in up else "single").lower()
                 scale = up.get("upscaling_resize").get() if "upscaling_resize" in up else "-"
@@ -3155,13 +3346,15 @@ class StableNewGUI:
             else:
                 self.log_message(f"Failed to save configuration for pack: {pack_name}", "ERROR")
 
+    def _log_enabled(self, level: str) -> bool:
+        """Return True when messages at ``level`` are currently emitted."""
+        return level in self._log_enabled_levels
+
     def log_message(self, message: str, level: str = "INFO"):
         """Add message to live log with safe console fallback."""
-        import datetime
-        import sys
-
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        if level not in self._log_enabled_levels:
+            return
+        log_entry = f"[{time.strftime('%H:%M:%S')}] {message}"
 
         # Prefer GUI log panel once available
         try:
@@ -3233,21 +3426,26 @@ class StableNewGUI:
         """
 
         container = ttk.Frame(parent, style="Dark.TFrame")
-        canvas = tk.Canvas(container, bg="#2b2b2b", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Dark.TFrame")
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
+        canvas, scrollable_frame, scrollbar = self._make_scrollable(container)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self._enable_mousewheel(canvas)
         return container, scrollable_frame
 
+    def _make_scrollable(self, parent: tk.Widget):
+        """
+        Return (canvas, inner_frame, scrollbar): a frame scrolled by a canvas, all unpacked.
+
+        The scrollregion follows the inner frame's size (see schedule_scrollregion).
+        """
+        canvas = tk.Canvas(parent, bg="#2b2b2b", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+        inner = ttk.Frame(canvas, style="Dark.TFrame")
+        inner.bind("<Configure>", lambda e, c=canvas: schedule_scrollregion(c))
+        canvas.create_window((0, 0), window=inner, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        return canvas, inner, scrollbar
+
     def _run_full_pipeline(self):
         """Run the complete pipeline"""
         if not self.api_connected:
@@ -3255,9 +3453,6 @@ class StableNewGUI:
             return
 
         # Controller-based, cancellable implementation (bypasses legacy thread path below)
-        from src.utils.file_io import read_prompt_pack
-
-        from .state import CancellationError
 
         selected_packs = self._get_selected_packs()
         if not selected_packs:
@@ -3389,18 +3584,24 @@ class StableNewGUI:
                 batch_size = batch_size_snapshot
                 rotate_cursor = 0
                 prompt_run_index = 0
+                # Per-pack invariants, resolved once instead of per prompt/variant
+                prompt_count = len(prompts)
+                rand_enabled = bool(rand_cfg.get("enabled"))
+                plan_variants = variant_plan.variants if variant_plan.active else []
+                plan_fanout = variant_plan.mode == "fanout"
+                plan_variant_count = len(plan_variants)
 
                 for i, prompt_data in enumerate(prompts):
                     if cancel.is_cancelled():
                         raise CancellationError("User cancelled during prompt loop")
                     prompt_text = prompt_data.get("positive", "")
                     self.log_message(
-                        f"📝 Prompt {i+1}/{len(prompts)}: {prompt_text[:50]}...",
+                        f"📝 Prompt {i+1}/{prompt_count}: {prompt_text[:50]}...",
                         "INFO",
                     )
 
                     randomized_variants = randomizer.generate(prompt_text)
-                    if rand_cfg.get("enabled") and len(randomized_variants) == 1:
+                    if rand_enabled and len(randomized_variants) == 1:
                         self.log_message(
                             "ℹ️ Randomization produced only one variant. Ensure prompt contains tokens (e.g. __mood__, [[slot]]) and rules have matches.",
                             "INFO",
@@ -3414,13 +3615,11 @@ class StableNewGUI:
                         if random_label:
                             self.log_message(f"🎲 Randomization: {random_label}", "INFO")
 
-                        if variant_plan.active and variant_plan.variants:
-                            if variant_plan.mode == "fanout":
-                                variants_to_run = variant_plan.variants
+                        if plan_variants:
+                            if plan_fanout:
+                                variants_to_run = plan_variants
                             else:
-                                variant = variant_plan.variants[
-                                    rotate_cursor % len(variant_plan.variants)
-                                ]
+                                variant = plan_variants[rotate_cursor % plan_variant_count]
                                 variants_to_run = [variant]
                                 rotate_cursor += 1
                         else:
@@ -3436,7 +3635,7 @@ class StableNewGUI:
                                 stage_variant_label = variant.label
                                 variant_index = variant.index
                                 self.log_message(
-                                    f"🎭 Variant {variant.index + 1}/{len(variant_plan.variants)}: {stage_variant_label}",
+                                    f"🎭 Variant {variant.index + 1}/{plan_variant_count}: {stage_variant_label}",
                                     "INFO",
                                 )
 
@@ -3511,7 +3710,10 @@ class StableNewGUI:
                 output_dir = result.get("output_dir", "") if result else ""
             except Exception:
                 num_images, output_dir = 0, ""
-            self.log_message(f"🎉 Pipeline completed: {num_images} image(s)", "SUCCESS")
+            if self._log_enabled("SUCCESS"):
+                self.log_message(f"🎉 Pipeline completed: {num_images} image(s)", "SUCCESS")
+            if not self._log_enabled("INFO"):
+                return
             if output_dir:
                 self.log_message(f"📂 Output: {output_dir}", "INFO")
             # Combined summary of effective weights
@@ -3618,12 +3820,11 @@ class StableNewGUI:
             return
 
         self.log_message("🎨 Running txt2img only...", "INFO")
+        # Read the listbox here, on the Tk thread
+        selected_packs = _listbox_items(self.packs_listbox, selected_indices)
 
         def txt2img_thread():
             try:
-                # Get selected packs
-                selected_packs = [self.packs_listbox.get(i) for i in selected_indices]
-
                 # Create run directory
                 run_dir = self.structured_logger.create_run_directory("txt2img_only")
 
@@ -3632,7 +3833,7 @@ class StableNewGUI:
                     self.log_message(f"Processing pack: {pack_name}", "INFO")
 
                     # Load prompts from pack
-                    pack_path = Path("packs") / pack_name
+                    pack_path = self._packs_dir / pack_name
                     prompts = read_prompt_pack(pack_path)
 
                     if not prompts:
@@ -3642,31 +3843,36 @@ class StableNewGUI:
                     # Get pack-specific overrides
                     pack_overrides = self.config_manager.get_pack_overrides(pack_path.stem)
                     pack_config = self.config_manager.resolve_config("default", pack_overrides)
-
-                    # Generate images for each prompt
+                    # Every prompt in the pack shares one stage config, so the pipeline
+                    # selects the model/VAE and builds the payload once for the group
+                    txt2img_config = pack_config.get("txt2img", {})
+                    prompt_count = len(prompts)
+
+                    # Lazy: each next() sends one prompt's request, so progress is logged
+                    # per prompt as the pack runs
+                    batch = self.pipeline.iter_txt2img_batch(
+                        prompts=[prompt_data["positive"] for prompt_data in prompts],
+                        config=txt2img_config,
+                        run_dir=run_dir,
+                        batch_size=1,
+                    )
                     for i, prompt_data in enumerate(prompts):
+                        self.log_message(
+                            f"Generating image {i+1}/{prompt_count}: {prompt_data['positive'][:50]}...",
+                            "INFO",
+                        )
                         try:
-                            self.log_message(
-                                f"Generating image {i+1}/{len(prompts)}: {prompt_data['positive'][:50]}...",
-                                "INFO",
-                            )
-
-                            # Run txt2img using the pipeline
-                            results = self.pipeline.run_txt2img(
-                                prompt=prompt_data["positive"],
-                                config=pack_config.get("txt2img", {}),
-                                run_dir=run_dir,
-                                batch_size=1,
-                            )
-
-                            if results:
-                                self.log_message(f"✅ Generated {len(results)} images", "SUCCESS")
-                            else:
-                                self.log_message(f"❌ Failed to generate image {i+1}", "ERROR")
-
+                            results = next(batch, None)
                         except Exception as e:
                             self.log_message(f"❌ Error generating image {i+1}: {str(e)}", "ERROR")
-                            continue
+                            break
+                        if results is None:
+                            break
+
+                        if results:
+                            self.log_message(f"✅ Generated {len(results)} images", "SUCCESS")
+                        else:
+                            self.log_message(f"❌ Failed to generate image {i+1}", "ERROR")
 
                 self.log_message("🎉 Txt2img generation completed!", "SUCCESS")
 
@@ -3674,11 +3880,7 @@ class StableNewGUI:
                 self.log_message(f"❌ Txt2img generation failed: {str(e)}", "ERROR")
 
         # Run in background thread
-        import threading
-
-        thread = threading.Thread(target=txt2img_thread)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(txt2img_thread)
 
     def _run_upscale_only(self):
         """Run upscaling on existing images"""
@@ -3715,45 +3917,20 @@ class StableNewGUI:
             except Exception as e:
                 self.log_message(f"Upscaling failed: {e}", "ERROR")
 
-        threading.Thread(target=upscale_thread, daemon=True).start()
-
-    def _create_video(self):
-        """Create video from image sequence"""
-        # Open folder dialog to select image directory
-        folder_path = filedialog.askdirectory(title="Select Image Directory")
-        if not folder_path:
-            return
-
-        def video_thread():
-            try:
-                image_dir = Path(folder_path)
-                image_files = []
-
-                for ext in ["*.png", "*.jpg", "*.jpeg"]:
-                    image_files.extend(image_dir.glob(ext))
-
-                if not image_files:
-                    self.log_message("No images found in selected directory", "WARNING")
-                    return
-
-                # Create output video path
-                video_path = image_dir / "output_video.mp4"
+        self._run_in_background(upscale_thread)
 
-                self.log_message(f"Creating video from {len(image_files)} images...", "INFO")
-
-                success = self.video_creator.create_video_from_images(
-                    image_files, video_path, fps=24
-                )
-
-                if success:
-                    self.log_message(f"✅ Video created: {video_path}", "SUCCESS")
-                else:
-                    self.log_message("❌ Video creation failed", "ERROR")
-
-            except Exception as e:
-                self.log_message(f"Video creation failed: {e}", "ERROR")
-
-        threading.Thread(target=video_thread, daemon=True).start()
+    def _pack_names_on_disk(self) -> frozenset[str]:
+        """File names in the packs directory, rescanned only when its mtime changes."""
+        try:
+            mtime = self._packs_dir.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+        cached = self._pack_names_cache
+        if cached is None or cached[0] != mtime:
+            with os.scandir(self._packs_dir) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+            cached = self._pack_names_cache = (mtime, names)
+        return cached[1]
 
     def _get_selected_packs(self) -> list[Path]:
         """Resolve the currently selected prompt packs in UI order."""
@@ -3771,16 +3948,16 @@ class StableNewGUI:
 
         if not pack_names and hasattr(self, "packs_listbox"):
             try:
-                selected_indices = self.packs_listbox.curselection()
-                pack_names = [self.packs_listbox.get(i) for i in selected_indices]
+                pack_names = self._selected_pack_names()
             except Exception:
                 pack_names = []
 
-        packs_dir = Path("packs")
+        packs_dir = self._packs_dir
+        on_disk = self._pack_names_on_disk()
         resolved: list[Path] = []
         for pack_name in pack_names:
             pack_path = packs_dir / pack_name
-            if pack_path.exists():
+            if pack_name in on_disk:
                 resolved.append(pack_path)
             else:
                 self.log_message(f"⚠️ Pack not found on disk: {pack_path}", "WARNING")
@@ -3810,9 +3987,12 @@ class StableNewGUI:
 
     def _stop_execution(self):
         """Stop the running pipeline"""
+        cancelled = self._cancel_pending_background()
+        if cancelled:
+            self.log_message(f"⏹️ Cancelled {cancelled} queued task(s)", "WARNING")
         if self.controller.stop_pipeline():
             self.log_message("⏹️ Stop requested - cancelling pipeline...", "WARNING")
-        else:
+        elif not cancelled:
             self.log_message("⏹️ No pipeline running", "INFO")
 
     def _open_prompt_editor(self):
@@ -3822,46 +4002,52 @@ class StableNewGUI:
 
         if selected_indices:
             pack_name = self.packs_listbox.get(selected_indices[0])
-            pack_path = Path("packs") / pack_name
+            pack_path = self._packs_dir / pack_name
 
         # Initialize advanced editor if not already done
-        if not hasattr(self, "advanced_editor"):
+        if self.advanced_editor is None:
             self.advanced_editor = AdvancedPromptEditor(
                 parent_window=self.root,
                 config_manager=self.config_manager,
                 on_packs_changed=self._refresh_prompt_packs,
-                on_validation=self._handle_editor_validation,
+                on_validation=self._dispatch_validation,
+                validation_executor=self._val_pool,
             )
 
         # Open editor with selected pack
         self.advanced_editor.open_editor(pack_path)
 
+    def _dispatch_validation(self, results):
+        """Log editor validation results on a later Tk tick so the editor repaints first."""
+        self.root.after(0, self._handle_editor_validation, results)
+
     def _handle_editor_validation(self, results):
         """Handle validation results from the prompt editor"""
         # Log validation summary
-        error_count = len(results.get("errors", []))
-        warning_count = len(results.get("warnings", []))
-    # info_count = len(results.get("info", []))  # Removed unused variable
+        errors = results.get("errors") or ()
+        warnings = results.get("warnings") or ()
+        stats = results.get("stats") or {}
+        error_count = len(errors)
+        warning_count = len(warnings)
 
         if error_count == 0 and warning_count == 0:
             self.log_message("✅ Pack validation passed - no issues found", "SUCCESS")
         else:
             if error_count > 0:
                 self.log_message(f"❌ Pack validation found {error_count} error(s)", "ERROR")
-                for error in results["errors"][:3]:  # Show first 3 errors
+                for error in errors[:3]:  # Show first 3 errors
                     self.log_message(f"  • {error}", "ERROR")
                 if error_count > 3:
                     self.log_message(f"  ... and {error_count - 3} more", "ERROR")
 
             if warning_count > 0:
                 self.log_message(f"⚠️  Pack has {warning_count} warning(s)", "WARNING")
-                for warning in results["warnings"][:2]:  # Show first 2 warnings
+                for warning in warnings[:2]:  # Show first 2 warnings
                     self.log_message(f"  • {warning}", "WARNING")
                 if warning_count > 2:
                     self.log_message(f"  ... and {warning_count - 2} more", "WARNING")
 
         # Show stats
-        stats = results.get("stats", {})
         self.log_message(
             f"📊 Pack stats: {stats.get('prompt_count', 0)} prompts, "
             f"{stats.get('embedding_count', 0)} embeddings, "
@@ -3907,8 +4093,23 @@ class StableNewGUI:
         except Exception:
             pass
 
+        try:
+            self._api_executor.shutdown(wait=False)
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._val_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+
+        try:
+            self.controller.set_log_callback(None)
+        except Exception:
+            pass
+        self._close_log_wake_pipe()
+
+        # Let mainloop unwind first; tear the widget tree down in one idle task
+        self.root.after(0, self.root.destroy)
         self.root.quit()
-        self.root.destroy()
 
     def run(self):
         """Start the GUI application"""
@@ -3948,1012 +4149,166 @@ class StableNewGUI:
     def run(self):
         """Start the Tkinter main loop with diagnostics."""
         logger.info("[DIAG] About to enter Tkinter mainloop", extra={"flush": True})
+        _tkinter.setbusywaitinterval(_BUSYWAIT_INTERVAL_MS)
         self.root.mainloop()
+        # quit() can end the loop before the deferred destroy() from _graceful_exit ran
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass
 
-    def _build_txt2img_config_tab(self, notebook):
-        """Build txt2img configuration form"""
-        tab_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(tab_frame, text="🎨 txt2img")
-
-        # Pack status header
-        pack_status_frame = ttk.Frame(tab_frame, style="Dark.TFrame")
-        pack_status_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        ttk.Label(
-            pack_status_frame, text="Current Pack:", style="Dark.TLabel", font=("Arial", 9, "bold")
-        ).pack(side=tk.LEFT)
-        self.current_pack_label = ttk.Label(
-            pack_status_frame,
-            text="No pack selected",
-            style="Dark.TLabel",
-            font=("Arial", 9),
-            foreground="#ffa500",
-        )
-        self.current_pack_label.pack(side=tk.LEFT, padx=(5, 0))
-
-        # Override controls
-        override_frame = ttk.Frame(tab_frame, style="Dark.TFrame")
-        override_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        self.override_pack_var = tk.BooleanVar(value=False)
-        override_checkbox = ttk.Checkbutton(
-            override_frame,
-            text="Override pack settings with current config",
-            variable=self.override_pack_var,
-            style="Dark.TCheckbutton",
-            command=self._on_override_changed,
-        )
-        override_checkbox.pack(side=tk.LEFT)
-
-        ttk.Separator(tab_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=10, pady=5)
-
-        # Create scrollable frame
-        canvas = tk.Canvas(tab_frame, bg="#2b2b2b")
-        scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Dark.TFrame")
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Initialize config variables and widget references
-        self.txt2img_vars = {}
-        self.txt2img_widgets = {}
-
-        # Compact generation settings
-        gen_frame = ttk.LabelFrame(
-            scrollable_frame, text="Generation Settings", style="Dark.TFrame", padding=5
-        )
-        gen_frame.pack(fill=tk.X, pady=2)
-
-        # Steps - compact inline
-        steps_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        steps_row.pack(fill=tk.X, pady=2)
-        ttk.Label(steps_row, text="Generation Steps:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.txt2img_vars["steps"] = tk.IntVar(value=20)
-        steps_spin = ttk.Spinbox(
-            steps_row, from_=1, to=150, width=8, textvariable=self.txt2img_vars["steps"]
-        )
-        steps_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["steps"] = steps_spin
-
-        # Sampler - compact inline
-        sampler_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        sampler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(sampler_row, text="Sampler:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["sampler_name"] = tk.StringVar(value="Euler a")
-        sampler_combo = ttk.Combobox(
-            sampler_row,
-            textvariable=self.txt2img_vars["sampler_name"],
-            values=[
-                "Euler a",
-                "Euler",
-                "LMS",
-                "Heun",
-                "DPM2",
-                "DPM2 a",
-                "DPM++ 2S a",
-                "DPM++ 2M",
-                "DPM++ SDE",
-                "DPM fast",
-                "DPM adaptive",
-                "LMS Karras",
-                "DPM2 Karras",
-                "DPM2 a Karras",
-                "DPM++ 2S a Karras",
-                "DPM++ 2M Karras",
-                "DPM++ SDE Karras",
-                "DDIM",
-                "PLMS",
-            ],
-            width=18,
-            state="readonly",
-        )
-        sampler_combo.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["sampler_name"] = sampler_combo
-
-        # CFG Scale - compact inline
-        cfg_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        cfg_row.pack(fill=tk.X, pady=2)
-        ttk.Label(cfg_row, text="CFG Scale:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["cfg_scale"] = tk.DoubleVar(value=7.0)
-        cfg_slider = EnhancedSlider(
-            cfg_row,
-            from_=1.0,
-            to=20.0,
-            variable=self.txt2img_vars["cfg_scale"],
-            resolution=0.1,
-            width=120,
-        )
-        cfg_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.txt2img_widgets["cfg_scale"] = cfg_slider
-
-        # Dimensions - compact single row
-        dims_frame = ttk.LabelFrame(
-            scrollable_frame, text="Image Dimensions", style="Dark.TFrame", padding=5
-        )
-        dims_frame.pack(fill=tk.X, pady=2)
-
-        dims_row = ttk.Frame(dims_frame, style="Dark.TFrame")
-        dims_row.pack(fill=tk.X)
-
-        ttk.Label(dims_row, text="Width:", style="Dark.TLabel", width=8).pack(side=tk.LEFT)
-        self.txt2img_vars["width"] = tk.IntVar(value=512)
-        width_combo = ttk.Combobox(
-            dims_row,
-            textvariable=self.txt2img_vars["width"],
-            values=[256, 320, 384, 448, 512, 576, 640, 704, 768, 832, 896, 960, 1024],
-            width=8,
-        )
-        width_combo.pack(side=tk.LEFT, padx=(2, 10))
-        self.txt2img_widgets["width"] = width_combo
-
-        ttk.Label(dims_row, text="Height:", style="Dark.TLabel", width=8).pack(side=tk.LEFT)
-        self.txt2img_vars["height"] = tk.IntVar(value=512)
-        height_combo = ttk.Combobox(
-            dims_row,
-            textvariable=self.txt2img_vars["height"],
-            values=[256, 320, 384, 448, 512, 576, 640, 704, 768, 832, 896, 960, 1024],
-            width=8,
-        )
-        height_combo.pack(side=tk.LEFT, padx=2)
-        self.txt2img_widgets["height"] = height_combo
-
-        # Advanced Settings
-        advanced_frame = ttk.LabelFrame(
-            scrollable_frame, text="Advanced Settings", style="Dark.TFrame", padding=5
-        )
-        advanced_frame.pack(fill=tk.X, pady=2)
-
-        # Seed controls
-        seed_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        seed_row.pack(fill=tk.X, pady=2)
-        ttk.Label(seed_row, text="Seed:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["seed"] = tk.IntVar(value=-1)
-        seed_spin = ttk.Spinbox(
-            seed_row, from_=-1, to=2147483647, width=12, textvariable=self.txt2img_vars["seed"]
-        )
-        seed_spin.pack(side=tk.LEFT, padx=(5, 5))
-        self.txt2img_widgets["seed"] = seed_spin
-        ttk.Button(
-            seed_row,
-            text="🎲 Random",
-            command=lambda: self.txt2img_vars["seed"].set(-1),
-            width=10,
-            style="Dark.TButton",
-        ).pack(side=tk.LEFT, padx=(5, 0))
-
-        # CLIP Skip
-        clip_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        clip_row.pack(fill=tk.X, pady=2)
-        ttk.Label(clip_row, text="CLIP Skip:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["clip_skip"] = tk.IntVar(value=2)
-        clip_spin = ttk.Spinbox(
-            clip_row, from_=1, to=12, width=8, textvariable=self.txt2img_vars["clip_skip"]
-        )
-        clip_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["clip_skip"] = clip_spin
-
-        # Scheduler
-        scheduler_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        scheduler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(scheduler_row, text="Scheduler:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.txt2img_vars["scheduler"] = tk.StringVar(value="normal")
-        scheduler_combo = ttk.Combobox(
-            scheduler_row,
-            textvariable=self.txt2img_vars["scheduler"],
-            values=[
-                "normal",
-                "Karras",
-                "exponential",
-                "sgm_uniform",
-                "simple",
-                "ddim_uniform",
-                "beta",
-                "linear",
-                "cosine",
-            ],
-            width=15,
-            state="readonly",
-        )
-        scheduler_combo.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["scheduler"] = scheduler_combo
+    def _save_all_config(self, config: dict[str, Any] | None = None):
+        """Save all configuration changes.
 
-        # Model Selection
-        model_frame = ttk.LabelFrame(
-            scrollable_frame, text="Model & VAE Selection", style="Dark.TFrame", padding=5
-        )
-        model_frame.pack(fill=tk.X, pady=2)
-
-        # SD Model
-        model_row = ttk.Frame(model_frame, style="Dark.TFrame")
-        model_row.pack(fill=tk.X, pady=2)
-        ttk.Label(model_row, text="SD Model:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["model"] = tk.StringVar(value="")
-        self.model_combo = ttk.Combobox(
-            model_row, textvariable=self.txt2img_vars["model"], width=40, state="readonly"
-        )
-        self.model_combo.pack(side=tk.LEFT, padx=(5, 5))
-        self.txt2img_widgets["model"] = self.model_combo
-        ttk.Button(
-            model_row, text="🔄", command=self._refresh_models, width=3, style="Dark.TButton"
-        ).pack(side=tk.LEFT)
+        Args:
+            config: Panel config supplied by the caller; the forms are read when omitted.
+        """
+        try:
+            # Build full config via form binder, reusing the caller's panel config if given
+            config = self._get_config_from_forms(config)
 
-        # VAE Model
-        vae_row = ttk.Frame(model_frame, style="Dark.TFrame")
-        vae_row.pack(fill=tk.X, pady=2)
-        ttk.Label(vae_row, text="VAE Model:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["vae"] = tk.StringVar(value="")
-        self.vae_combo = ttk.Combobox(
-            vae_row, textvariable=self.txt2img_vars["vae"], width=40, state="readonly"
-        )
-        self.vae_combo.pack(side=tk.LEFT, padx=(5, 5))
-        self.txt2img_widgets["vae"] = self.vae_combo
-        ttk.Button(
-            vae_row, text="🔄", command=self._refresh_vae_models, width=3, style="Dark.TButton"
-        ).pack(side=tk.LEFT)
+            # When packs are selected and not in override mode, persist to each selected pack
+            selected = []
+            if hasattr(self, "packs_listbox"):
+                selected = self._selected_pack_names()
+            # Fallback: if UI focus cleared the visual selection, use last-known pack
+            if (not selected) and hasattr(self, "_last_selected_pack") and self._last_selected_pack:
+                selected = [self._last_selected_pack]
 
-        # Hires.Fix Settings
-        hires_frame = ttk.LabelFrame(
-            scrollable_frame, text="High-Res Fix (Hires.fix)", style="Dark.TFrame", padding=5
-        )
-        hires_frame.pack(fill=tk.X, pady=2)
-
-        # Enable Hires.fix checkbox
-        hires_enable_row = ttk.Frame(hires_frame, style="Dark.TFrame")
-        hires_enable_row.pack(fill=tk.X, pady=2)
-        self.txt2img_vars["enable_hr"] = tk.BooleanVar(value=False)
-        hires_check = ttk.Checkbutton(
-            hires_enable_row,
-            text="Enable High-Resolution Fix",
-            variable=self.txt2img_vars["enable_hr"],
-            style="Dark.TCheckbutton",
-            command=self._on_hires_toggle,
-        )
-        hires_check.pack(side=tk.LEFT)
-        self.txt2img_widgets["enable_hr"] = hires_check
-
-        # Hires scale
-        scale_row = ttk.Frame(hires_frame, style="Dark.TFrame")
-        scale_row.pack(fill=tk.X, pady=2)
-        ttk.Label(scale_row, text="Scale Factor:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.txt2img_vars["hr_scale"] = tk.DoubleVar(value=2.0)
-        scale_spin = ttk.Spinbox(
-            scale_row,
-            from_=1.1,
-            to=4.0,
-            increment=0.1,
-            width=8,
-            textvariable=self.txt2img_vars["hr_scale"],
-        )
-        scale_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["hr_scale"] = scale_spin
-
-        # Hires upscaler
-        upscaler_row = ttk.Frame(hires_frame, style="Dark.TFrame")
-        upscaler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(upscaler_row, text="HR Upscaler:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.txt2img_vars["hr_upscaler"] = tk.StringVar(value="Latent")
-        hr_upscaler_combo = ttk.Combobox(
-            upscaler_row,
-            textvariable=self.txt2img_vars["hr_upscaler"],
-            values=[
-                "Latent",
-                "Latent (antialiased)",
-                "Latent (bicubic)",
-                "Latent (bicubic antialiased)",
-                "Latent (nearest)",
-                "Latent (nearest-exact)",
-                "None",
-                "Lanczos",
-                "Nearest",
-                "LDSR",
-                "BSRGAN",
-                "ESRGAN_4x",
-                "R-ESRGAN General 4xV3",
-                "ScuNET GAN",
-                "ScuNET PSNR",
-                "SwinIR 4x",
-            ],
-            width=20,
-            state="readonly",
-        )
-        hr_upscaler_combo.pack(side=tk.LEFT, padx=(5, 0))
-        self.txt2img_widgets["hr_upscaler"] = hr_upscaler_combo
-
-        # Hires denoising strength
-        hr_denoise_row = ttk.Frame(hires_frame, style="Dark.TFrame")
-        hr_denoise_row.pack(fill=tk.X, pady=2)
-        ttk.Label(hr_denoise_row, text="HR Denoising:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.txt2img_vars["denoising_strength"] = tk.DoubleVar(value=0.7)
-        hr_denoise_slider = EnhancedSlider(
-            hr_denoise_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.txt2img_vars["denoising_strength"],
-            resolution=0.05,
-            length=150,
-        )
-        hr_denoise_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.txt2img_widgets["denoising_strength"] = hr_denoise_slider
+            if selected and not self.override_pack_var.get():
+                saved_any = False
+                for pack_name in selected:
+                    if self.config_manager.save_pack_config(pack_name, config):
+                        saved_any = True
+                if saved_any:
+                    self.log_message(
+                        f"Saved configuration for {len(selected)} selected pack(s)", "SUCCESS"
+                    )
+                    self._show_config_status(
+                        f"Configuration saved for {len(selected)} selected pack(s)"
+                    )
+                    try:
+                        messagebox.showinfo(
+                            "Config Saved",
+                            f"Saved configuration for {len(selected)} selected pack(s)",
+                        )
+                    except Exception:
+                        pass
+                    self._show_saved_indicators()
+                else:
+                    self.log_message("Failed to save configuration for selected packs", "ERROR")
+            else:
+                # Save as current config and optionally preset (override/preset path)
+                self.current_config = config
+                preset_name = simpledialog.askstring(
+                    "Save Preset", "Enter preset name (optional):"
+                )
+                if preset_name:
+                    self.config_manager.save_preset(preset_name, config)
+                    self._presets_cache = None
+                    self.log_message(f"Saved configuration as preset: {preset_name}", "SUCCESS")
+                    try:
+                        messagebox.showinfo(
+                            "Preset Saved",
+                            f"Saved configuration as preset: {preset_name}",
+                        )
+                    except Exception:
+                        pass
+                    self._show_saved_indicators()
+                else:
+                    self.log_message("Configuration updated (not saved as preset)", "INFO")
+                    self._show_config_status("Configuration updated (not saved as preset)")
+                    self._show_saved_indicators()
 
-        # Additional Positive Prompt - compact
-        pos_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text="Additional Positive Prompt (appended to pack prompts)",
-            style="Dark.TFrame",
-            padding=5,
-        )
-        pos_frame.pack(fill=tk.X, pady=2)
-        self.txt2img_vars["prompt"] = tk.StringVar(value="")
-        self.pos_text = tk.Text(
-            pos_frame, height=2, bg="#3d3d3d", fg="#ffffff", wrap=tk.WORD, font=("Segoe UI", 9)
-        )
-        self.pos_text.pack(fill=tk.X, pady=2)
+        except Exception as e:
+            self.log_message(f"Failed to save configuration: {e}", "ERROR")
 
-        # Additional Negative Prompt - compact
-        neg_frame = ttk.LabelFrame(
-            scrollable_frame,
-            text="Additional Negative Prompt (appended to pack negative prompts)",
-            style="Dark.TFrame",
-            padding=5,
-        )
-        neg_frame.pack(fill=tk.X, pady=2)
-        self.txt2img_vars["negative_prompt"] = tk.StringVar(
-            value="blurry, bad quality, distorted, ugly, malformed"
-        )
-        self.neg_text = tk.Text(
-            neg_frame, height=2, bg="#3d3d3d", fg="#ffffff", wrap=tk.WORD, font=("Segoe UI", 9)
-        )
-        self.neg_text.pack(fill=tk.X, pady=2)
-        self.neg_text.insert(1.0, self.txt2img_vars["negative_prompt"].get())
+    def _show_saved_indicators(self) -> None:
+        """Flash the "Saved" indicator on the config panel and next to the top Save button."""
+        # Guarded separately so a panel failure cannot hide the top indicator
+        if getattr(self, "config_panel", None) is not None:
+            try:
+                self.config_panel.show_save_indicator("Saved")
+            except Exception:
+                logger.exception("Failed to show the config panel save indicator")
+        # show_top_save_indicator checks its own preconditions
+        self.show_top_save_indicator("Saved")
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        self._enable_mousewheel(canvas)
-        self._enable_mousewheel(canvas)
-        self._enable_mousewheel(canvas)
+    def _reset_all_config(self):
+        """Reset all configuration to defaults"""
+        defaults = self.config_manager.get_default_config()
+        self._load_config_into_forms(defaults, force=True)
+        self.log_message("Configuration reset to defaults", "INFO")
 
-        # Live summary for next run (txt2img)
+    def on_config_save(self, config: dict) -> None:
+        """Coordinator callback from ConfigPanel to save current settings."""
         try:
-            self.txt2img_summary_var = getattr(self, "txt2img_summary_var", tk.StringVar(value=""))
-            summary_frame = ttk.Frame(tab_frame, style="Dark.TFrame")
-            summary_frame.pack(fill=tk.X, padx=10, pady=(5, 8))
-            ttk.Label(
-                summary_frame,
-                textvariable=self.txt2img_summary_var,
-                style="Dark.TLabel",
-                font=("Consolas", 9),
-            ).pack(side=tk.LEFT)
+            self._save_all_config(config)
+            self._show_saved_indicators()
         except Exception:
             pass
 
-        # Attach traces and initialize summary text
+    def show_top_save_indicator(self, text: str = "Saved", duration_ms: int = 2000) -> None:
+        """Show a colored indicator next to the top Save button."""
+        if self.top_save_indicator_var is None:
+            return
         try:
-            self._attach_summary_traces()
-            self._update_live_config_summary()
+            is_saved = (text or "").lower() == "saved"
+            color = _STATUS_COLORS["saved"] if is_saved else _STATUS_COLORS["warning"]
+            self.top_save_indicator.configure(foreground=color)
+            self.top_save_indicator_var.set(text)
+            if duration_ms and is_saved:
+                self.root.after(duration_ms, lambda: self.top_save_indicator_var.set(""))
         except Exception:
             pass
 
-    def _build_img2img_config_tab(self, notebook):
-        """Build img2img configuration form"""
-        tab_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(tab_frame, text="🧹 img2img")
+    def _on_preset_changed(self, event=None):
+        """Handle preset dropdown selection changes.
 
-        # Create scrollable frame
-        canvas = tk.Canvas(tab_frame, bg="#2b2b2b")
-        scrollable_frame = ttk.Frame(canvas, style="Dark.TFrame")
+        Rapid successive changes are coalesced; only the last selection within
+        100 ms is logged.
+        """
+        if self._preset_log_after_id is not None:
+            try:
+                self.root.after_cancel(self._preset_log_after_id)
+            except Exception:
+                pass
+        self._preset_log_after_id = self.root.after(100, self._emit_preset_changed_log)
 
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+    def _emit_preset_changed_log(self):
+        """Log the settled preset selection unless it was already logged."""
+        self._preset_log_after_id = None
+        preset_name = self.preset_var.get()
+        if preset_name and preset_name != self._last_logged_preset:
+            self._last_logged_preset = preset_name
+            self.log_message(f"Preset selected: {preset_name} (click Load to apply)", "INFO")
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    def _debounce_preset_change(self, event=None):
+        """Load the preset once the dropdown selection settles for 200 ms.
 
-        # Initialize config variables
-        self.img2img_vars = {}
-        self.img2img_widgets = {}
+        Arrowing through the dropdown fires ``<<ComboboxSelected>>`` per step; only the
+        final choice is read from disk and pushed into the forms.
+        """
+        if self._preset_debounce_id is not None:
+            try:
+                self.root.after_cancel(self._preset_debounce_id)
+            except Exception:
+                pass
+        self._preset_debounce_id = self.root.after(200, self._on_preset_dropdown_changed)
 
-        # Generation Settings
-        gen_frame = ttk.LabelFrame(
-            scrollable_frame, text="Generation Settings", style="Dark.TFrame", padding=5
-        )
-        gen_frame.pack(fill=tk.X, pady=2)
+    def _on_preset_dropdown_changed(self):
+        """Handle preset dropdown selection changes"""
+        self._preset_debounce_id = None
+        # Snapshot Tk vars once; use the locals below
+        preset_name = self.preset_var.get()
+        if not preset_name:
+            return
+        override = bool(self.override_pack_var.get())
 
-        # Steps
-        steps_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        steps_row.pack(fill=tk.X, pady=2)
-        ttk.Label(steps_row, text="Steps:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["steps"] = tk.IntVar(value=15)
-        steps_spin = ttk.Spinbox(
-            steps_row, from_=1, to=150, width=8, textvariable=self.img2img_vars["steps"]
-        )
-        steps_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.img2img_widgets["steps"] = steps_spin
-
-        # Denoising Strength
-        denoise_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        denoise_row.pack(fill=tk.X, pady=2)
-        ttk.Label(denoise_row, text="Denoising:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["denoising_strength"] = tk.DoubleVar(value=0.3)
-        denoise_slider = EnhancedSlider(
-            denoise_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.img2img_vars["denoising_strength"],
-            resolution=0.01,
-            width=120,
-        )
-        denoise_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.img2img_widgets["denoising_strength"] = denoise_slider
-
-        # Sampler
-        sampler_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        sampler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(sampler_row, text="Sampler:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["sampler_name"] = tk.StringVar(value="Euler a")
-        sampler_combo = ttk.Combobox(
-            sampler_row,
-            textvariable=self.img2img_vars["sampler_name"],
-            values=[
-                "Euler a",
-                "Euler",
-                "LMS",
-                "Heun",
-                "DPM2",
-                "DPM2 a",
-                "DPM++ 2S a",
-                "DPM++ 2M",
-                "DPM++ SDE",
-                "DPM fast",
-                "DPM adaptive",
-                "LMS Karras",
-                "DPM2 Karras",
-                "DPM2 a Karras",
-                "DPM++ 2S a Karras",
-                "DPM++ 2M Karras",
-                "DPM++ SDE Karras",
-                "DDIM",
-                "PLMS",
-            ],
-            width=18,
-            state="readonly",
-        )
-        sampler_combo.pack(side=tk.LEFT, padx=(5, 0))
-        self.img2img_widgets["sampler_name"] = sampler_combo
-
-        # CFG Scale
-        cfg_row = ttk.Frame(gen_frame, style="Dark.TFrame")
-        cfg_row.pack(fill=tk.X, pady=2)
-        ttk.Label(cfg_row, text="CFG Scale:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["cfg_scale"] = tk.DoubleVar(value=7.0)
-        cfg_slider = EnhancedSlider(
-            cfg_row,
-            from_=1.0,
-            to=20.0,
-            variable=self.img2img_vars["cfg_scale"],
-            resolution=0.5,
-            length=150,
-        )
-        cfg_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.img2img_widgets["cfg_scale"] = cfg_slider
-
-        # Advanced Settings
-        advanced_frame = ttk.LabelFrame(
-            scrollable_frame, text="Advanced Settings", style="Dark.TFrame", padding=5
-        )
-        advanced_frame.pack(fill=tk.X, pady=2)
-
-        # Seed
-        seed_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        seed_row.pack(fill=tk.X, pady=2)
-        ttk.Label(seed_row, text="Seed:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["seed"] = tk.IntVar(value=-1)
-        seed_spin = ttk.Spinbox(
-            seed_row, from_=-1, to=2147483647, width=12, textvariable=self.img2img_vars["seed"]
-        )
-        seed_spin.pack(side=tk.LEFT, padx=(5, 5))
-        self.img2img_widgets["seed"] = seed_spin
-        ttk.Button(
-            seed_row,
-            text="🎲 Random",
-            command=lambda: self.img2img_vars["seed"].set(-1),
-            width=10,
-            style="Dark.TButton",
-        ).pack(side=tk.LEFT, padx=(5, 0))
-
-        # CLIP Skip
-        clip_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        clip_row.pack(fill=tk.X, pady=2)
-        ttk.Label(clip_row, text="CLIP Skip:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["clip_skip"] = tk.IntVar(value=2)
-        clip_spin = ttk.Spinbox(
-            clip_row, from_=1, to=12, width=8, textvariable=self.img2img_vars["clip_skip"]
-        )
-        clip_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.img2img_widgets["clip_skip"] = clip_spin
-
-        # Scheduler
-        scheduler_row = ttk.Frame(advanced_frame, style="Dark.TFrame")
-        scheduler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(scheduler_row, text="Scheduler:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.img2img_vars["scheduler"] = tk.StringVar(value="normal")
-        scheduler_combo = ttk.Combobox(
-            scheduler_row,
-            textvariable=self.img2img_vars["scheduler"],
-            values=[
-                "normal",
-                "Karras",
-                "exponential",
-                "sgm_uniform",
-                "simple",
-                "ddim_uniform",
-                "beta",
-                "linear",
-                "cosine",
-            ],
-            width=15,
-            state="readonly",
-        )
-        scheduler_combo.pack(side=tk.LEFT, padx=(5, 0))
-        self.img2img_widgets["scheduler"] = scheduler_combo
-
-        # Model Selection
-        model_frame = ttk.LabelFrame(
-            scrollable_frame, text="Model & VAE Selection", style="Dark.TFrame", padding=5
-        )
-        model_frame.pack(fill=tk.X, pady=2)
-
-        # SD Model
-        model_row = ttk.Frame(model_frame, style="Dark.TFrame")
-        model_row.pack(fill=tk.X, pady=2)
-        ttk.Label(model_row, text="SD Model:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["model"] = tk.StringVar(value="")
-        self.img2img_model_combo = ttk.Combobox(
-            model_row, textvariable=self.img2img_vars["model"], width=40, state="readonly"
-        )
-        self.img2img_model_combo.pack(side=tk.LEFT, padx=(5, 5))
-        self.img2img_widgets["model"] = self.img2img_model_combo
-        ttk.Button(
-            model_row, text="🔄", command=self._refresh_models, width=3, style="Dark.TButton"
-        ).pack(side=tk.LEFT)
-
-        # VAE Model
-        vae_row = ttk.Frame(model_frame, style="Dark.TFrame")
-        vae_row.pack(fill=tk.X, pady=2)
-        ttk.Label(vae_row, text="VAE Model:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.img2img_vars["vae"] = tk.StringVar(value="")
-        self.img2img_vae_combo = ttk.Combobox(
-            vae_row, textvariable=self.img2img_vars["vae"], width=40, state="readonly"
-        )
-        self.img2img_vae_combo.pack(side=tk.LEFT, padx=(5, 5))
-        self.img2img_widgets["vae"] = self.img2img_vae_combo
-        ttk.Button(
-            vae_row, text="🔄", command=self._refresh_vae_models, width=3, style="Dark.TButton"
-        ).pack(side=tk.LEFT)
-
-        canvas.pack(fill="both", expand=True)
-
-        # Live summary for next run (upscale)
-        try:
-            self.upscale_summary_var = getattr(self, "upscale_summary_var", tk.StringVar(value=""))
-            summary_frame = ttk.Frame(tab_frame, style="Dark.TFrame")
-            summary_frame.pack(fill=tk.X, padx=10, pady=(5, 8))
-            ttk.Label(
-                summary_frame,
-                textvariable=self.upscale_summary_var,
-                style="Dark.TLabel",
-                font=("Consolas", 9),
-            ).pack(side=tk.LEFT)
-        except Exception:
-            pass
-
-        try:
-            self._attach_summary_traces()
-            self._update_live_config_summary()
-        except Exception:
-            pass
-
-        # Live summary for next run (img2img)
-        try:
-            self.img2img_summary_var = getattr(self, "img2img_summary_var", tk.StringVar(value=""))
-            summary_frame = ttk.Frame(tab_frame, style="Dark.TFrame")
-            summary_frame.pack(fill=tk.X, padx=10, pady=(5, 8))
-            ttk.Label(
-                summary_frame,
-                textvariable=self.img2img_summary_var,
-                style="Dark.TLabel",
-                font=("Consolas", 9),
-            ).pack(side=tk.LEFT)
-        except Exception:
-            pass
-
-        try:
-            self._attach_summary_traces()
-            self._update_live_config_summary()
-        except Exception:
-            pass
-
-    def _build_upscale_config_tab(self, notebook):
-        """Build upscale configuration form"""
-        tab_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(tab_frame, text="📈 Upscale")
-
-        # Create scrollable frame
-        canvas = tk.Canvas(tab_frame, bg="#2b2b2b")
-        scrollable_frame = ttk.Frame(canvas, style="Dark.TFrame")
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-
-        # Initialize config variables
-        self.upscale_vars = {}
-        self.upscale_widgets = {}
-
-        # Upscaling Method
-        method_frame = ttk.LabelFrame(
-            scrollable_frame, text="Upscaling Method", style="Dark.TFrame", padding=5
-        )
-        method_frame.pack(fill=tk.X, pady=2)
-
-        method_row = ttk.Frame(method_frame, style="Dark.TFrame")
-        method_row.pack(fill=tk.X, pady=2)
-        ttk.Label(method_row, text="Method:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.upscale_vars["upscale_mode"] = tk.StringVar(value="single")
-        method_combo = ttk.Combobox(
-            method_row,
-            textvariable=self.upscale_vars["upscale_mode"],
-            values=["single", "img2img"],
-            width=20,
-            state="readonly",
-        )
-        method_combo.pack(side=tk.LEFT, padx=(5, 5))
-        try:
-            method_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_upscale_method_state())
-        except Exception:
-            pass
-        self.upscale_widgets["upscale_mode"] = method_combo
-        ttk.Label(method_row, text="ℹ️ img2img allows denoising", style="Dark.TLabel").pack(
-            side=tk.LEFT, padx=(10, 0)
-        )
-
-        # Basic Upscaling Settings
-        basic_frame = ttk.LabelFrame(
-            scrollable_frame, text="Basic Settings", style="Dark.TFrame", padding=5
-        )
-        basic_frame.pack(fill=tk.X, pady=2)
-
-        # Upscaler selection
-        upscaler_row = ttk.Frame(basic_frame, style="Dark.TFrame")
-        upscaler_row.pack(fill=tk.X, pady=2)
-        ttk.Label(upscaler_row, text="Upscaler:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.upscale_vars["upscaler"] = tk.StringVar(value="R-ESRGAN 4x+")
-        self.upscaler_combo = ttk.Combobox(
-            upscaler_row, textvariable=self.upscale_vars["upscaler"], width=40, state="readonly"
-        )
-        self.upscaler_combo.pack(side=tk.LEFT, padx=(5, 5))
-        self.upscale_widgets["upscaler"] = self.upscaler_combo
-        ttk.Button(
-            upscaler_row, text="🔄", command=self._refresh_upscalers, width=3, style="Dark.TButton"
-        ).pack(side=tk.LEFT)
-
-        # Scale factor
-        scale_row = ttk.Frame(basic_frame, style="Dark.TFrame")
-        scale_row.pack(fill=tk.X, pady=2)
-        ttk.Label(scale_row, text="Scale Factor:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.upscale_vars["upscaling_resize"] = tk.DoubleVar(value=2.0)
-        scale_spin = ttk.Spinbox(
-            scale_row,
-            from_=1.1,
-            to=4.0,
-            increment=0.1,
-            width=8,
-            textvariable=self.upscale_vars["upscaling_resize"],
-        )
-        scale_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.upscale_widgets["upscaling_resize"] = scale_spin
-
-        # Steps for img2img mode
-        steps_row = ttk.Frame(basic_frame, style="Dark.TFrame")
-        steps_row.pack(fill=tk.X, pady=2)
-        ttk.Label(steps_row, text="Steps (img2img):", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        try:
-            self.upscale_vars["steps"]
-        except Exception:
-            self.upscale_vars["steps"] = tk.IntVar(value=20)
-        steps_spin = ttk.Spinbox(
-            steps_row,
-            from_=1,
-            to=150,
-            textvariable=self.upscale_vars["steps"],
-            width=8,
-        )
-        steps_spin.pack(side=tk.LEFT, padx=(5, 0))
-        self.upscale_widgets["steps"] = steps_spin
-
-        # Denoising (for img2img mode)
-        denoise_row = ttk.Frame(basic_frame, style="Dark.TFrame")
-        denoise_row.pack(fill=tk.X, pady=2)
-        ttk.Label(denoise_row, text="Denoising:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.upscale_vars["denoising_strength"] = tk.DoubleVar(value=0.35)
-        denoise_slider = EnhancedSlider(
-            denoise_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.upscale_vars["denoising_strength"],
-            resolution=0.05,
-            length=150,
-        )
-        denoise_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.upscale_widgets["denoising_strength"] = denoise_slider
-
-        # Face Restoration
-        face_frame = ttk.LabelFrame(
-            scrollable_frame, text="Face Restoration", style="Dark.TFrame", padding=5
-        )
-        face_frame.pack(fill=tk.X, pady=2)
-
-        # GFPGAN
-        gfpgan_row = ttk.Frame(face_frame, style="Dark.TFrame")
-        gfpgan_row.pack(fill=tk.X, pady=2)
-        ttk.Label(gfpgan_row, text="GFPGAN:", style="Dark.TLabel", width=15).pack(side=tk.LEFT)
-        self.upscale_vars["gfpgan_visibility"] = tk.DoubleVar(value=0.5)  # Default to 0.5
-        gfpgan_slider = EnhancedSlider(
-            gfpgan_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.upscale_vars["gfpgan_visibility"],
-            resolution=0.01,
-            width=120,
-        )
-        gfpgan_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.upscale_widgets["gfpgan_visibility"] = gfpgan_slider
-
-        # CodeFormer
-        codeformer_row = ttk.Frame(face_frame, style="Dark.TFrame")
-        codeformer_row.pack(fill=tk.X, pady=2)
-        ttk.Label(codeformer_row, text="CodeFormer:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.upscale_vars["codeformer_visibility"] = tk.DoubleVar(value=0.0)
-        codeformer_slider = EnhancedSlider(
-            codeformer_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.upscale_vars["codeformer_visibility"],
-            resolution=0.05,
-            length=150,
-        )
-        codeformer_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.upscale_widgets["codeformer_visibility"] = codeformer_slider
-
-        # CodeFormer Weight
-        cf_weight_row = ttk.Frame(face_frame, style="Dark.TFrame")
-        cf_weight_row.pack(fill=tk.X, pady=2)
-        ttk.Label(cf_weight_row, text="CF Fidelity:", style="Dark.TLabel", width=15).pack(
-            side=tk.LEFT
-        )
-        self.upscale_vars["codeformer_weight"] = tk.DoubleVar(value=0.5)
-        cf_weight_slider = EnhancedSlider(
-            cf_weight_row,
-            from_=0.0,
-            to=1.0,
-            variable=self.upscale_vars["codeformer_weight"],
-            resolution=0.05,
-            length=150,
-        )
-        cf_weight_slider.pack(side=tk.LEFT, padx=(5, 5))
-        self.upscale_widgets["codeformer_weight"] = cf_weight_slider
-
-        canvas.pack(fill="both", expand=True)
-
-        # Apply initial enabled/disabled state for img2img-only controls
-        try:
-            self._apply_upscale_method_state()
-        except Exception:
-            pass
-
-    def _apply_upscale_method_state(self) -> None:
-        """Enable/disable Upscale img2img-only controls based on selected method."""
-        try:
-            mode = str(self.upscale_vars.get("upscale_mode").get()).lower()
-        except Exception:
-            mode = "single"
-        use_img2img = mode == "img2img"
-        # Steps (standard widget)
-        steps_widget = self.upscale_widgets.get("steps")
-        if steps_widget is not None:
-            try:
-                steps_widget.configure(state=("normal" if use_img2img else "disabled"))
-            except Exception:
-                pass
-        # Denoising (EnhancedSlider supports .configure(state=...))
-        denoise_widget = self.upscale_widgets.get("denoising_strength")
-        if denoise_widget is not None:
-            try:
-                denoise_widget.configure(state=("normal" if use_img2img else "disabled"))
-            except Exception:
-                pass
-
-    def _build_api_config_tab(self, notebook):
-        """Build API configuration form"""
-        tab_frame = ttk.Frame(notebook, style="Dark.TFrame")
-        notebook.add(tab_frame, text="🔌 API")
-
-        # API settings
-        api_frame = ttk.LabelFrame(
-            tab_frame, text="API Connection", style="Dark.TFrame", padding=10
-        )
-        api_frame.pack(fill=tk.X, pady=5)
-
-        # Base URL
-        url_frame = ttk.Frame(api_frame, style="Dark.TFrame")
-        url_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(url_frame, text="Base URL:", style="Dark.TLabel").pack(side=tk.LEFT)
-        self.api_vars = {}
-        self.api_vars["base_url"] = self.api_url_var  # Use the same variable
-        url_entry = ttk.Entry(url_frame, textvariable=self.api_vars["base_url"], width=30)
-        url_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
-
-        # Timeout
-        timeout_frame = ttk.Frame(api_frame, style="Dark.TFrame")
-        timeout_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(timeout_frame, text="Timeout (s):", style="Dark.TLabel").pack(side=tk.LEFT)
-        self.api_vars["timeout"] = tk.IntVar(value=300)
-        timeout_spin = ttk.Spinbox(
-            timeout_frame, from_=30, to=3600, width=10, textvariable=self.api_vars["timeout"]
-        )
-        timeout_spin.pack(side=tk.LEFT, padx=5)
-
-    def _save_all_config(self):
-        """Save all configuration changes"""
-        try:
-            # Build full config via form binder
-            config = self._get_config_from_forms()
-
-            # When packs are selected and not in override mode, persist to each selected pack
-            selected = []
-            if hasattr(self, "packs_listbox"):
-                selected = [self.packs_listbox.get(i) for i in self.packs_listbox.curselection()]
-            # Fallback: if UI focus cleared the visual selection, use last-known pack
-            if (not selected) and hasattr(self, "_last_selected_pack") and self._last_selected_pack:
-                selected = [self._last_selected_pack]
-
-            if selected and not self.override_pack_var.get():
-                saved_any = False
-                for pack_name in selected:
-                    if self.config_manager.save_pack_config(pack_name, config):
-                        saved_any = True
-                if saved_any:
-                    self.log_message(
-                        f"Saved configuration for {len(selected)} selected pack(s)", "SUCCESS"
-                    )
-                    self._show_config_status(
-                        f"Configuration saved for {len(selected)} selected pack(s)"
-                    )
-                    try:
-                        messagebox.showinfo(
-                            "Config Saved",
-                            f"Saved configuration for {len(selected)} selected pack(s)",
-                        )
-                    except Exception:
-                        pass
-                    try:
-                        if hasattr(self, "config_panel"):
-                            self.config_panel.show_save_indicator("Saved")
-                    except Exception:
-                        pass
-                    try:
-                        self.show_top_save_indicator("Saved")
-                    except Exception:
-                        pass
-                else:
-                    self.log_message("Failed to save configuration for selected packs", "ERROR")
-            else:
-                # Save as current config and optionally preset (override/preset path)
-                self.current_config = config
-                preset_name = tk.simpledialog.askstring(
-                    "Save Preset", "Enter preset name (optional):"
-                )
-                if preset_name:
-                    self.config_manager.save_preset(preset_name, config)
-                    self.log_message(f"Saved configuration as preset: {preset_name}", "SUCCESS")
-                    try:
-                        messagebox.showinfo(
-                            "Preset Saved",
-                            f"Saved configuration as preset: {preset_name}",
-                        )
-                    except Exception:
-                        pass
-                    try:
-                        if hasattr(self, "config_panel"):
-                            self.config_panel.show_save_indicator("Saved")
-                    except Exception:
-                        pass
-                    try:
-                        self.show_top_save_indicator("Saved")
-                    except Exception:
-                        pass
-                else:
-                    self.log_message("Configuration updated (not saved as preset)", "INFO")
-                    self._show_config_status("Configuration updated (not saved as preset)")
-                    try:
-                        if hasattr(self, "config_panel"):
-                            self.config_panel.show_save_indicator("Saved")
-                    except Exception:
-                        pass
-                    try:
-                        self.show_top_save_indicator("Saved")
-                    except Exception:
-                        pass
-
-        except Exception as e:
-            self.log_message(f"Failed to save configuration: {e}", "ERROR")
-
-    def _reset_all_config(self):
-        """Reset all configuration to defaults"""
-        defaults = self.config_manager.get_default_config()
-        self._load_config_into_forms(defaults)
-        self.log_message("Configuration reset to defaults", "INFO")
-
-    def on_config_save(self, _config: dict) -> None:
-        """Coordinator callback from ConfigPanel to save current settings."""
-        try:
-            self._save_all_config()
-            if hasattr(self, "config_panel"):
-                self.config_panel.show_save_indicator("Saved")
-            self.show_top_save_indicator("Saved")
-        except Exception:
-            pass
-
-    def show_top_save_indicator(self, text: str = "Saved", duration_ms: int = 2000) -> None:
-        """Show a colored indicator next to the top Save button."""
-        try:
-            color = "#00c853" if (text or "").lower() == "saved" else "#ffa500"
-            try:
-                self.top_save_indicator.configure(foreground=color)
-            except Exception:
-                pass
-            self.top_save_indicator_var.set(text)
-            if duration_ms and (text or "").lower() == "saved":
-                self.root.after(duration_ms, lambda: self.top_save_indicator_var.set(""))
-        except Exception:
-            pass
-
-    def _on_preset_changed(self, event=None):
-        """Handle preset dropdown selection changes"""
-        preset_name = self.preset_var.get()
-        if preset_name:
-            self.log_message(f"Preset selected: {preset_name} (click Load to apply)", "INFO")
-
-    def _on_preset_dropdown_changed(self):
-        """Handle preset dropdown selection changes"""
-        preset_name = self.preset_var.get()
-        if not preset_name:
-            return
-
-        config = self.config_manager.load_preset(preset_name)
-        if not config:
-            self.log_message(f"Failed to load preset: {preset_name}", "ERROR")
-            return
+        config = self.config_manager.load_preset(preset_name)
+        if not config:
+            self.log_message(f"Failed to load preset: {preset_name}", "ERROR")
+            return
 
         self.current_preset = preset_name
 
@@ -4961,7 +4316,7 @@ class StableNewGUI:
         self._load_config_into_forms(config)
 
         # If override mode is enabled, this becomes the new override config
-        if self.override_pack_var.get():
+        if override:
             self.current_config = config
             self.log_message(
                 f"✓ Loaded preset '{preset_name}' (Pipeline + Randomization + General)",
@@ -4997,7 +4352,7 @@ class StableNewGUI:
             self.log_message("No packs selected", "WARNING")
             return
 
-        selected_packs = [self.packs_listbox.get(i) for i in selected_indices]
+        selected_packs = _listbox_items(self.packs_listbox, selected_indices)
         current_config = self._get_config_from_forms()
 
         saved_count = 0
@@ -5015,16 +4370,18 @@ class StableNewGUI:
 
     def _load_selected_preset(self):
         """Load the currently selected preset into the form"""
+        # Snapshot Tk vars once; use the locals below
         preset_name = self.preset_var.get()
         if not preset_name:
             self.log_message("No preset selected", "WARNING")
             return
+        override = bool(self.override_pack_var.get())
 
         config = self.config_manager.load_preset(preset_name)
         if config:
             self.current_preset = preset_name
-            if not self.override_pack_var.get():
-                self._load_config_into_forms(config)
+            if not override:
+                self._load_config_into_forms(config, force=True)
             self.current_config = config
             self.log_message(f"✓ Loaded preset: {preset_name}", "SUCCESS")
             self._refresh_config()
@@ -5038,8 +4395,6 @@ class StableNewGUI:
 
     def _save_preset_as(self):
         """Save current configuration as a new preset with user-provided name"""
-        from tkinter import simpledialog
-
         current_config = self._get_config_from_forms()
 
         preset_name = simpledialog.askstring(
@@ -5058,9 +4413,7 @@ class StableNewGUI:
             return
 
         # Check if preset already exists
-        if preset_name in self.config_manager.list_presets():
-            from tkinter import messagebox
-
+        if self.config_manager.has_preset(preset_name):
             overwrite = messagebox.askyesno(
                 "Preset Exists",
                 f"Preset '{preset_name}' already exists. Overwrite it?",
@@ -5071,7 +4424,8 @@ class StableNewGUI:
         if self.config_manager.save_preset(preset_name, current_config):
             self.log_message(f"✓ Saved preset as: {preset_name}", "SUCCESS")
             # Refresh dropdown
-            self.preset_dropdown["values"] = self.config_manager.list_presets()
+            self._presets_cache = None
+            self.preset_dropdown["values"] = self._get_presets()
             # Select the new preset
             self.preset_var.set(preset_name)
             self.current_preset = preset_name
@@ -5080,8 +4434,6 @@ class StableNewGUI:
 
     def _delete_selected_preset(self):
         """Delete the currently selected preset after confirmation"""
-        from tkinter import messagebox
-
         preset_name = self.preset_var.get()
         if not preset_name:
             self.log_message("No preset selected", "WARNING")
@@ -5105,7 +4457,8 @@ class StableNewGUI:
         if self.config_manager.delete_preset(preset_name):
             self.log_message(f"✓ Deleted preset: {preset_name}", "SUCCESS")
             # Refresh dropdown
-            self.preset_dropdown["values"] = self.config_manager.list_presets()
+            self._presets_cache = None
+            self.preset_dropdown["values"] = self._get_presets()
             # Select default
             self.preset_var.set("default")
             self.current_preset = "default"
@@ -5116,8 +4469,6 @@ class StableNewGUI:
 
     def _set_as_default_preset(self):
         """Mark the currently selected preset as the default (auto-loads on startup)"""
-        from tkinter import messagebox
-
         preset_name = self.preset_var.get()
         if not preset_name:
             self.log_message("No preset selected", "WARNING")
@@ -5151,6 +4502,7 @@ class StableNewGUI:
             return
 
         if self.config_manager.save_preset(preset_name, current_config):
+            self._presets_cache = None
             self.log_message(f"✓ Updated preset: {preset_name}", "SUCCESS")
         else:
             self.log_message(f"Failed to update preset: {preset_name}", "ERROR")
@@ -5182,8 +4534,32 @@ class StableNewGUI:
                         # Pack selection restored silently - no need to log every restore
                         break
 
-    def _load_config_into_forms(self, config):
-        """Load configuration values into form widgets"""
+    def _cache_widget_flags(self):
+        """Cache which optional widgets/panels exist after UI construction."""
+        self._has_config_panel = getattr(self, "config_panel", None) is not None
+        self._has_adetailer_panel = getattr(self, "adetailer_panel", None) is not None
+        self._has_pipeline_controls_panel = (
+            getattr(self, "pipeline_controls_panel", None) is not None
+        )
+        self._has_packs_listbox = getattr(self, "packs_listbox", None) is not None
+        self._has_preset_var = getattr(self, "preset_var", None) is not None
+        self._has_override_pack_var = getattr(self, "override_pack_var", None) is not None
+
+    @staticmethod
+    def _config_hash(config) -> int:
+        """Return a stable hash of a (possibly nested) config dict."""
+        return hash(json.dumps(config, sort_keys=True, default=str))
+
+    def _load_config_into_forms(self, config, force: bool = False):
+        """Load configuration values into form widgets.
+
+        The config panel load is skipped when ``config`` matches the last config pushed
+        into the forms, unless ``force`` is set (explicit user reload/reset). Write traces
+        on every var ``set_config`` writes (txt2img/img2img/upscale/api) clear that hash;
+        the ADetailer, randomization and aesthetic forms are always reloaded.
+        """
+        config_hash = self._config_hash(config)
+        panel_current = not force and config_hash == self._last_loaded_config_hash
         if getattr(self, "_diag_enabled", False):
             logger.info("[DIAG] _load_config_into_forms: start", extra={"flush": True})
         # Preserve current pack selection before updating forms
@@ -5193,13 +4569,13 @@ class StableNewGUI:
             selected_pack = self.packs_listbox.get(current_selection[0])
 
         try:
-            if hasattr(self, "config_panel"):
+            if self._has_config_panel and not panel_current:
                 if getattr(self, "_diag_enabled", False):
                     logger.info("[DIAG] _load_config_into_forms: calling config_panel.set_config", extra={"flush": True})
                 self.config_panel.set_config(config)
                 if getattr(self, "_diag_enabled", False):
                     logger.info("[DIAG] _load_config_into_forms: config_panel.set_config returned", extra={"flush": True})
-            if hasattr(self, "adetailer_panel") and self.adetailer_panel:
+            if self._has_adetailer_panel:
                 if getattr(self, "_diag_enabled", False):
                     logger.info("[DIAG] _load_config_into_forms: calling adetailer_panel.set_config", extra={"flush": True})
                 self.adetailer_panel.set_config(config.get("adetailer", {}))
@@ -5209,7 +4585,9 @@ class StableNewGUI:
             if getattr(self, "_diag_enabled", False):
                 logger.info("[DIAG] _load_config_into_forms: calling _load_aesthetic_config", extra={"flush": True})
             self._load_aesthetic_config(config)
+            self._last_loaded_config_hash = config_hash
         except Exception as e:
+            self._last_loaded_config_hash = None
             self.log_message(f"Error loading config into forms: {e}", "ERROR")
             if getattr(self, "_diag_enabled", False):
                 logger.error(f"[DIAG] _load_config_into_forms: exception {e}", exc_info=True, extra={"flush": True})
@@ -5240,14 +4618,14 @@ class StableNewGUI:
         try:
             # Restore preset selection and override mode
             self.current_preset = prefs.get("preset", "default")
-            if hasattr(self, "preset_var"):
+            if self._has_preset_var:
                 self.preset_var.set(self.current_preset)
-            if hasattr(self, "override_pack_var"):
+            if self._has_override_pack_var:
                 self.override_pack_var.set(prefs.get("override_pack", False))
 
             # Restore pipeline control toggles
             pipeline_state = prefs.get("pipeline_controls")
-            if pipeline_state and hasattr(self, "pipeline_controls_panel"):
+            if pipeline_state and self._has_pipeline_controls_panel:
                 try:
                     self.pipeline_controls_panel.set_state(pipeline_state)
                 except Exception as exc:
@@ -5255,13 +4633,18 @@ class StableNewGUI:
 
             # Restore pack selections
             selected_packs = prefs.get("selected_packs", [])
-            if selected_packs and hasattr(self, "packs_listbox"):
+            if selected_packs and self._has_packs_listbox:
+                # Map names to indices with one Tcl round-trip instead of K·N get() calls
+                self._pack_index = {
+                    name: index
+                    for index, name in enumerate(self.packs_listbox.get(0, tk.END))
+                }
+                indices = [self._pack_index[p] for p in selected_packs if p in self._pack_index]
                 self.packs_listbox.selection_clear(0, tk.END)
-                for pack_name in selected_packs:
-                    for index in range(self.packs_listbox.size()):
-                        if self.packs_listbox.get(index) == pack_name:
-                            self.packs_listbox.selection_set(index)
-                            self.packs_listbox.activate(index)
+                for index in indices:
+                    self.packs_listbox.selection_set(index)
+                if indices:
+                    self.packs_listbox.activate(indices[-1])
                 self._update_selection_highlights()
                 self.selected_packs = selected_packs
                 if selected_packs:
@@ -5278,20 +4661,21 @@ class StableNewGUI:
     def _collect_preferences(self) -> dict[str, Any]:
         """Collect current UI preferences for persistence."""
 
+        # Snapshot each Tk var/widget query exactly once into a local, then build from locals
+        preset = self.preset_var.get() if hasattr(self, "preset_var") else "default"
+        override = (
+            bool(self.override_pack_var.get()) if hasattr(self, "override_pack_var") else False
+        )
         preferences = {
-            "preset": self.preset_var.get() if hasattr(self, "preset_var") else "default",
+            "preset": preset,
             "selected_packs": [],
-            "override_pack": (
-                bool(self.override_pack_var.get()) if hasattr(self, "override_pack_var") else False
-            ),
+            "override_pack": override,
             "pipeline_controls": self.preferences_manager.default_pipeline_controls(),
             "config": self._get_config_from_forms(),
         }
 
         if hasattr(self, "packs_listbox"):
-            preferences["selected_packs"] = [
-                self.packs_listbox.get(i) for i in self.packs_listbox.curselection()
-            ]
+            preferences["selected_packs"] = self._selected_pack_names()
 
         if hasattr(self, "pipeline_controls_panel") and self.pipeline_controls_panel is not None:
             try:
@@ -5301,147 +4685,30 @@ class StableNewGUI:
 
         return preferences
 
-    def _build_pipeline_tab(self, parent):
-        """Build pipeline execution tab"""
-        # API Connection Frame
-        api_frame = ttk.LabelFrame(parent, text="API Connection", padding=10)
-        api_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        ttk.Label(api_frame, text="API URL:").grid(row=0, column=0, sticky=tk.W, padx=5)
-        ttk.Entry(api_frame, textvariable=self.api_url_var, width=40).grid(
-            row=0, column=1, padx=5, pady=2
-        )
-
-        self.check_api_btn = ttk.Button(api_frame, text="Check API", command=self._check_api)
-        self.check_api_btn.grid(row=0, column=2, padx=5)
-
-        self.api_status_label = ttk.Label(api_frame, text="Not connected", foreground="red")
-        self.api_status_label.grid(row=0, column=3, padx=5)
-
-        # Prompt Frame
-        prompt_frame = ttk.LabelFrame(parent, text="Prompt", padding=10)
-        prompt_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-
-        ttk.Label(prompt_frame, text="Enter your prompt:").pack(anchor=tk.W)
-        self.prompt_text = scrolledtext.ScrolledText(prompt_frame, height=6, wrap=tk.WORD)
-        self.prompt_text.pack(fill=tk.BOTH, expand=True, pady=5)
-        self.prompt_text.insert(1.0, "a beautiful landscape, high quality, detailed")
-
-        # Preset Frame
-        preset_frame = ttk.LabelFrame(parent, text="Preset", padding=10)
-        preset_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        ttk.Label(preset_frame, text="Select preset:").grid(row=0, column=0, padx=5)
-        self.preset_var = tk.StringVar()
-        self.preset_combo = ttk.Combobox(
-            preset_frame, textvariable=self.preset_var, state="readonly", width=20
-        )
-        self.preset_combo.grid(row=0, column=1, padx=5)
-        self._refresh_presets()
-
-        ttk.Button(preset_frame, text="Refresh", command=self._refresh_presets).grid(
-            row=0, column=2, padx=5
-        )
-
-        # Options Frame
-        options_frame = ttk.LabelFrame(parent, text="Options", padding=10)
-        options_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        ttk.Label(options_frame, text="Batch size:").grid(row=0, column=0, padx=5)
-        self.batch_size_var = tk.IntVar(value=1)
-        ttk.Spinbox(options_frame, from_=1, to=10, textvariable=self.batch_size_var, width=10).grid(
-            row=0, column=1, padx=5
-        )
-
-        ttk.Label(options_frame, text="Run name (optional):").grid(row=0, column=2, padx=5)
-        self.run_name_var = tk.StringVar()
-        ttk.Entry(options_frame, textvariable=self.run_name_var, width=20).grid(
-            row=0, column=3, padx=5
-        )
-
-        # Pipeline stages
-        self.enable_img2img_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            options_frame, text="Enable img2img cleanup", variable=self.enable_img2img_var
-        ).grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5, pady=2)
-
-        self.enable_upscale_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(
-            options_frame, text="Enable upscaling", variable=self.enable_upscale_var
-        ).grid(row=1, column=2, columnspan=2, sticky=tk.W, padx=5, pady=2)
-
-        # Execution Frame
-        exec_frame = ttk.Frame(parent, padding=10)
-        exec_frame.pack(fill=tk.X, padx=10, pady=5)
-
-        self.run_pipeline_btn = ttk.Button(
-            exec_frame, text="Run Pipeline", command=self._run_pipeline, style="Accent.TButton"
-        )
-        self.run_pipeline_btn.pack(side=tk.LEFT, padx=5)
-
-        self.create_video_btn = ttk.Button(
-            exec_frame, text="Create Video from Output", command=self._create_video
-        )
-        self.create_video_btn.pack(side=tk.LEFT, padx=5)
-
-        ttk.Label(exec_frame, textvariable=self.progress_var).pack(side=tk.LEFT, padx=10)
-
-        progress_frame = ttk.Frame(parent, padding=10)
-        progress_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
-
-        self.progress_bar = ttk.Progressbar(
-            progress_frame,
-            orient=tk.HORIZONTAL,
-            mode="determinate",
-            maximum=100,
-            length=200,
-        )
-        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.progress_bar["value"] = 0
-
-        ttk.Label(progress_frame, textvariable=self.progress_percent_var, style="Dark.TLabel").pack(
-            side=tk.LEFT, padx=8
-        )
-        ttk.Label(progress_frame, textvariable=self.eta_var, style="Dark.TLabel").pack(
-            side=tk.LEFT, padx=8
-        )
-
-    def _build_settings_tab(self, parent):
-        """Build settings tab"""
-        settings_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD)
-        settings_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        # Show current preset
-        presets = self.config_manager.list_presets()
-        settings_text.insert(1.0, "Available Presets:")
-        for preset in presets:
-            settings_text.insert(tk.END, f"- {preset}")
-
-        settings_text.insert(tk.END, "Default Configuration:")
-        default_config = self.config_manager.get_default_config()
-        settings_text.insert(tk.END, json.dumps(default_config, indent=2))
-
-        settings_text.config(state=tk.DISABLED)
+    def _add_log_message(self, message: str):
+        """Add message to the live log panel; LogPanel batches and caps its own writes."""
+        if self.log_panel is not None:
+            self.log_panel.log(message)
+        else:
+            logger.info(message)
 
-    def _build_log_tab(self, parent):
-        """Build log tab"""
-        self.log_text = scrolledtext.ScrolledText(parent, wrap=tk.WORD, state=tk.DISABLED)
-        self.log_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    def _get_video_creator(self) -> VideoCreator:
+        """Return the shared VideoCreator, constructing it (and probing ffmpeg) on first use."""
+        if self.video_creator is None:
+            self.video_creator = VideoCreator()
+        return self.video_creator
 
-        # Add a handler to redirect logs to the text widget
-        # This is a simple implementation - could be enhanced
-        self._add_log_message("Log viewer initialized")
-
-    def _add_log_message(self, message: str):
-        """Add message to log viewer"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    def _get_presets(self) -> tuple[str, ...]:
+        """Return preset names, scanning the presets directory only when the cache is empty."""
+        if self._presets_cache is None:
+            self._presets_cache = tuple(self.config_manager.list_presets())
+        return self._presets_cache
 
     def _refresh_presets(self):
         """Refresh preset list"""
-        presets = self.config_manager.list_presets()
+        # Explicit refresh: pick up presets added outside the GUI
+        self._presets_cache = None
+        presets = self._get_presets()
         self.preset_combo["values"] = presets
         if presets and not self.preset_var.get():
             self.preset_var.set(presets[0])
@@ -5456,21 +4723,26 @@ class StableNewGUI:
             client = SDWebUIClient(base_url=url)
             if client.check_api_ready():
                 self.client = client
+                self._invalidate_api_cache()
                 self.pipeline = Pipeline(self.client, self.structured_logger)
                 self.controller.set_pipeline(self.pipeline)
-                self.root.after(
-                    0, lambda: self.api_status_label.config(text="Connected", foreground="green")
-                )
-                self.root.after(0, lambda: self._add_log_message("✓ API is ready"))
-                self.root.after(0, lambda: self._apply_status_text("API connected"))
+
+                def on_success():
+                    self.api_status_label.config(text="Connected", foreground="green")
+                    self._add_log_message("✓ API is ready")
+                    self._apply_status_text("API connected")
+
+                self.root.after(0, on_success)
             else:
-                self.root.after(
-                    0, lambda: self.api_status_label.config(text="Failed", foreground="red")
-                )
-                self.root.after(0, lambda: self._add_log_message("✗ API not available"))
-                self.root.after(0, lambda: self._apply_status_text("API check failed"))
 
-        threading.Thread(target=check, daemon=True).start()
+                def on_failure():
+                    self.api_status_label.config(text="Failed", foreground="red")
+                    self._add_log_message("✗ API not available")
+                    self._apply_status_text("API check failed")
+
+                self.root.after(0, on_failure)
+
+        self._io_executor.submit(check)
 
     def _run_pipeline(self):
         """Run the full pipeline using controller"""
@@ -5500,16 +4772,8 @@ class StableNewGUI:
 
         self.controller.report_progress("Running pipeline...", 0.0, "ETA: --")
 
-        # Define pipeline function that checks cancel token
-        # Snapshot Tk-backed values on the main thread (thread-safe)
-        try:
-            config_snapshot = self._get_config_from_forms()
-        except Exception:
-            config_snapshot = {"txt2img": {}, "img2img": {}, "upscale": {}, "api": {}}
-        try:
-            batch_size_snapshot = int(self.images_per_prompt_var.get())
-        except Exception:
-            batch_size_snapshot = 1
+        # Define pipeline function that checks cancel token. ``config``, ``batch_size``
+        # and ``run_name`` were read on the main thread above and serve as the snapshot.
         def pipeline_func():
             try:
                 # Pass cancel_token to pipeline
@@ -5521,67 +4785,37 @@ class StableNewGUI:
                 # Signal completion and prefer Ready status after cancellation
                 try:
                     self.controller.lifecycle_event.set()
-                except Exception:
-                    pass
-                try:
-                    self._force_error_status = False
-                    if hasattr(self, "progress_message_var"):
-                        # Schedule on Tk to mirror normal status handling
-                        self.root.after(0, lambda: self.progress_message_var.set("Ready"))
-                except Exception:
+                except AttributeError:
                     pass
+                self._force_error_status = False
+                pmv = getattr(self, "progress_message_var", None)
+                if pmv is not None:
+                    # Schedule on Tk to mirror normal status handling
+                    self._post_ui(lambda: pmv.set("Ready"))
                 raise
-            except Exception:
+            except Exception as exc:
                 logger.exception("Pipeline execution error")
-                # Build error text up-front
-                try:
-                    import sys
-
-                    ex_type, ex, _ = sys.exc_info()
-                    err_text = (
-                        f"Pipeline failed: {ex_type.__name__}: {ex}"
-                        if (ex_type and ex)
-                        else "Pipeline failed"
-                    )
-                except Exception:
-                    err_text = "Pipeline failed"
-
-                # Log friendly error line to app log first (test captures this)
-                try:
-                    self.log_message(f"? {err_text}", "ERROR")
-                except Exception:
-                    pass
-
-                # Call patched messagebox early to ensure test mock sees it
-                try:
-                    if not getattr(self, "_error_dialog_shown", False):
-                        messagebox.showerror("Pipeline Error", err_text)
-                        self._error_dialog_shown = True
-                except Exception:
-                    pass
-
-                # Ensure tests waiting on lifecycle_event are not blocked
-                try:
-                    self.controller.lifecycle_event.set()
-                except Exception:
-                    pass
-
+                err_text = f"Pipeline failed: {type(exc).__name__}: {exc}"
                 # Force visible error state/status
                 self._force_error_status = True
+                # One guard for the whole reporting sequence; the original error is re-raised
                 try:
-                    if hasattr(self, "progress_message_var"):
-                        self.progress_message_var.set("Error")
-                except Exception:
-                    pass
-                try:
-                    from .state import GUIState
-
+                    # Log friendly error line to app log first (test captures this)
+                    if self._log_enabled("ERROR"):
+                        self.log_message(f"? {err_text}", "ERROR")
+                    # Call patched messagebox early to ensure test mock sees it
+                    if self._try_claim_error_dialog():
+                        messagebox.showerror("Pipeline Error", err_text)
+                    # Ensure tests waiting on lifecycle_event are not blocked
+                    self.controller.lifecycle_event.set()
+                    pmv = getattr(self, "progress_message_var", None)
+                    if pmv is not None:
+                        # Resolved here so the Tk callback only calls .set
+                        self._post_ui(lambda: pmv.set("Error"))
                     # Schedule transition on Tk thread for deterministic callback behavior
-                    self.root.after(0, lambda: self.state_manager.transition_to(GUIState.ERROR))
+                    self._post_ui(lambda: self.state_manager.transition_to(GUIState.ERROR))
                 except Exception:
-                    pass
-
-                # (Already logged above)
+                    logger.exception("Failed to report pipeline error")
                 raise
 
         # Completion callback
@@ -5589,78 +4823,66 @@ class StableNewGUI:
             output_dir = results.get("run_dir", "Unknown")
             num_images = len(results.get("summary", []))
 
-            self.root.after(
-                0,
-                lambda: self.log_message(
-                    f"✓ Pipeline completed: {num_images} images generated", "SUCCESS"
-                ),
-            )
-            self.root.after(0, lambda: self.log_message(f"Output directory: {output_dir}", "INFO"))
-            self.root.after(
-                0,
-                lambda: messagebox.showinfo(
+            def show_completion():
+                if self._log_enabled("SUCCESS"):
+                    self.log_message(
+                        f"✓ Pipeline completed: {num_images} images generated", "SUCCESS"
+                    )
+                if self._log_enabled("INFO"):
+                    self.log_message(f"Output directory: {output_dir}", "INFO")
+                messagebox.showinfo(
                     "Success",
                     f"Pipeline completed!{num_images} images generatedOutput: {output_dir}",
-                ),
-            )
+                )
+
+            self._post_ui(show_completion)
             # Reset error-control flags for the next run
-            try:
-                self._force_error_status = False
-                self._error_dialog_shown = False
-            except Exception:
-                pass
+            self._force_error_status = False
+            self._error_dialog_shown.clear()
             # Ensure lifecycle_event is signaled for tests waiting on completion
             try:
                 self.controller.lifecycle_event.set()
-            except Exception:
+            except AttributeError:
                 pass
 
         # Error callback
         def on_error(e):
-            # Log and alert immediately (safe for tests with mocked messagebox)
-            try:
-                err_text = f"Pipeline failed: {type(e).__name__}: {e}"
+            err_text = f"Pipeline failed: {type(e).__name__}: {e}"
+            if self._log_enabled("ERROR"):
                 self.log_message(f"? {err_text}", "ERROR")
-                try:
-                    if hasattr(self, "progress_message_var"):
-                        self.progress_message_var.set("Error")
-                except Exception:
-                    pass
-                try:
-                    if not getattr(self, "_error_dialog_shown", False):
-                        messagebox.showerror("Pipeline Error", err_text)
-                        self._error_dialog_shown = True
-                except Exception:
-                    pass
-                try:
-                    # Also schedule to ensure it wins over any queued 'Running' updates
-                    self.root.after(
-                        0,
-                        lambda: hasattr(self, "progress_message_var")
-                        and self.progress_message_var.set("Error"),
-                    )
-                    # Schedule explicit ERROR transition to drive status callbacks
-                    from .state import GUIState
-
-                    self.root.after(0, lambda: self.state_manager.transition_to(GUIState.ERROR))
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            # Also schedule the standard UI error handler
-            try:
-                self.root.after(0, lambda: self._handle_pipeline_error(e))
-            except Exception:
-                pass
-            # Ensure lifecycle_event is signaled promptly on error
-            try:
-                self.controller.lifecycle_event.set()
-            except Exception:
-                pass
+            # All UI work happens in one ordered dispatch on the Tk thread
+            self._post_ui(lambda: self._show_pipeline_error(err_text, e))
+            # Thread-safe; signal waiters without depending on the Tk loop running
+            self.controller.lifecycle_event.set()
 
         # Start pipeline using controller
         self.controller.start_pipeline(pipeline_func, on_complete=on_complete, on_error=on_error)
 
+    def _try_claim_error_dialog(self) -> bool:
+        """Atomically claim the single pipeline error dialog; False if already shown."""
+        with self._error_dialog_lock:
+            if self._error_dialog_shown.is_set():
+                return False
+            self._error_dialog_shown.set()
+            return True
+
+    def _show_pipeline_error(self, err_text: str, error: Exception | None = None) -> None:
+        """Surface a pipeline failure on the Tk thread in a single ordered pass."""
+        try:
+            if hasattr(self, "progress_message_var"):
+                self.progress_message_var.set("Error")
+            if self._try_claim_error_dialog():
+                messagebox.showerror("Pipeline Error", err_text)
+            # Explicit ERROR transition drives status callbacks
+            self.state_manager.transition_to(GUIState.ERROR)
+        except Exception:
+            logger.exception("Failed to surface pipeline error")
+        finally:
+            self.controller.lifecycle_event.set()
+        if error is not None:
+            # Standard fatal-error handling (logging and shutdown)
+            self._handle_pipeline_error(error)
+
     def _handle_pipeline_error(self, error: Exception) -> None:
         """Log and surface pipeline errors to the user.
 
@@ -5674,15 +4896,11 @@ class StableNewGUI:
         # Marshal messagebox to main thread to avoid Tkinter threading violations
         def show_error_dialog():
             try:
-                if not getattr(self, "_error_dialog_shown", False):
+                if self._try_claim_error_dialog():
                     messagebox.showerror("Pipeline Error", error_message)
-                    self._error_dialog_shown = True
             except tk.TclError:
                 logger.error("Unable to display error dialog", exc_info=True)
 
-        import os
-        import sys
-        import threading
         def exit_app():
             try:
                 self.root.destroy()
@@ -5692,14 +4910,15 @@ class StableNewGUI:
                 sys.exit(1)
             except SystemExit:
                 pass
-        def force_exit_thread():
-            import time
-            time.sleep(1)
-            os._exit(1)
-        threading.Thread(target=force_exit_thread, daemon=True).start()
+
+        # Hard-exit fallback in case the normal shutdown below does not complete. It must
+        # not be a Tk timer: exit_app's destroy() ends mainloop before one could fire.
+        fallback = threading.Timer(1.0, os._exit, args=(1,))
+        fallback.daemon = True
+        fallback.start()
 
         try:
-            self.root.after(0, show_error_dialog)
+            self._post_ui(show_error_dialog)
             self.root.after(100, exit_app)
         except Exception:
             show_error_dialog()
@@ -5716,24 +4935,50 @@ class StableNewGUI:
 
         output_path = Path(output_dir)
 
-        # Try to find upscaled images first, then img2img, then txt2img
-        for subdir in ["upscaled", "img2img", "txt2img"]:
-            image_dir = output_path / subdir
-            if image_dir.exists():
-                video_path = output_path / "video" / f"{subdir}_video.mp4"
-                video_path.parent.mkdir(exist_ok=True)
+        def video_thread():
+            # Probing ffmpeg and encoding happen here; log lines and dialogs go to the Tk thread
+            stage_dirs = ("upscaled", "img2img", "txt2img")
+            # Read the directory listing once instead of probing each stage folder
+            try:
+                with os.scandir(output_path) as entries:
+                    present = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                present = {name for name in stage_dirs if (output_path / name).exists()}
+
+            # Try to find upscaled images first, then img2img, then txt2img
+            for subdir in stage_dirs:
+                if subdir in present:
+                    image_dir = output_path / subdir
+                    video_path = output_path / "video" / f"{subdir}_video.mp4"
+                    video_path.parent.mkdir(exist_ok=True)
+
+                    self._post_ui(
+                        partial(self._add_log_message, f"Creating video from {subdir}...")
+                    )
 
-                self._add_log_message(f"Creating video from {subdir}...")
+                    try:
+                        created = self._get_video_creator().create_video_from_directory(
+                            image_dir, video_path
+                        )
+                    except Exception as e:
+                        self.log_message(f"Video creation failed: {e}", "ERROR")
+                        return
+                    if created:
 
-                if self.video_creator.create_video_from_directory(image_dir, video_path):
-                    self._add_log_message(f"✓ Video created: {video_path}")
-                    messagebox.showinfo("Success", f"Video created:{video_path}")
-                else:
-                    self._add_log_message(f"✗ Failed to create video from {subdir}")
+                        def report_created(video_path=video_path):
+                            self._add_log_message(f"✓ Video created: {video_path}")
+                            messagebox.showinfo("Success", f"Video created:{video_path}")
 
-                return
+                        self._post_ui(report_created)
+                    else:
+                        failure = f"✗ Failed to create video from {subdir}"
+                        self._post_ui(partial(self._add_log_message, failure))
+
+                    return
+
+            self._post_ui(lambda: messagebox.showerror("Error", "No image directories found"))
 
-        messagebox.showerror("Error", "No image directories found")
+        self._run_in_background(video_thread)
 
     def _refresh_models(self):
         """Refresh the list of available SD models (main thread version)"""
@@ -5742,7 +4987,9 @@ class StableNewGUI:
             return
 
         try:
-            models = self.client.get_models()
+            models = self._cached_call(
+                (self.client.base_url, "models"), self.client.get_models, force=True
+            )
             model_names = [""] + [
                 model.get("title", model.get("model_name", "")) for model in models
             ]
@@ -5754,87 +5001,139 @@ class StableNewGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh models: {e}")
 
-    def _refresh_models_async(self):
-        """Refresh the list of available SD models (thread-safe version)"""
-        from functools import partial
+    def _refresh_resource(
+        self,
+        key: str,
+        label: str,
+        panel_setter_name: str,
+        extractor=None,
+        widget_attrs: tuple[str, ...] = (),
+        store_attr: str | None = None,
+        force: bool = False,
+    ) -> None:
+        """Refresh one API listing on the executor and push it to the UI (thread-safe).
 
-        if self.client is None:
-            # Schedule error message on main thread
-            self.root.after(0, lambda: messagebox.showerror("Error", "API client not connected"))
+        Args:
+            key: Cache key; the client method ``get_<key>`` is called.
+            label: Human readable name used in log and error messages.
+            panel_setter_name: ConfigPanel method receiving the option list.
+            extractor: Maps the raw API result to the option list (default: ``list``).
+            widget_attrs: Combobox attributes whose ``values`` are replaced.
+            store_attr: Instance attribute that keeps the option tuple.
+            force: Bypass the TTL cache.
+        """
+        client = self.client
+        if client is None:
+            self._post_ui(lambda: messagebox.showerror("Error", "API client not connected"))
             return
+        api_fn = getattr(client, f"get_{key}")
+        cache_key = (client.base_url, key)
 
-        try:
-            # Perform API call in worker thread
-            models = self.client.get_models()
-            model_names = [""] + [
-                model.get("title", model.get("model_name", "")) for model in models
-            ]
+        def worker():
+            try:
+                raw = self._cached_call(cache_key, api_fn, force=force)
+                # One immutable tuple shared by the stored attribute, every combo
+                # and the (non-mutating) panel setter
+                names = tuple(extractor(raw) if extractor else raw)
+                if store_attr:
+                    setattr(self, store_attr, names)
+            except Exception as exc:
+                self._post_ui(
+                    lambda err=exc: messagebox.showerror(
+                        "Error", f"Failed to refresh {label}: {err}"
+                    )
+                )
+                return
 
-            # Marshal widget updates back to main thread
             def update_widgets():
-                if hasattr(self, "model_combo"):
-                    self.model_combo["values"] = tuple(model_names)
-                if hasattr(self, "img2img_model_combo"):
-                    self.img2img_model_combo["values"] = tuple(model_names)
-                self._add_log_message(f"🔄 Loaded {len(models)} SD models")
-
-            self.root.after(0, update_widgets)
-
-            # Also update unified ConfigPanel if present using partial to capture value
-            if hasattr(self, "config_panel"):
-                self.root.after(0, partial(self.config_panel.set_model_options, list(model_names)))
+                values_hash = hash(names)
+                for attr in widget_attrs:
+                    combo = getattr(self, attr)
+                    # Skip the Tcl list conversion when the options are unchanged
+                    if combo is not None and self._last_values_hash.get(attr) != values_hash:
+                        combo.configure(values=names)
+                        self._last_values_hash[attr] = values_hash
+                if hasattr(self, "config_panel"):
+                    getattr(self.config_panel, panel_setter_name)(names)
+                if self._log_enabled("INFO"):
+                    self._add_log_message(f"🔄 Loaded {len(raw)} {label}")
+
+            self._post_ui(update_widgets)
+
+        self._api_executor.submit(worker)
 
-        except Exception as exc:
-            # Marshal error message back to main thread
-            # Capture exception in default argument to avoid closure issues
-            self.root.after(
-                0,
-                lambda err=exc: messagebox.showerror("Error", f"Failed to refresh models: {err}"),
-            )
+    @staticmethod
+    def _hypernetwork_names(entries) -> list[str]:
+        names = ["None"]
+        seen = {"None"}  # O(1) membership side-index; ``names`` keeps UI order
+        for entry in entries:
+            if isinstance(entry, dict):
+                name = entry.get("name") or entry.get("title") or ""
+            else:
+                name = str(entry)
+            name = name.strip()
+            if name and name not in seen:
+                names.append(name)
+                seen.add(name)
+        return names
+
+    def _refresh_models_async(self, force: bool = False):
+        """Refresh the list of available SD models (thread-safe version)"""
+        self._refresh_resource(
+            "models",
+            "SD models",
+            "set_model_options",
+            extractor=lambda models: [""]
+            + [m.get("title", m.get("model_name", "")) for m in models],
+            widget_attrs=("model_combo", "img2img_model_combo"),
+            force=force,
+        )
 
-    def _refresh_hypernetworks_async(self):
+    def _refresh_hypernetworks_async(self, force: bool = False):
         """Refresh available hypernetworks (thread-safe)."""
+        self._refresh_resource(
+            "hypernetworks",
+            "hypernetworks",
+            "set_hypernetwork_options",
+            extractor=self._hypernetwork_names,
+            store_attr="available_hypernetworks",
+            force=force,
+        )
 
-        if self.client is None:
-            self.root.after(
-                0, lambda: messagebox.showerror("Error", "API client not connected")
-            )
-            return
-
-        def worker():
-            try:
-                entries = self.client.get_hypernetworks()
-                names = ["None"]
-                for entry in entries:
-                    name = ""
-                    if isinstance(entry, dict):
-                        name = entry.get("name") or entry.get("title") or ""
-                    else:
-                        name = str(entry)
-                    name = name.strip()
-                    if name and name not in names:
-                        names.append(name)
-
-                self.available_hypernetworks = names
-
-                def update_widgets():
-                    if hasattr(self, "config_panel"):
-                        try:
-                            self.config_panel.set_hypernetwork_options(names)
-                        except Exception:
-                            pass
+    def _refresh_vae_models_async(self, force: bool = False):
+        """Refresh the list of available VAE models (thread-safe version)"""
+        self._refresh_resource(
+            "vae_models",
+            "VAE models",
+            "set_vae_options",
+            extractor=lambda vaes: [""] + [vae.get("model_name", "") for vae in vaes],
+            widget_attrs=("vae_combo", "img2img_vae_combo"),
+            store_attr="vae_names",
+            force=force,
+        )
 
-                self.root.after(0, update_widgets)
-                self._add_log_message(f"🔄 Loaded {len(names) - 1} hypernetwork(s)")
-            except Exception as exc:  # pragma: no cover - Tk loop dispatch
-                self.root.after(
-                    0,
-                    lambda err=exc: messagebox.showerror(
-                        "Error", f"Failed to refresh hypernetworks: {err}"
-                    ),
-                )
+    def _refresh_upscalers_async(self, force: bool = False):
+        """Refresh the list of available upscalers (thread-safe version)"""
+        self._refresh_resource(
+            "upscalers",
+            "upscalers",
+            "set_upscaler_options",
+            extractor=lambda upscalers: [u.get("name", "") for u in upscalers if u.get("name")],
+            widget_attrs=("upscaler_combo",),
+            store_attr="upscaler_names",
+            force=force,
+        )
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _refresh_schedulers_async(self, force: bool = False):
+        """Refresh the list of available schedulers (thread-safe version)"""
+        self._refresh_resource(
+            "schedulers",
+            "schedulers",
+            "set_scheduler_options",
+            widget_attrs=("scheduler_combo", "img2img_scheduler_combo"),
+            store_attr="schedulers",
+            force=force,
+        )
 
     def _refresh_vae_models(self):
         """Refresh the list of available VAE models (main thread version)"""
@@ -5843,7 +5142,9 @@ class StableNewGUI:
             return
 
         try:
-            vae_models = self.client.get_vae_models()
+            vae_models = self._cached_call(
+                (self.client.base_url, "vae_models"), self.client.get_vae_models, force=True
+            )
             vae_names = [""] + [vae.get("model_name", "") for vae in vae_models]
 
             if hasattr(self, "config_panel"):
@@ -5853,47 +5154,6 @@ class StableNewGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh VAE models: {e}")
 
-    def _refresh_vae_models_async(self):
-        """Refresh the list of available VAE models (thread-safe version)"""
-        from functools import partial
-
-        if self.client is None:
-            # Schedule error message on main thread
-            self.root.after(0, lambda: messagebox.showerror("Error", "API client not connected"))
-            return
-
-        try:
-            # Perform API call in worker thread
-            vae_models = self.client.get_vae_models()
-            vae_names_local = [""] + [vae.get("model_name", "") for vae in vae_models]
-
-            # Store in instance attribute
-            self.vae_names = list(vae_names_local)
-
-            # Marshal widget updates back to main thread
-            def update_widgets():
-                if hasattr(self, "vae_combo"):
-                    self.vae_combo["values"] = tuple(self.vae_names)
-                if hasattr(self, "img2img_vae_combo"):
-                    self.img2img_vae_combo["values"] = tuple(self.vae_names)
-                self._add_log_message(f"🔄 Loaded {len(vae_models)} VAE models")
-
-            self.root.after(0, update_widgets)
-
-            # Also update config panel if present using partial to capture value
-            if hasattr(self, "config_panel"):
-                self.root.after(0, partial(self.config_panel.set_vae_options, list(self.vae_names)))
-
-        except Exception as exc:
-            # Marshal error message back to main thread
-            # Capture exception in default argument to avoid closure issues
-            self.root.after(
-                0,
-                lambda err=exc: messagebox.showerror(
-                    "Error", f"Failed to refresh VAE models: {err}"
-                ),
-            )
-
     def _refresh_upscalers(self):
         """Refresh the list of available upscalers (main thread version)"""
         if self.client is None:
@@ -5901,7 +5161,9 @@ class StableNewGUI:
             return
 
         try:
-            upscalers = self.client.get_upscalers()
+            upscalers = self._cached_call(
+                (self.client.base_url, "upscalers"), self.client.get_upscalers, force=True
+            )
             upscaler_names = [
                 upscaler.get("name", "") for upscaler in upscalers if upscaler.get("name")
             ]
@@ -5913,49 +5175,6 @@ class StableNewGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh upscalers: {e}")
 
-    def _refresh_upscalers_async(self):
-        """Refresh the list of available upscalers (thread-safe version)"""
-        from functools import partial
-
-        if self.client is None:
-            # Schedule error message on main thread
-            self.root.after(0, lambda: messagebox.showerror("Error", "API client not connected"))
-            return
-
-        try:
-            # Perform API call in worker thread
-            upscalers = self.client.get_upscalers()
-            upscaler_names_local = [
-                upscaler.get("name", "") for upscaler in upscalers if upscaler.get("name")
-            ]
-
-            # Store in instance attribute
-            self.upscaler_names = list(upscaler_names_local)
-
-            # Marshal widget updates back to main thread
-            def update_widgets():
-                if hasattr(self, "upscaler_combo"):
-                    self.upscaler_combo["values"] = tuple(self.upscaler_names)
-                self._add_log_message(f"🔄 Loaded {len(upscalers)} upscalers")
-
-            self.root.after(0, update_widgets)
-
-            # Also update config panel if present using partial to capture value
-            if hasattr(self, "config_panel"):
-                self.root.after(
-                    0, partial(self.config_panel.set_upscaler_options, list(self.upscaler_names))
-                )
-
-        except Exception as exc:
-            # Marshal error message back to main thread
-            # Capture exception in default argument to avoid closure issues
-            self.root.after(
-                0,
-                lambda err=exc: messagebox.showerror(
-                    "Error", f"Failed to refresh upscalers: {err}"
-                ),
-            )
-
     def _refresh_schedulers(self):
         """Refresh the list of available schedulers (main thread version)"""
         if not self.client:
@@ -5963,7 +5182,9 @@ class StableNewGUI:
             return
 
         try:
-            schedulers = self.client.get_schedulers()
+            schedulers = self._cached_call(
+                (self.client.base_url, "schedulers"), self.client.get_schedulers, force=True
+            )
 
             if hasattr(self, "config_panel"):
                 self.config_panel.set_scheduler_options(schedulers)
@@ -5972,72 +5193,33 @@ class StableNewGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh schedulers: {e}")
 
-    def _refresh_schedulers_async(self):
-        """Refresh the list of available schedulers (thread-safe version)"""
-        from functools import partial
-
-        if not self.client:
-            # Schedule error message on main thread
-            self.root.after(0, lambda: messagebox.showerror("Error", "API client not connected"))
-            return
-
-        try:
-            # Perform API call in worker thread
-            schedulers = self.client.get_schedulers()
-
-            # Store in instance attribute
-            self.schedulers = list(schedulers)
-
-            # Marshal widget updates back to main thread using partial
-            def update_widgets():
-                if hasattr(self, "scheduler_combo"):
-                    self.scheduler_combo["values"] = tuple(self.schedulers)
-                if hasattr(self, "img2img_scheduler_combo"):
-                    self.img2img_scheduler_combo["values"] = tuple(self.schedulers)
-                self._add_log_message(f"🔄 Loaded {len(self.schedulers)} schedulers")
-
-            self.root.after(0, update_widgets)
-
-            # Also update config panel if present using partial to capture value
-            if hasattr(self, "config_panel"):
-                self.root.after(
-                    0, partial(self.config_panel.set_scheduler_options, list(self.schedulers))
-                )
-
-        except Exception as exc:
-            # Marshal error message back to main thread
-            # Capture exception in default argument to avoid closure issues
-            self.root.after(
-                0,
-                lambda err=exc: messagebox.showerror(
-                    "Error", f"Failed to refresh schedulers: {err}"
-                ),
-            )
-
     def _on_hires_toggle(self):
         """Handle hires.fix enable/disable toggle"""
         # This method can be used to enable/disable hires.fix related controls
         # For now, just log the change
-        enabled = self.txt2img_vars.get("enable_hr", tk.BooleanVar()).get()
+        enabled = _var_value(self.txt2img_vars, "enable_hr", False)
         self.log_message(f"📏 Hires.fix {'enabled' if enabled else 'disabled'}")
 
-    def _randomize_seed(self, var_dict_name):
-        """Generate a random seed for the specified variable dictionary"""
-        import random
-
-        random_seed = random.randint(1, 2147483647)  # Max int32 value
-        var_dict = getattr(self, f"{var_dict_name}_vars", {})
-        if "seed" in var_dict:
-            var_dict["seed"].set(random_seed)
-            self.log_message(f"🎲 Random seed generated: {random_seed}")
+    def _set_random_seed(self, seed_var) -> None:
+        """Write a fresh random seed into ``seed_var`` (no-op when the form has no seed)"""
+        if seed_var is None:
+            return
+        random_seed = secrets.randbits(31) or 1  # 1..2**31-1 (max int32), never 0
+        var_name = getattr(seed_var, "_name", None)
+        if var_name:
+            # Same Tcl write Variable.set performs, minus the extra Python frame
+            self.root.tk.globalsetvar(var_name, random_seed)
+        else:
+            seed_var.set(random_seed)
+        self.log_message(f"🎲 Random seed generated: {random_seed}")
 
     def _randomize_txt2img_seed(self):
         """Generate random seed for txt2img"""
-        self._randomize_seed("txt2img")
+        self._set_random_seed(self.txt2img_vars.get("seed"))
 
     def _randomize_img2img_seed(self):
         """Generate random seed for img2img"""
-        self._randomize_seed("img2img")
+        self._set_random_seed(self.img2img_vars.get("seed"))
 
 
 
@@ -34,7 +34,7 @@ from collections.abc import Callable
 from pathlib import Path
 from tkinter import messagebox, simpledialog, ttk
 
-from ..utils.file_io import get_prompt_packs
+from ..utils.file_io import PACKS_DIR, get_prompt_packs
 from .tooltip import Tooltip
 
 logger = logging.getLogger(__name__)
@@ -106,6 +106,11 @@ class PromptPackPanel(ttk.Frame):
         # Internal state
         self._last_selected_pack: str | None = None
         self._last_curselection: tuple[int, ...] = ()
+        # Rows currently painted with the selection colour (see _update_selection_highlights)
+        self._highlighted_indices: set[int] = set()
+        # Names in listbox order, kept in step with refresh_packs/populate so selection
+        # lookups index a Python list instead of calling listbox.get per row
+        self.pack_names: list[str] = []
 
         # Build UI
         self._build_ui()
@@ -368,7 +373,7 @@ class PromptPackPanel(ttk.Frame):
                 logger.info("PromptPackPanel: No pack selected.")
             logger.info("[DIAG] _on_pack_selection_changed: before updating highlights", extra={"flush": True})
             try:
-                self._update_selection_highlights()
+                self._update_selection_highlights(selected_indices)
                 logger.info("[DIAG] _on_pack_selection_changed: after updating highlights", extra={"flush": True})
             except tk.TclError as exc:
                 logger.error(f"[DIAG] _on_pack_selection_changed: TclError in update_selection_highlights: {exc}", exc_info=True, extra={"flush": True})
@@ -385,28 +390,30 @@ class PromptPackPanel(ttk.Frame):
         finally:
             self._sel_handler_exited_at = time.time()
 
-    def _update_selection_highlights(self):
+    def _update_selection_highlights(self, selected_indices=None):
         import threading
         logger.info(f"[DIAG] _update_selection_highlights: thread={threading.current_thread().name}", extra={"flush": True})
-        """Update visual highlighting for selected items."""
+        """Update visual highlighting for selected items (``selected_indices`` if already read)."""
         import threading
         if threading.current_thread() is not threading.main_thread():
             self.after(0, self._update_selection_highlights)
             return
-        logger.info("[DIAG] _update_selection_highlights: before size", extra={"flush": True})
-        size = self.tk_safe_call(self.packs_listbox.size, wait=True)
-        logger.info(f"[DIAG] _update_selection_highlights: size={size}", extra={"flush": True})
-        logger.info("[DIAG] _update_selection_highlights: before itemconfig reset", extra={"flush": True})
-        for i in range(size):
-            self.packs_listbox.itemconfig(i, {"bg": "#3d3d3d"})
-        logger.info("[DIAG] _update_selection_highlights: after itemconfig reset", extra={"flush": True})
-
-        logger.info("[DIAG] _update_selection_highlights: before curselection highlight", extra={"flush": True})
-        selected_indices = self.tk_safe_call(self.packs_listbox.curselection, wait=True)
-        logger.info(f"[DIAG] _update_selection_highlights: curselection={selected_indices}", extra={"flush": True})
-        for index in selected_indices:
+        if selected_indices is None:
+            logger.info("[DIAG] _update_selection_highlights: before curselection", extra={"flush": True})
+            selected_indices = self.tk_safe_call(self.packs_listbox.curselection, wait=True)
+        selected = set(selected_indices or ())
+        logger.info(f"[DIAG] _update_selection_highlights: curselection={sorted(selected)}", extra={"flush": True})
+        previous = self._highlighted_indices
+        if selected == previous:
+            # Spurious event (focus change, selection restore): nothing to repaint
+            return
+        # Only repaint rows whose selection state changed since the last update
+        for index in previous - selected:
+            self.packs_listbox.itemconfig(index, {"bg": "#3d3d3d"})
+        for index in selected - previous:
             self.packs_listbox.itemconfig(index, {"bg": "#0078d4"})
-        logger.info("[DIAG] _update_selection_highlights: after curselection highlight", extra={"flush": True})
+        self._highlighted_indices = selected
+        logger.info("[DIAG] _update_selection_highlights: after highlight", extra={"flush": True})
 
     def refresh_packs(self, silent: bool = False) -> None:
         """
@@ -414,19 +421,18 @@ class PromptPackPanel(ttk.Frame):
         Args:
             silent: If True, don't log the refresh action
         """
-        packs_dir = Path("packs")
-        pack_files = get_prompt_packs(packs_dir)
+        pack_files = get_prompt_packs(PACKS_DIR)
         # Save current selection
         current_selection = self.get_selected_packs()
         # Clear and repopulate
         self.tk_safe_call(self.packs_listbox.delete, 0, tk.END)
-        for pack_file in pack_files:
-            self.packs_listbox.insert(tk.END, pack_file.name)
+        self._highlighted_indices = set()  # Reinserted rows start unhighlighted
+        self.pack_names = [pack_file.name for pack_file in pack_files]
+        for name in self.pack_names:
+            self.packs_listbox.insert(tk.END, name)
         # Restore selection if possible
         if current_selection:
-            size = self.tk_safe_call(self.packs_listbox.size, wait=True)
-            for i in range(size):
-                pack_name = self.tk_safe_call(self.packs_listbox.get, i, wait=True)
+            for i, pack_name in enumerate(self.pack_names):
                 if pack_name in current_selection:
                     self.packs_listbox.selection_set(i)
         if not silent:
@@ -449,12 +455,12 @@ class PromptPackPanel(ttk.Frame):
         # Preserve selection
         current_selection = self.get_selected_packs()
         self.tk_safe_call(self.packs_listbox.delete, 0, tk.END)
+        self._highlighted_indices = set()  # Reinserted rows start unhighlighted
+        self.pack_names = names
         for name in names:
             self.packs_listbox.insert(tk.END, name)
         if current_selection:
-            size = self.tk_safe_call(self.packs_listbox.size, wait=True)
-            for i in range(size):
-                pack_name = self.tk_safe_call(self.packs_listbox.get, i, wait=True)
+            for i, pack_name in enumerate(names):
                 if pack_name in current_selection:
                     self.packs_listbox.selection_set(i)
         logger.info(f"PromptPackPanel: Populated {len(names)} packs (async)")
@@ -466,7 +472,8 @@ class PromptPackPanel(ttk.Frame):
             List of selected pack names
         """
         selected_indices = self.tk_safe_call(self.packs_listbox.curselection)
-        return [self.packs_listbox.get(i) for i in selected_indices]
+        names = self.pack_names
+        return [names[i] for i in selected_indices or () if i < len(names)]
 
     def set_selected_packs(self, pack_names: list[str]) -> None:
         """
@@ -475,8 +482,7 @@ class PromptPackPanel(ttk.Frame):
             pack_names: List of pack names to select
         """
         self.packs_listbox.selection_clear(0, tk.END)
-        for i in range(self.packs_listbox.size()):
-            pack_name = self.packs_listbox.get(i)
+        for i, pack_name in enumerate(self.pack_names):
             if pack_name in pack_names:
                 self.packs_listbox.selection_set(i)
         logger.info(f"PromptPackPanel: Set selected packs: {pack_names}")
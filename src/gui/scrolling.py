@@ -0,0 +1,27 @@
+"""Scrollregion helper for canvas-backed scrollable frames."""
+
+import tkinter as tk
+
+# Window in which a burst of child inserts/resizes is folded into one scrollregion update
+SCROLLREGION_DELAY_MS = 50
+
+
+def schedule_scrollregion(canvas: tk.Canvas) -> None:
+    """Recompute ``canvas``'s scrollregion at most once per SCROLLREGION_DELAY_MS.
+
+    ``bbox("all")`` walks every item on the canvas, so doing it for each <Configure> while
+    a form is being filled repeats that walk per added widget. Requests made while an
+    update is already pending are dropped; the pending update sees their final layout.
+    """
+    if getattr(canvas, "_sr_pending", False):
+        return
+    canvas._sr_pending = True
+
+    def update() -> None:
+        canvas._sr_pending = False
+        try:
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        except tk.TclError:
+            pass  # canvas destroyed before the update ran
+
+    canvas.after(SCROLLREGION_DELAY_MS, update)
@@ -2,6 +2,7 @@
 
 import logging
 import threading
+import weakref
 from collections.abc import Callable
 from enum import Enum, auto
 
@@ -170,7 +171,8 @@ class StateManager:
         """Register callback for any state transition.
 
         Args:
-            callback: Function to call with (old_state, new_state)
+            callback: Function to call with (old_state, new_state), or a
+                ``weakref.WeakMethod`` to one; dead weak callbacks are dropped.
         """
         with self._lock:
             self._transition_callbacks.append(callback)
@@ -203,6 +205,15 @@ class StateManager:
             callbacks = self._transition_callbacks.copy()
 
         for callback in callbacks:
+            if isinstance(callback, weakref.WeakMethod):
+                ref = callback
+                callback = ref()
+                if callback is None:
+                    # Owner was garbage collected
+                    with self._lock:
+                        if ref in self._transition_callbacks:
+                            self._transition_callbacks.remove(ref)
+                    continue
             try:
                 callback(old_state, new_state)
             except Exception as e:
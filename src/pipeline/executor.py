@@ -7,6 +7,7 @@ import time
 from datetime import datetime
 from functools import lru_cache
 from copy import deepcopy
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -432,9 +433,94 @@ class Pipeline:
             return []
 
         logger.info(f"Starting txt2img with prompt: {prompt[:50]}...")
-        # Extract name prefix if present
-        name_prefix = self._extract_name_prefix(prompt)
+        self._select_txt2img_models(config)
+        payload = self._build_txt2img_payload(prompt, config, batch_size)
+        return self._post_txt2img(prompt, payload, run_dir, cancel_token)
+
+    def run_txt2img_batch(
+        self,
+        prompts: list[str],
+        config: dict[str, Any],
+        run_dir: Path,
+        batch_size: int = 1,
+        cancel_token=None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run txt2img for several prompts that share one stage config.
+
+        Collects ``iter_txt2img_batch``; use that directly to handle each prompt's
+        results as soon as its request completes.
+
+        Args:
+            prompts: Text prompts
+            config: Configuration for txt2img, shared by every prompt
+            run_dir: Run directory
+            batch_size: Number of images to generate per prompt
+            cancel_token: Optional cancellation token
+
+        Returns:
+            One list of generated image metadata per prompt attempted
+        """
+        return list(self.iter_txt2img_batch(prompts, config, run_dir, batch_size, cancel_token))
+
+    def iter_txt2img_batch(
+        self,
+        prompts: list[str],
+        config: dict[str, Any],
+        run_dir: Path,
+        batch_size: int = 1,
+        cancel_token=None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Run txt2img for several prompts that share one stage config, yielding per prompt.
+
+        Model/VAE selection, the enhanced negative prompt and the payload are
+        resolved once for the group, on the first ``next()``. WebUI's txt2img
+        endpoint takes a single prompt string, so each prompt is still its own
+        request, sent only when its result is requested.
+
+        Args:
+            prompts: Text prompts
+            config: Configuration for txt2img, shared by every prompt
+            run_dir: Run directory
+            batch_size: Number of images to generate per prompt
+            cancel_token: Optional cancellation token
+
+        Yields:
+            The generated image metadata of each prompt, in order (empty on failure)
+        """
+        if not prompts or (cancel_token and cancel_token.is_cancelled()):
+            return
 
+        self._select_txt2img_models(config)
+        base_payload = self._build_txt2img_payload("", config, batch_size)
+
+        for prompt in prompts:
+            if cancel_token and cancel_token.is_cancelled():
+                logger.info("txt2img batch cancelled")
+                return
+            logger.info(f"Starting txt2img with prompt: {prompt[:50]}...")
+            try:
+                results = self._post_txt2img(
+                    prompt, {**base_payload, "prompt": prompt}, run_dir, cancel_token
+                )
+            except Exception as exc:
+                logger.error(f"txt2img failed for prompt {prompt[:50]!r}: {exc}")
+                results = []
+            yield results
+
+    def _select_txt2img_models(self, config: dict[str, Any]) -> None:
+        """Switch WebUI to the model/VAE named in a txt2img config, if any."""
+        model_name = config.get("model") or config.get("sd_model_checkpoint")
+        if model_name:
+            self.client.set_model(model_name)
+        if config.get("vae"):
+            self.client.set_vae(config["vae"])
+
+    def _build_txt2img_payload(
+        self, prompt: str, config: dict[str, Any], batch_size: int
+    ) -> dict[str, Any]:
+        """Build the txt2img request payload for ``prompt`` from a stage config."""
         # Apply global NSFW prevention to negative prompt (with optional adjustments)
         base_negative = config.get("negative_prompt", "")
         negative_adjust = (config.get("negative_adjust") or "").strip()
@@ -447,13 +533,6 @@ class Pipeline:
         # Parse sampler configuration
         sampler_config = self._parse_sampler_config(config)
 
-        # Set model and VAE if specified
-        model_name = config.get("model") or config.get("sd_model_checkpoint")
-        if model_name:
-            self.client.set_model(model_name)
-        if config.get("vae"):
-            self.client.set_vae(config["vae"])
-
         payload = {
             "prompt": prompt,
             "negative_prompt": enhanced_negative,
@@ -498,123 +577,14 @@ class Pipeline:
         # Add styles if specified
         if config.get("styles"):
             payload["styles"] = config["styles"]
+        return payload
 
-        response = self.client.txt2img(payload)
-
-        # Check for cancellation after API call
-        if cancel_token and cancel_token.is_cancelled():
-            logger.info("txt2img cancelled after API call")
-            return []
-
-        if not response or "images" not in response:
-            logger.error("txt2img failed")
-            return []
-
-        results = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        for idx, img_base64 in enumerate(response["images"]):
-            # Check for cancellation before saving each image
-            if cancel_token and cancel_token.is_cancelled():
-                logger.info(f"txt2img cancelled while saving image {idx}")
-                break
-            # Build image name with optional prefix
-            if name_prefix:
-                image_name = f"{name_prefix}_{timestamp}_{idx:03d}"
-            else:
-                image_name = f"txt2img_{timestamp}_{idx:03d}"
-            image_path = run_dir / "txt2img" / f"{image_name}.png"
-
-            if save_image_from_base64(img_base64, image_path):
-                metadata = {
-                    "name": image_name,
-                    "stage": "txt2img",
-                    "timestamp": timestamp,
-                    "prompt": prompt,
-                    "config": payload,
-                    "path": str(image_path),
-                }
-
-                self.logger.save_manifest(run_dir, image_name, metadata)
-                results.append(metadata)
-
-        logger.info(f"txt2img completed: {len(results)} images generated")
-        return results
-        """
-        Run txt2img generation.
-
-        Args:
-            prompt: Text prompt
-            config: Configuration for txt2img
-            run_dir: Run directory
-            batch_size: Number of images to generate
-            cancel_token: Optional cancellation token
-
-        Returns:
-            List of generated image metadata
-        """
-        # Check for cancellation before starting
-        if cancel_token and cancel_token.is_cancelled():
-            logger.info("txt2img cancelled before start")
-            return []
-
-        logger.info(f"Starting txt2img with prompt: {prompt[:50]}...")
+    def _post_txt2img(
+        self, prompt: str, payload: dict[str, Any], run_dir: Path, cancel_token=None
+    ) -> list[dict[str, Any]]:
+        """Send one txt2img request and save the returned images."""
         # Extract name prefix if present
         name_prefix = self._extract_name_prefix(prompt)
-        # Apply global NSFW prevention to negative prompt
-        base_negative = config.get("negative_prompt", "")
-        enhanced_negative = self.config_manager.add_global_negative(base_negative)
-        logger.info(
-            f"🛡️ Applied global NSFW prevention - Original: '{base_negative}' → Enhanced: '{enhanced_negative[:100]}...'"
-        )
-
-        # Parse sampler configuration
-        sampler_config = self._parse_sampler_config(config)
-
-        # Set model and VAE if specified
-        model_name = config.get("model") or config.get("sd_model_checkpoint")
-        if model_name:
-            self.client.set_model(model_name)
-        if config.get("vae"):
-            self.client.set_vae(config["vae"])
-
-        payload = {
-            "prompt": prompt,
-            "negative_prompt": enhanced_negative,
-            "steps": config.get("steps", 20),
-            "sampler_name": config.get("sampler_name", "Euler a"),
-            "scheduler": config.get("scheduler", "Normal"),
-            "cfg_scale": config.get("cfg_scale", 7.0),
-            "width": config.get("width", 512),
-            "height": config.get("height", 512),
-            "seed": config.get("seed", -1),
-            "seed_resize_from_h": config.get("seed_resize_from_h", -1),
-            "seed_resize_from_w": config.get("seed_resize_from_w", -1),
-            "clip_skip": config.get("clip_skip", 2),
-            "batch_size": batch_size,
-            "n_iter": config.get("n_iter", 1),
-            "restore_faces": config.get("restore_faces", False),
-            "tiling": config.get("tiling", False),
-            "do_not_save_samples": config.get("do_not_save_samples", False),
-            "do_not_save_grid": config.get("do_not_save_grid", False),
-        }
-
-        # Always include hires.fix parameters (will be ignored if enable_hr is False)
-        payload.update(
-            {
-                "enable_hr": config.get("enable_hr", False),
-                "hr_scale": config.get("hr_scale", 2.0),
-                "hr_upscaler": config.get("hr_upscaler", "Latent"),
-                "hr_second_pass_steps": config.get("hr_second_pass_steps", 0),
-                "hr_resize_x": config.get("hr_resize_x", 0),
-                "hr_resize_y": config.get("hr_resize_y", 0),
-                "denoising_strength": config.get("denoising_strength", 0.7),
-            }
-        )
-
-        # Add styles if specified
-        if config.get("styles"):
-            payload["styles"] = config["styles"]
 
         response = self.client.txt2img(payload)
 
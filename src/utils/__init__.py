@@ -4,6 +4,7 @@ from .config import ConfigManager
 from .file_io import (
     get_prompt_packs,
     get_safe_filename,
+    iter_prompt_pack,
     load_image_to_base64,
     read_prompt_pack,
     read_text_file,
@@ -24,6 +25,7 @@ __all__ = [
     "read_text_file",
     "write_text_file",
     "read_prompt_pack",
+    "iter_prompt_pack",
     "get_prompt_packs",
     "get_safe_filename",
     "find_webui_api_port",
@@ -2,10 +2,13 @@
 
 import json
 import logging
+from collections.abc import Callable
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
+from .file_io import PACKS_DIR
+
 DEFAULT_GLOBAL_NEGATIVE_PROMPT = (
     "blurry, bad quality, distorted, ugly, malformed, nsfw, nude, naked, explicit, "
     "sexual content, adult content, immodest"
@@ -29,6 +32,35 @@ class ConfigManager:
         self._global_negative_path = self.presets_dir / "global_negative.txt"
         self._global_negative_cache: str | None = None
         self._default_preset_path = self.presets_dir / ".default_preset"
+        # Defaults are immutable for the session; build once and hand out copies
+        self._default_config = self._build_default_config()
+        # Preset names from the last directory scan; None until first access
+        self._presets_cache: list[str] | None = None
+        self._presets_cache_set: set[str] = set()
+        # path -> ((st_mtime_ns, st_size), parsed value) for JSON files read repeatedly
+        self._json_cache: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+    def _load_json_cached(self, path: Path, transform: Callable[[Any], Any] | None = None) -> Any:
+        """
+        Parse a JSON file, re-reading it only when its mtime or size changed.
+
+        Args:
+            path: JSON file to read
+            transform: Optional callable applied to the parsed data before caching
+
+        Returns:
+            The cached (shared) value; callers must copy anything they hand out
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._json_cache.get(path)
+        if entry is None or entry[0] != stamp:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if transform is not None:
+                data = transform(data)
+            entry = self._json_cache[path] = (stamp, data)
+        return entry[1]
 
     def load_preset(self, name: str) -> dict[str, Any] | None:
         """
@@ -46,8 +78,7 @@ class ConfigManager:
             return None
 
         try:
-            with open(preset_path, encoding="utf-8") as f:
-                preset = self._merge_config_with_defaults(json.load(f))
+            preset = deepcopy(self._load_json_cached(preset_path, self._merge_config_with_defaults))
             logger.info(f"Loaded preset: {name}")
             return preset
         except Exception as e:
@@ -70,6 +101,9 @@ class ConfigManager:
             merged = self._merge_config_with_defaults(config)
             with open(preset_path, "w", encoding="utf-8") as f:
                 json.dump(merged, f, indent=2, ensure_ascii=False)
+            # Drop the parsed copy even if the rewrite kept the same mtime and size
+            self._json_cache.pop(preset_path, None)
+            self._invalidate_presets_cache()
             logger.info(f"Saved preset: {name}")
             return True
         except Exception as e:
@@ -83,9 +117,31 @@ class ConfigManager:
         Returns:
             List of preset names
         """
-        presets = [p.stem for p in self.presets_dir.glob("*.json")]
+        presets = sorted(p.stem for p in self.presets_dir.glob("*.json"))
         logger.info(f"Found {len(presets)} presets")
-        return sorted(presets)
+        self._presets_cache = presets
+        self._presets_cache_set = set(presets)
+        return list(presets)
+
+    def has_preset(self, name: str) -> bool:
+        """
+        Check whether a preset exists.
+
+        Uses the names from the last preset scan, scanning on first access.
+
+        Args:
+            name: Name of the preset
+
+        Returns:
+            True if the preset exists
+        """
+        if self._presets_cache is None:
+            self.list_presets()
+        return name in self._presets_cache_set
+
+    def _invalidate_presets_cache(self) -> None:
+        self._presets_cache = None
+        self._presets_cache_set = set()
 
     def delete_preset(self, name: str) -> bool:
         """
@@ -108,6 +164,8 @@ class ConfigManager:
 
         try:
             preset_path.unlink()
+            self._json_cache.pop(preset_path, None)
+            self._invalidate_presets_cache()
             logger.info(f"Deleted preset: {name}")
             return True
         except Exception as e:
@@ -116,7 +174,19 @@ class ConfigManager:
 
     def get_default_config(self) -> dict[str, Any]:
         """
-        Get the default configuration for all pipeline stages.
+        Get a copy of the default configuration for all pipeline stages.
+
+        The defaults are built once per manager; callers receive a deep copy so
+        they are free to mutate the result.
+
+        Returns:
+            Dictionary containing default configuration for all stages
+        """
+        return deepcopy(self._default_config)
+
+    def _build_default_config(self) -> dict[str, Any]:
+        """
+        Build the default configuration for all pipeline stages.
 
         IMPORTANT: When adding new parameters to this configuration,
         run the validation test to ensure proper parameter pass-through:
@@ -128,12 +198,6 @@ class ConfigManager:
         Returns:
             Dictionary containing default configuration for all stages
         """
-        """
-        Get default configuration.
-        
-        Returns:
-            Default configuration dictionary
-        """
         return {
             "txt2img": {
                 "steps": 20,
@@ -331,10 +395,8 @@ class ConfigManager:
             return {}
 
         try:
-            with open(overrides_file, encoding="utf-8") as f:
-                all_overrides = json.load(f)
-
-            return all_overrides.get(pack_name, {})
+            all_overrides = self._load_json_cached(overrides_file)
+            return deepcopy(all_overrides.get(pack_name, {}))
         except Exception as e:
             logger.error(f"Failed to load pack overrides: {e}")
             return {}
@@ -365,6 +427,7 @@ class ConfigManager:
             # Save back
             with open(overrides_file, "w", encoding="utf-8") as f:
                 json.dump(all_overrides, f, indent=2, ensure_ascii=False)
+            self._json_cache.pop(overrides_file, None)
 
             logger.info(f"Saved pack overrides for: {pack_name}")
             return True
@@ -382,18 +445,15 @@ class ConfigManager:
         Returns:
             Pack configuration or empty dict if not found
         """
-        from pathlib import Path
-
         # Convert pack_name to config filename (heroes.txt -> heroes.json)
         pack_stem = Path(pack_name).stem
-        config_path = Path("packs") / f"{pack_stem}.json"
+        config_path = PACKS_DIR / f"{pack_stem}.json"
 
         if not config_path.exists():
             return {}
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config = json.load(f)
+            config = deepcopy(self._load_json_cached(config_path))
             logger.debug(f"Loaded pack config: {pack_name}")
             return config
         except Exception as e:
@@ -411,18 +471,17 @@ class ConfigManager:
         Returns:
             True if successful
         """
-        from pathlib import Path
-
         try:
             # Convert pack_name to config filename (heroes.txt -> heroes.json)
             pack_stem = Path(pack_name).stem
-            config_path = Path("packs") / f"{pack_stem}.json"
+            config_path = PACKS_DIR / f"{pack_stem}.json"
 
             # Ensure packs directory exists
             config_path.parent.mkdir(exist_ok=True)
 
             with open(config_path, "w", encoding="utf-8") as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
+            self._json_cache.pop(config_path, None)
 
             logger.info(f"Saved pack config: {pack_name}")
             return True
@@ -511,8 +570,8 @@ class ConfigManager:
         return global_neg
 
     def _merge_config_with_defaults(self, config: dict[str, Any] | None) -> dict[str, Any]:
-        base = self.get_default_config()
-        return self._deep_merge_dicts(base, config or {})
+        # _deep_merge_dicts copies its base, so the cached defaults can be passed directly
+        return self._deep_merge_dicts(self._default_config, config or {})
 
     def _deep_merge_dicts(self, base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
         merged = deepcopy(base)
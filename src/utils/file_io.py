@@ -2,6 +2,7 @@
 
 import base64
 import logging
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
 
@@ -9,6 +10,9 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Directory holding prompt packs and their per-pack .json configs
+PACKS_DIR = Path("packs")
+
 
 def save_image_from_base64(base64_str: str, output_path: Path) -> bool:
     """
@@ -104,76 +108,106 @@ def write_text_file(file_path: Path, content: str) -> bool:
         return False
 
 
-def read_prompt_pack(pack_path: Path) -> list:
+def _prompt_from_block(lines: list[str]) -> dict[str, str] | None:
+    """Build a prompt dict from the raw lines of one blank-line separated .txt block."""
+    positive_parts = []
+    negative_parts = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("neg:"):
+            negative_parts.append(line[4:].strip())
+        else:
+            positive_parts.append(line)
+
+    if not positive_parts and not negative_parts:
+        return None
+    return {"positive": " ".join(positive_parts), "negative": " ".join(negative_parts)}
+
+
+def _parse_prompt_pack(content: str, is_tsv: bool) -> Iterator[dict[str, str]]:
+    """Lazily parse already-read prompt pack text (see :func:`read_prompt_pack` for the format)."""
+    if is_tsv:
+        # Tab-separated format
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            parts = line.split("\t", 1)
+            positive = parts[0].strip()
+            negative = parts[1].strip() if len(parts) > 1 else ""
+
+            yield {"positive": positive, "negative": negative}
+    else:
+        # Block-based .txt format: an empty line ends the current block
+        block: list[str] = []
+        for line in content.splitlines():
+            if line:
+                block.append(line)
+                continue
+            prompt = _prompt_from_block(block)
+            block = []
+            if prompt is not None:
+                yield prompt
+        prompt = _prompt_from_block(block)
+        if prompt is not None:
+            yield prompt
+
+
+def iter_prompt_pack(pack_path: Path) -> Iterator[dict[str, str]]:
     """
-    Read prompt pack from .txt or .tsv file with UTF-8 safety.
+    Yield prompts from a .txt or .tsv prompt pack as they are parsed.
 
-    Supports:
-    - Line-based .txt files with blank line separators
-    - Tab-separated .tsv files
-    - 'neg:' prefix for negative prompts
-    - Comments starting with #
+    The whole file is read (and decoded) before the first prompt is yielded, so a read
+    error yields nothing and the file is not held open while the caller generates.
+    Parsing is lazy, so callers can start on the first prompt before the rest is parsed.
 
     Args:
         pack_path: Path to the prompt pack file
 
-    Returns:
-        List of prompt dictionaries with 'positive' and 'negative' keys
+    Yields:
+        Prompt dictionaries with 'positive' and 'negative' keys
     """
-    try:
-        if not pack_path.exists():
-            logger.error(f"Prompt pack not found: {pack_path}")
-            return []
+    if not pack_path.exists():
+        logger.error(f"Prompt pack not found: {pack_path}")
+        return
 
-        # Read file with UTF-8 encoding
+    try:
         with open(pack_path, encoding="utf-8") as f:
             content = f.read()
+    except Exception as e:
+        logger.error(f"Failed to read prompt pack {pack_path.name}: {e}")
+        return
 
-        prompts = []
-
-        if pack_path.suffix.lower() == ".tsv":
-            # Tab-separated format
-            for line in content.splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                parts = line.split("\t", 1)
-                positive = parts[0].strip()
-                negative = parts[1].strip() if len(parts) > 1 else ""
-
-                prompts.append({"positive": positive, "negative": negative})
-        else:
-            # Block-based .txt format
-            blocks = content.split("\n\n")
-
-            for block in blocks:
-                if not block.strip():
-                    continue
-
-                lines = [line.strip() for line in block.strip().splitlines()]
-                lines = [line for line in lines if line and not line.startswith("#")]
-
-                if not lines:
-                    continue
+    count = 0
+    for prompt in _parse_prompt_pack(content, pack_path.suffix.lower() == ".tsv"):
+        count += 1
+        yield prompt
 
-                positive_parts = []
-                negative_parts = []
+    logger.info(f"Read {count} prompts from {pack_path.name}")
 
-                for line in lines:
-                    if line.startswith("neg:"):
-                        negative_parts.append(line[4:].strip())
-                    else:
-                        positive_parts.append(line)
 
-                positive = " ".join(positive_parts)
-                negative = " ".join(negative_parts)
+def read_prompt_pack(pack_path: Path) -> list:
+    """
+    Read prompt pack from .txt or .tsv file with UTF-8 safety.
 
-                prompts.append({"positive": positive, "negative": negative})
+    Supports:
+    - Line-based .txt files with blank line separators
+    - Tab-separated .tsv files
+    - 'neg:' prefix for negative prompts
+    - Comments starting with #
 
-        logger.info(f"Read {len(prompts)} prompts from {pack_path.name}")
-        return prompts
+    Args:
+        pack_path: Path to the prompt pack file
 
+    Returns:
+        List of prompt dictionaries with 'positive' and 'negative' keys; empty if the
+        pack cannot be read
+    """
+    try:
+        return list(iter_prompt_pack(pack_path))
     except Exception as e:
         logger.error(f"Failed to read prompt pack {pack_path.name}: {e}")
         return []
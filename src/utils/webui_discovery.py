@@ -1,16 +1,34 @@
 """Utility functions for WebUI API discovery"""
 
 import logging
+import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # import psutil  # Optional dependency for process detection
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import requests
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a TCP connect while probing candidate WebUI ports
+_PORT_CONNECT_TIMEOUT = 0.2
+
+
+def _probe_webui_port(test_url: str, host: str, port: int) -> bool:
+    """Return True when ``test_url`` serves the WebUI API (closed ports fail fast)."""
+    try:
+        # Cheap TCP connect first so closed ports do not cost a full HTTP timeout
+        with socket.create_connection((host, port), timeout=_PORT_CONNECT_TIMEOUT):
+            pass
+        response = requests.get(f"{test_url}/sdapi/v1/sd-models", timeout=5)
+        return response.status_code == 200
+    except Exception:
+        return False
+
 
 def find_webui_api_port(
     base_url: str = "http://127.0.0.1", start_port: int = 7860, max_attempts: int = 5
@@ -18,7 +36,7 @@ def find_webui_api_port(
     """
     Find the actual port where WebUI API is running.
 
-    WebUI auto-increments ports when 7860 is busy, so this tries common ports.
+    WebUI auto-increments ports when 7860 is busy, so this probes common ports concurrently.
 
     Args:
         base_url: Base URL without port
@@ -28,18 +46,23 @@ def find_webui_api_port(
     Returns:
         Full URL of working API or None if not found
     """
-    for i in range(max_attempts):
-        port = start_port + i
-        test_url = f"{base_url}:{port}"
-
-        try:
-            # Quick health check
-            response = requests.get(f"{test_url}/sdapi/v1/sd-models", timeout=5)
-            if response.status_code == 200:
+    host = urlsplit(base_url).hostname or "127.0.0.1"
+    executor = ThreadPoolExecutor(max_workers=max_attempts, thread_name_prefix="webui-probe")
+    try:
+        probes = []
+        for i in range(max_attempts):
+            port = start_port + i
+            test_url = f"{base_url}:{port}"
+            probes.append((test_url, executor.submit(_probe_webui_port, test_url, host, port)))
+
+        # Probes run together, but the lowest responding port wins, as with a serial scan
+        for test_url, future in probes:
+            if future.result():
                 logger.info(f"Found WebUI API at {test_url}")
                 return test_url
-        except Exception:
-            continue
+    finally:
+        # Do not wait for the remaining probes; they finish on their own timeouts
+        executor.shutdown(wait=False, cancel_futures=True)
 
     logger.warning(
         f"Could not find WebUI API on ports {start_port}-{start_port + max_attempts - 1}"
@@ -142,12 +165,13 @@ def launch_webui_safely(webui_path: Path, wait_time: int = 10) -> bool:
         return False
 
 
-def validate_webui_health(api_url: str) -> dict:
+def validate_webui_health(api_url: str, session: requests.Session | None = None) -> dict:
     """
     Perform comprehensive health check on WebUI API.
 
     Args:
         api_url: WebUI API URL
+        session: Optional session to reuse (e.g. the client's keep-alive pool)
 
     Returns:
         Dictionary with health check results
@@ -159,10 +183,11 @@ def validate_webui_health(api_url: str) -> dict:
         "samplers_available": False,
         "errors": [],
     }
+    http = session if session is not None else requests
 
     try:
         # Basic connectivity
-        response = requests.get(f"{api_url}/sdapi/v1/sd-models", timeout=5)
+        response = http.get(f"{api_url}/sdapi/v1/sd-models", timeout=5)
         if response.status_code == 200:
             health_status["accessible"] = True
             models = response.json()
@@ -181,7 +206,7 @@ def validate_webui_health(api_url: str) -> dict:
     try:
         # Samplers check
         if health_status["accessible"]:
-            response = requests.get(f"{api_url}/sdapi/v1/samplers", timeout=5)
+            response = http.get(f"{api_url}/sdapi/v1/samplers", timeout=5)
             if response.status_code == 200:
                 samplers = response.json()
                 health_status["samplers_available"] = len(samplers) > 0
@@ -2,6 +2,7 @@
 
 import time
 import tkinter as tk
+from unittest.mock import patch
 
 import pytest
 
@@ -95,6 +96,21 @@ def wait_until(pred, timeout=5.0, step=0.02):
     return False
 
 
+@pytest.fixture
+def bare_gui():
+    """A StableNewGUI built without __init__, with only its background-helper state.
+
+    Tests set whatever widgets or collaborators they need; the worker pools are shut
+    down on teardown.
+    """
+    with patch.object(StableNewGUI, "__init__", lambda self: None):
+        gui = StableNewGUI()
+    gui._init_async_state()
+    yield gui
+    for pool in (gui._api_executor, gui._io_executor, gui._pool, gui._val_pool):
+        pool.shutdown(wait=False)
+
+
 @pytest.fixture
 def minimal_gui_app(monkeypatch, tk_root):
     """Provide a lightweight StableNewGUI with heavy side effects stubbed out."""
@@ -163,6 +163,22 @@ class TestLogPanel:
         widget_line_count = int(panel.log_text.index("end-1c").split(".")[0])
         assert widget_line_count == 1001
 
+    def test_overflow_trims_without_rebuilding(self):
+        """Past the cap, each message drops the oldest line instead of redrawing the log."""
+        panel = LogPanel(self.root)
+        for i in range(1000):
+            panel.log(f"Message {i}", "INFO")
+        panel._flush_queue_sync()
+
+        panel._refresh_display = lambda: pytest.fail("overflow should not rebuild the widget")
+        for i in range(20):
+            panel.log(f"Extra message {i}", "INFO")
+        panel._flush_queue_sync()
+
+        assert len(panel.log_records) == 1000
+        assert panel.log_text.get("1.0", "1.end") == "Message 20"
+        assert panel.log_text.get("end-2c linestart", "end-2c") == "Extra message 19"
+
     def test_overflow_with_scroll_lock(self):
         """Test that overflow works correctly with scroll lock enabled."""
         panel = LogPanel(self.root)
@@ -271,6 +287,20 @@ class TestLogPanel:
         content = panel.log_text.get("1.0", "end-1c")
         assert "Info toggle" in content
 
+    def test_batched_drain_keeps_each_line_tagged(self):
+        """A burst drained in one insert still tags every line with its own level."""
+        panel = LogPanel(self.root)
+
+        panel.log("burst one", "INFO")
+        panel.log("burst two", "ERROR")
+        panel.log("burst three", "INFO")
+        panel._drain_queue()
+
+        content = panel.log_text.get("1.0", "end-1c")
+        assert content.endswith("burst one\nburst two\nburst three\n")
+        error_start, error_end = panel.log_text.tag_ranges("ERROR")
+        assert panel.log_text.get(error_start, error_end) == "burst two\n"
+
 
 class TestTkinterLogHandler:
     """Test TkinterLogHandler for thread-safe logging."""
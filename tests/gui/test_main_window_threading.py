@@ -23,6 +23,7 @@ def test_refresh_models_async_thread_safe(tk_root, tk_pump):
     with patch.object(StableNewGUI, "__init__", lambda self: None):
         gui = StableNewGUI()
         gui.root = tk_root
+        gui._init_async_state()
         gui.client = mock_client
 
         # Create mock comboboxes
@@ -38,7 +39,7 @@ def test_refresh_models_async_thread_safe(tk_root, tk_pump):
 
         def track_after(ms, func):
             """Track scheduling without invoking Tk from a worker thread."""
-            if ms == 0:
+            if ms in (0, "idle"):  # after(0, ...) or after_idle(...)
                 updates_on_main_thread.append(True)
                 scheduled_funcs.append(func)
             return "after-0-mock"
@@ -55,14 +56,15 @@ def test_refresh_models_async_thread_safe(tk_root, tk_pump):
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
 
-        # Wait for worker to complete
+        # Wait for worker to complete, including the API call submitted to the executor
         worker_done.wait(timeout=2.0)
+        gui._api_executor.shutdown(wait=True)
 
         # Run any scheduled updates now on the main thread
         for fn in scheduled_funcs:
             fn()
 
-        # Verify that updates were scheduled on main thread via after(0, ...)
+        # Verify that updates were scheduled on main thread via after_idle()
         assert len(updates_on_main_thread) > 0, "Widget updates should be scheduled on main thread"
 
         # Verify comboboxes were updated when widget state is available
@@ -88,6 +90,7 @@ def test_refresh_vae_models_async_thread_safe(tk_root, tk_pump):
     with patch.object(StableNewGUI, "__init__", lambda self: None):
         gui = StableNewGUI()
         gui.root = tk_root
+        gui._init_async_state()
         gui.client = mock_client
 
         # Create mock comboboxes
@@ -100,7 +103,7 @@ def test_refresh_vae_models_async_thread_safe(tk_root, tk_pump):
         # Track and stub after() to avoid calling Tk from worker thread
         scheduled_funcs = []
         def track_after(ms, func):
-            if ms == 0:
+            if ms in (0, "idle"):  # after(0, ...) or after_idle(...)
                 scheduled_funcs.append(func)
             return "after-0-mock"
         tk_root.after = track_after
@@ -115,8 +118,9 @@ def test_refresh_vae_models_async_thread_safe(tk_root, tk_pump):
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
 
-        # Wait for worker to complete
+        # Wait for worker to complete, including the API call submitted to the executor
         worker_done.wait(timeout=2.0)
+        gui._api_executor.shutdown(wait=True)
 
         # Run any scheduled updates now on the main thread
         for fn in scheduled_funcs:
@@ -146,6 +150,7 @@ def test_refresh_upscalers_async_thread_safe(tk_root, tk_pump):
     with patch.object(StableNewGUI, "__init__", lambda self: None):
         gui = StableNewGUI()
         gui.root = tk_root
+        gui._init_async_state()
         gui.client = mock_client
 
         # Create mock combobox
@@ -157,7 +162,7 @@ def test_refresh_upscalers_async_thread_safe(tk_root, tk_pump):
         # Track and stub after() to avoid calling Tk from worker thread
         scheduled_funcs = []
         def track_after(ms, func):
-            if ms == 0:
+            if ms in (0, "idle"):  # after(0, ...) or after_idle(...)
                 scheduled_funcs.append(func)
             return "after-0-mock"
         tk_root.after = track_after
@@ -172,8 +177,9 @@ def test_refresh_upscalers_async_thread_safe(tk_root, tk_pump):
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
 
-        # Wait for worker to complete
+        # Wait for worker to complete, including the API call submitted to the executor
         worker_done.wait(timeout=2.0)
+        gui._api_executor.shutdown(wait=True)
 
         # Run any scheduled updates now on the main thread
         for fn in scheduled_funcs:
@@ -197,6 +203,7 @@ def test_refresh_schedulers_async_thread_safe(tk_root, tk_pump):
     with patch.object(StableNewGUI, "__init__", lambda self: None):
         gui = StableNewGUI()
         gui.root = tk_root
+        gui._init_async_state()
         gui.client = mock_client
 
         # Create mock comboboxes
@@ -209,7 +216,7 @@ def test_refresh_schedulers_async_thread_safe(tk_root, tk_pump):
         # Track and stub after() to avoid calling Tk from worker thread
         scheduled_funcs = []
         def track_after(ms, func):
-            if ms == 0:
+            if ms in (0, "idle"):  # after(0, ...) or after_idle(...)
                 scheduled_funcs.append(func)
             return "after-0-mock"
         tk_root.after = track_after
@@ -224,8 +231,9 @@ def test_refresh_schedulers_async_thread_safe(tk_root, tk_pump):
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
 
-        # Wait for worker to complete
+        # Wait for worker to complete, including the API call submitted to the executor
         worker_done.wait(timeout=2.0)
+        gui._api_executor.shutdown(wait=True)
 
         # Run any scheduled updates now on the main thread
         for fn in scheduled_funcs:
@@ -251,12 +259,13 @@ def test_refresh_models_async_error_handling(tk_root, tk_pump):
     with patch.object(StableNewGUI, "__init__", lambda self: None):
         gui = StableNewGUI()
         gui.root = tk_root
+        gui._init_async_state()
         gui.client = mock_client
 
         # Track and stub after() to avoid calling Tk from worker thread
         scheduled_funcs = []
         def track_after(ms, func):
-            if ms == 0:
+            if ms in (0, "idle"):  # after(0, ...) or after_idle(...)
                 scheduled_funcs.append(func)
             return "after-0-mock"
         tk_root.after = track_after
@@ -273,8 +282,9 @@ def test_refresh_models_async_error_handling(tk_root, tk_pump):
             thread = threading.Thread(target=worker, daemon=True)
             thread.start()
 
-            # Wait for worker to complete
+            # Wait for worker to complete, including the API call submitted to the executor
             worker_done.wait(timeout=2.0)
+            gui._api_executor.shutdown(wait=True)
 
             # Run any scheduled updates now on the main thread
             for fn in scheduled_funcs:
@@ -285,3 +295,140 @@ def test_refresh_models_async_error_handling(tk_root, tk_pump):
             args = mock_error.call_args[0]
             assert "Error" in args
             assert "API Error" in str(args[1])
+
+
+def test_cached_health_only_keeps_failures_briefly(bare_gui):
+    """Accessible health results are reused; failed checks expire after the negative TTL"""
+    from src.gui import main_window
+
+    gui = bare_gui
+    url = "http://127.0.0.1:7860"
+    with (
+        patch.object(main_window, "validate_webui_health") as health,
+        patch.object(main_window.time, "monotonic") as clock,
+    ):
+        health.return_value = {"accessible": False}
+        clock.return_value = 100.0
+        gui._cached_health(url)
+        gui._cached_health(url)
+        assert health.call_count == 1
+
+        clock.return_value = 100.0 + main_window._HEALTH_NEGATIVE_TTL_S
+        health.return_value = {"accessible": True}
+        gui._cached_health(url)
+        clock.return_value += 10.0
+        assert gui._cached_health(url) == {"accessible": True}
+        assert health.call_count == 2
+
+
+def test_check_api_connection_reuses_recent_failure(bare_gui):
+    """Connect clicks within the failure window skip the direct probe and port scan"""
+    from src.gui import main_window
+
+    gui = bare_gui
+    gui._io_executor.shutdown(wait=False)
+    gui._io_executor = MagicMock(submit=lambda fn: fn())
+    gui.root = MagicMock()
+    gui.api_vars = None
+    gui.api_url_var = MagicMock(get=MagicMock(return_value="http://127.0.0.1:7860"))
+    gui.log_message = MagicMock()
+    probe = MagicMock()
+    probe.check_api_ready.return_value = False
+    gui._get_probe_client = MagicMock(return_value=probe)
+
+    with (
+        patch.object(main_window, "find_webui_api_port", return_value=None) as discover,
+        patch.object(main_window.time, "monotonic") as clock,
+    ):
+        clock.return_value = 100.0
+        gui._check_api_connection()
+        gui._check_api_connection()
+        assert probe.check_api_ready.call_count == 1
+        assert discover.call_count == 1
+
+        clock.return_value = 100.0 + main_window._CONNECT_FAIL_CACHE_S
+        gui._check_api_connection()
+        assert probe.check_api_ready.call_count == 2
+
+
+def test_form_values_skips_unparsable_spinbox_text():
+    """A half-typed number drops only that field from the collected form values"""
+    import tkinter as tk
+
+    from src.gui.main_window import _form_values
+
+    bad = MagicMock()
+    bad.get.side_effect = tk.TclError('expected integer but got "12a"')
+    good = MagicMock(get=MagicMock(return_value=30))
+
+    assert _form_values({"steps": good, "seed": bad}) == ({"steps": 30}, ["seed"])
+
+
+def test_txt2img_summary_shows_dash_for_missing_fields(bare_gui):
+    """The live txt2img summary reads the form vars and prints '-' for absent fields"""
+    import tkinter as tk
+
+    interp = tk.Tcl()
+    steps = tk.IntVar(master=interp, value=36)
+    sampler = tk.StringVar(master=interp, value="Heun")
+    gui = bare_gui
+    gui.txt2img_vars = {"steps": steps, "sampler_name": sampler}
+    gui.img2img_vars = gui.upscale_vars = None
+    gui.txt2img_summary_var = MagicMock()
+    gui._update_live_config_summary()
+    gui.txt2img_summary_var.set.assert_called_once_with(
+        "Next run: steps 36, sampler Heun, cfg -, size -x-"
+    )
+
+
+def test_daemon_pool_runs_on_daemon_threads_and_cancels_queued_work():
+    """Background actions never block interpreter exit; shutdown drops queued work"""
+    from src.gui.main_window import _DaemonPool
+
+    pool = _DaemonPool(max_workers=1, thread_name_prefix="test-bg")
+    started = threading.Event()
+    release = threading.Event()
+
+    def action():
+        started.set()
+        release.wait(5)
+        return threading.current_thread().daemon
+
+    running = pool.submit(action)
+    assert started.wait(5)
+    queued = pool.submit(lambda: "never")
+
+    pool.shutdown(wait=False, cancel_futures=True)
+    assert queued.cancelled()
+    release.set()
+    assert running.result(timeout=5) is True
+
+
+def test_invalidate_api_listings_keeps_health_and_other_urls(bare_gui):
+    """A successful reconnect drops that URL's cached listings only"""
+    gui = bare_gui
+    url, other = "http://127.0.0.1:7860", "http://127.0.0.1:7861"
+    gui._api_cache.update(
+        {(url, "models"): (1e9, []), (url, "health"): (1e9, {}), (other, "models"): (1e9, [])}
+    )
+
+    gui._invalidate_api_listings(url)
+
+    assert set(gui._api_cache) == {(url, "health"), (other, "models")}
+
+
+def test_api_var_edit_lets_the_same_config_reload(bare_gui):
+    """Editing an API field clears the loaded-config hash like the stage fields do"""
+    import tkinter as tk
+
+    interp = tk.Tcl()
+    timeout = tk.IntVar(master=interp, value=30)
+    gui = bare_gui
+    gui.txt2img_vars = gui.img2img_vars = gui.upscale_vars = None
+    gui.api_vars = {"timeout": timeout}
+    gui._last_loaded_config_hash = 123
+
+    gui._attach_summary_traces()
+    timeout.set(90)
+
+    assert gui._last_loaded_config_hash is None
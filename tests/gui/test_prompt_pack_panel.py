@@ -193,6 +193,22 @@ class TestPromptPackPanel(unittest.TestCase):
         selected = panel.get_selected_packs()
         self.assertEqual(selected, ["pack1.txt"])
 
+    def test_populate_keeps_pack_names_and_selection(self):
+        """Repopulating updates the cached names and restores selection by name."""
+        mock_list_manager = MagicMock()
+        mock_list_manager.get_list_names.return_value = []
+
+        with patch("src.gui.prompt_pack_panel.get_prompt_packs", return_value=[]):
+            panel = PromptPackPanel(self.root, list_manager=mock_list_manager)
+
+        panel.populate(["a.txt", "b.txt"])
+        panel.packs_listbox.selection_set(1)
+        panel.populate(["new.txt", "a.txt", "b.txt"])
+
+        self.assertEqual(panel.pack_names, ["new.txt", "a.txt", "b.txt"])
+        self.assertEqual(list(panel.packs_listbox.get(0, tk.END)), panel.pack_names)
+        self.assertEqual(panel.get_selected_packs(), ["b.txt"])
+
 
 if __name__ == "__main__":
     unittest.main()
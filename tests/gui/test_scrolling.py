@@ -0,0 +1,36 @@
+"""Tests for the debounced canvas scrollregion helper."""
+
+from src.gui.scrolling import SCROLLREGION_DELAY_MS, schedule_scrollregion
+
+
+class FakeCanvas:
+    def __init__(self):
+        self.scheduled = []
+        self.bbox_calls = 0
+        self.scrollregion = None
+
+    def after(self, ms, fn):
+        self.scheduled.append((ms, fn))
+
+    def bbox(self, _tag):
+        self.bbox_calls += 1
+        return (0, 0, 100, 400)
+
+    def configure(self, **kwargs):
+        self.scrollregion = kwargs["scrollregion"]
+
+
+def test_burst_of_configure_events_computes_bbox_once():
+    canvas = FakeCanvas()
+
+    for _ in range(50):
+        schedule_scrollregion(canvas)
+
+    assert [ms for ms, _ in canvas.scheduled] == [SCROLLREGION_DELAY_MS]
+    canvas.scheduled.pop()[1]()
+    assert canvas.bbox_calls == 1
+    assert canvas.scrollregion == (0, 0, 100, 400)
+
+    # Once applied, the next change schedules a fresh update
+    schedule_scrollregion(canvas)
+    assert len(canvas.scheduled) == 1
@@ -38,3 +38,32 @@ def test_name_metadata_prefixes_filename_logic_unit():
     expected_prefix = f"{name}_{base}"
     actual = extract_name_prefix(name, base)
     assert actual == expected_prefix, f"Expected {expected_prefix}, got {actual}"
+
+
+def test_validation_executor_runs_off_thread_and_delivers_on_window():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import MagicMock
+
+    editor = AdvancedPromptEditor.__new__(AdvancedPromptEditor)
+    editor.prompts_text = MagicMock(get=MagicMock(return_value="a castle <lora:Bar:3.5>\n"))
+    editor.format_var = MagicMock(get=MagicMock(return_value="txt"))
+    editor.embeddings_cache = set()
+    editor.loras_cache = set()
+    delivered = []
+    done = threading.Event()
+
+    def after(_ms, fn, results):
+        fn(results)
+        done.set()
+
+    editor.window = MagicMock(after=after)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        editor.validation_executor = pool
+        assert editor._run_validation(delivered.append) is None
+        assert done.wait(timeout=5)
+
+    (results,) = delivered
+    assert results["stats"]["lora_count"] == 1
+    assert any("outside recommended range" in w for w in results["warnings"])
+    editor.format_var.get.assert_called_once()
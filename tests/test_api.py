@@ -18,7 +18,7 @@ class TestSDWebUIClient:
         assert client.base_url == "http://localhost:8080"
         assert client.timeout == 60
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_check_api_ready_success(self, mock_request):
         """Test successful API readiness check"""
         mock_response = Mock()
@@ -28,7 +28,7 @@ class TestSDWebUIClient:
         client = SDWebUIClient()
         assert client.check_api_ready(max_retries=1) is True
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_check_api_ready_failure(self, mock_request):
         """Test failed API readiness check"""
         mock_request.side_effect = Exception("Connection error")
@@ -36,7 +36,7 @@ class TestSDWebUIClient:
         client = SDWebUIClient()
         assert client.check_api_ready(max_retries=1, retry_delay=0) is False
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_txt2img_success(self, mock_request):
         """Test successful txt2img request"""
         mock_response = Mock()
@@ -51,7 +51,7 @@ class TestSDWebUIClient:
         assert "images" in result
         assert len(result["images"]) == 1
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_txt2img_failure(self, mock_request):
         """Test failed txt2img request"""
         mock_request.side_effect = Exception("API error")
@@ -61,7 +61,7 @@ class TestSDWebUIClient:
 
         assert result is None
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_img2img_success(self, mock_request):
         """Test successful img2img request"""
         mock_response = Mock()
@@ -75,7 +75,7 @@ class TestSDWebUIClient:
         assert result is not None
         assert "images" in result
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_upscale_success(self, mock_request):
         """Test successful upscale request"""
         mock_response = Mock()
@@ -89,7 +89,7 @@ class TestSDWebUIClient:
         assert result is not None
         assert "image" in result
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_get_models(self, mock_request):
         """Test get models request"""
         mock_response = Mock()
@@ -103,7 +103,7 @@ class TestSDWebUIClient:
         assert len(result) == 1
         assert result[0]["name"] == "model1"
 
-    @patch("src.api.client.requests.request")
+    @patch("src.api.client.requests.Session.request")
     def test_get_samplers(self, mock_request):
         """Test get samplers request"""
         mock_response = Mock()
@@ -34,7 +34,7 @@ def test_retry_backoff_sequence(monkeypatch, client):
     def fake_sleep(duration: float) -> None:
         sleep_calls.append(duration)
 
-    monkeypatch.setattr("src.api.client.requests.request", fake_request)
+    monkeypatch.setattr(client.session, "request", fake_request)
     monkeypatch.setattr(client, "_sleep", fake_sleep)
 
     response = client._perform_request("get", "/retry", timeout=1)
@@ -58,7 +58,7 @@ def test_retry_terminates_after_max_attempts(monkeypatch):
     def fake_sleep(duration: float) -> None:
         sleep_calls.append(duration)
 
-    monkeypatch.setattr("src.api.client.requests.request", fake_request)
+    monkeypatch.setattr(client.session, "request", fake_request)
     monkeypatch.setattr(client, "_sleep", fake_sleep)
 
     response = client._perform_request("post", "/retry", timeout=1)
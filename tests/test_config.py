@@ -46,6 +46,30 @@ class TestConfigManager:
         assert "preset1" in presets
         assert "preset2" in presets
 
+    def test_has_preset(self, tmp_path):
+        """Test preset existence checks track saves and deletes"""
+        config_manager = ConfigManager(presets_dir=str(tmp_path / "presets"))
+
+        assert config_manager.has_preset("preset1") is False
+        config_manager.save_preset("preset1", {"key": "value1"})
+        assert config_manager.has_preset("preset1") is True
+        config_manager.delete_preset("preset1")
+        assert config_manager.has_preset("preset1") is False
+
+    def test_load_preset_reuses_parse_until_file_changes(self, tmp_path):
+        """Test repeated loads hit the cache, return copies, and see external edits"""
+        config_manager = ConfigManager(presets_dir=str(tmp_path / "presets"))
+        config_manager.save_preset("cached", {"txt2img": {"steps": 20}})
+
+        first = config_manager.load_preset("cached")
+        first["txt2img"]["steps"] = 99
+        assert config_manager.load_preset("cached")["txt2img"]["steps"] == 20
+
+        # Rewritten outside the manager (different size, so the stamp changes)
+        preset_path = config_manager.presets_dir / "cached.json"
+        preset_path.write_text('{"txt2img": {"steps": 150}}', encoding="utf-8")
+        assert config_manager.load_preset("cached")["txt2img"]["steps"] == 150
+
     def test_get_default_config(self):
         """Test getting default configuration"""
         config_manager = ConfigManager()
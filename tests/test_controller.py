@@ -167,6 +167,19 @@ class TestPipelineController:
         messages = controller.get_log_messages()
         assert len(messages) == 0
 
+    def test_log_callback_notified(self, controller):
+        """Test the log callback fires once per queued message."""
+        calls = []
+        controller.set_log_callback(lambda: calls.append(controller.log_queue.qsize()))
+
+        controller._log("Test message", "INFO")
+        assert calls == [1]
+
+        controller.set_log_callback(None)
+        controller._log("Another message", "INFO")
+        assert calls == [1]
+        assert len(controller.get_log_messages()) == 2
+
     def test_cancel_token_reset(self, controller):
         """Test cancel token is reset on new run."""
 
@@ -1,6 +1,12 @@
 """Test file I/O utilities"""
 
-from src.utils.file_io import get_safe_filename, read_prompt_pack, read_text_file, write_text_file
+from src.utils.file_io import (
+    get_safe_filename,
+    iter_prompt_pack,
+    read_prompt_pack,
+    read_text_file,
+    write_text_file,
+)
 
 
 class TestFileIO:
@@ -168,3 +174,20 @@ class TestFileIO:
         # Read
         result = read_text_file(file_path)
         assert result == test_content
+
+    def test_iter_prompt_pack_yields_prompts_lazily(self, tmp_path):
+        """Test streaming reads produce prompts one block at a time"""
+        pack_file = tmp_path / "stream.txt"
+        pack_file.write_text("first\nneg: bad\n\n# comment only\n\nsecond\n", encoding="utf-8")
+
+        prompts = iter_prompt_pack(pack_file)
+        assert next(prompts) == {"positive": "first", "negative": "bad"}
+        assert list(prompts) == [{"positive": "second", "negative": ""}]
+
+    def test_read_prompt_pack_is_all_or_nothing_on_decode_error(self, tmp_path):
+        """Test a pack that fails to decode partway through yields no prompts at all"""
+        pack_file = tmp_path / "broken.txt"
+        pack_file.write_bytes(b"first prompt\n\nsecond \xff\xfe prompt\n")
+
+        assert read_prompt_pack(pack_file) == []
+        assert list(iter_prompt_pack(pack_file)) == []
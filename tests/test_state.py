@@ -179,6 +179,30 @@ class TestStateManager:
         manager.transition_to(GUIState.STOPPING)
         assert ("RUNNING", "STOPPING") in transitions
 
+    def test_weak_transition_callback(self):
+        """Test WeakMethod callbacks fire while alive and are dropped once collected."""
+        import gc
+        import weakref
+
+        manager = StateManager()
+        transitions = []
+
+        class Listener:
+            def on_change(self, old, new):
+                transitions.append((old.name, new.name))
+
+        listener = Listener()
+        manager.on_transition(weakref.WeakMethod(listener.on_change))
+
+        manager.transition_to(GUIState.RUNNING)
+        assert transitions == [("IDLE", "RUNNING")]
+
+        del listener
+        gc.collect()
+        manager.transition_to(GUIState.STOPPING)
+        assert transitions == [("IDLE", "RUNNING")]
+        assert manager._transition_callbacks == []
+
     def test_reset(self):
         """Test reset to IDLE."""
         manager = StateManager()
@@ -76,3 +76,34 @@ def test_run_txt2img_stage_applies_scheduler_from_sampler(pipeline, tmp_path):
     payload = pipeline.client.txt2img.call_args[0][0]
     assert payload["sampler_name"] == "DPM++ 2M"
     assert payload["scheduler"] == "Karras"
+
+
+def test_run_txt2img_batch_selects_model_once(pipeline, tmp_path):
+    config = {"model": "sdxl.safetensors", "vae": "sdxl_vae.safetensors", "steps": 12}
+    prompts = ["first prompt", "second prompt", "third prompt"]
+
+    with patch("src.pipeline.executor.save_image_from_base64", return_value=True):
+        results = pipeline.run_txt2img_batch(prompts, config, tmp_path)
+
+    assert [len(r) for r in results] == [1, 1, 1]
+    pipeline.client.set_model.assert_called_once_with("sdxl.safetensors")
+    pipeline.client.set_vae.assert_called_once_with("sdxl_vae.safetensors")
+    sent = [call.args[0] for call in pipeline.client.txt2img.call_args_list]
+    assert [payload["prompt"] for payload in sent] == prompts
+    assert all(payload["steps"] == 12 for payload in sent)
+    assert [r[0]["prompt"] for r in results] == prompts
+
+
+def test_iter_txt2img_batch_sends_one_request_per_next(pipeline, tmp_path):
+    prompts = ["first prompt", "second prompt"]
+
+    with patch("src.pipeline.executor.save_image_from_base64", return_value=True):
+        batch = pipeline.iter_txt2img_batch(prompts, {"steps": 12}, tmp_path)
+        assert not pipeline.client.txt2img.called
+
+        first = next(batch)
+        assert pipeline.client.txt2img.call_count == 1
+        assert first[0]["prompt"] == "first prompt"
+
+        assert next(batch)[0]["prompt"] == "second prompt"
+        assert next(batch, None) is None
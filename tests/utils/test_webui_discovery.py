@@ -0,0 +1,47 @@
+"""Tests for concurrent WebUI port discovery."""
+
+import threading
+from unittest.mock import patch
+
+import src.utils.webui_discovery as wd
+
+# Bound at import time: the autouse conftest fixture replaces the module attribute
+find_webui_api_port = wd.find_webui_api_port
+
+
+def test_find_port_probes_concurrently_and_returns_first_hit():
+    started = threading.Barrier(3, timeout=2)
+
+    def fake_probe(test_url, host, port):
+        # Every probe must be running at once for the barrier to release
+        started.wait()
+        return port == 7862
+
+    with patch.object(wd, "_probe_webui_port", side_effect=fake_probe) as probe:
+        url = find_webui_api_port(start_port=7860, max_attempts=3)
+
+    assert url == "http://127.0.0.1:7862"
+    assert probe.call_count == 3
+    assert {call.args[1] for call in probe.call_args_list} == {"127.0.0.1"}
+
+
+def test_find_port_returns_none_when_nothing_answers():
+    with patch.object(wd, "_probe_webui_port", return_value=False):
+        assert find_webui_api_port(max_attempts=2) is None
+
+
+def test_find_port_prefers_the_lowest_responding_port():
+    higher_answered = threading.Event()
+
+    def fake_probe(test_url, host, port):
+        if port == 7860:
+            # Answer only after the higher port already has
+            higher_answered.wait(timeout=2)
+            return True
+        higher_answered.set()
+        return True
+
+    with patch.object(wd, "_probe_webui_port", side_effect=fake_probe):
+        url = find_webui_api_port(start_port=7860, max_attempts=2)
+
+    assert url == "http://127.0.0.1:7860"